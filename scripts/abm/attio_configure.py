@@ -14,7 +14,6 @@ import argparse
 import json
 import os
 import sys
-import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -64,7 +63,6 @@ def get_all_attio_companies():
         if len(records) < page_size:
             break
         offset += page_size
-        time.sleep(0.3)
     return all_records
 
 
@@ -284,8 +282,6 @@ def run(limit=500, dry_run=False):
         if add_to_target_list(record_id, dry_run=dry_run):
             abm_listed += 1
 
-        time.sleep(0.3)
-
     print(f"\n  Tagged {abm_tagged} qualified companies, added {abm_listed} to Target Account List\n")
 
     # Step 4: Tag non-ABM companies as Lead Alchemy
@@ -301,7 +297,6 @@ def run(limit=500, dry_run=False):
         else:
             print(f"    [DRY RUN] {name} ({domain}) -> Lead Alchemy")
         la_tagged += 1
-        time.sleep(0.2)
 
     print(f"  Tagged {la_tagged} companies as Lead Alchemy\n")
 
@@ -334,8 +329,6 @@ def run(limit=500, dry_run=False):
             if add_person_to_target_list(person_id, dry_run=dry_run):
                 people_listed += 1
 
-            time.sleep(0.2)
-
     print(f"  Tagged {people_tagged} people, added {people_listed} to Target Account List (people)\n")
 
     # Summary
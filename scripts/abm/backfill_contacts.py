@@ -16,7 +16,6 @@ Usage:
 import argparse
 import os
 import sys
-import time
 
 import requests
 
@@ -223,7 +222,6 @@ def run(limit=10, dry_run=False, enrich_all=False, skip_title_check=False):
 
         if not result or 'person' not in result:
             print(f"    [!] No match from Apollo")
-            time.sleep(0.5)
             continue
 
         person = result['person']
@@ -262,8 +260,6 @@ def run(limit=10, dry_run=False, enrich_all=False, skip_title_check=False):
                 print(f"    + Account: {ind} | {emp} employees | {funding} funding")
                 accounts_enriched.add(account_id)
 
-        time.sleep(0.5)
-
     # Summary
     print(f"\n{'=' * 60}")
     print(f"  SUMMARY {'(DRY RUN)' if dry_run else ''}")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+bench_title_filter.py — Linear-scan vs compiled title classification benchmark.
+
+Generates synthetic job titles (real-world shapes plus random keyword mixes,
+with the heavy repetition of a real contacts table) and classifies them with:
+
+  linear    the pre-compiled is_relevant_title: lower/split, then one
+            substring scan per BLOCKLIST / ALLOWLIST / SENIOR_PREFIXES entry
+  compiled  title_filter's single-pass regex, memo cache cleared first
+  batch     title_filter.classify_titles over the whole column
+
+All three must agree on every title. No network or Supabase access.
+
+Usage:
+    python3 scripts/abm/bench_title_filter.py
+    python3 scripts/abm/bench_title_filter.py --titles 200000 --distinct 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SCRIPT_DIR)
+
+import title_filter
+from title_filter import ALLOWLIST, BLOCKLIST, BLOCKLIST_EXACT, SENIOR_PREFIXES
+
+COMMON_TITLES = [
+    'VP of Sales', 'Head of Growth', 'Account Executive', 'Senior Account Executive',
+    'SDR', 'BDR Manager', 'Chief Revenue Officer', 'CMO', 'CEO', 'Co-Founder & CEO',
+    'CTO', 'Software Engineer', 'Senior Software Engineer', 'HR Manager',
+    'Talent Acquisition Lead', 'Director', 'Director of Marketing', 'Product Manager',
+    'Customer Success Manager', 'RevOps Lead', 'General Manager, EMEA',
+    'Head of Partnerships', 'Recruiter', 'Data Scientist', 'Office Manager',
+    'Founder', 'Managing Director', 'VP, Demand Generation', 'Controller', '',
+]
+FILLER = ['senior', 'lead', 'of', 'and', '&', 'global', 'emea', 'north america',
+          'team', 'principal', 'associate', 'intern', 'specialist', '-', ',']
+
+
+def legacy_is_relevant_title(title):
+    """The pre-compiled implementation, kept verbatim for parity checks."""
+    if not title:
+        return False
+    title_lower = title.lower().strip()
+
+    title_words = set(title_lower.replace(',', ' ').replace('-', ' ').split())
+    for exact in BLOCKLIST_EXACT:
+        if exact in title_words:
+            return False
+
+    for blocked in BLOCKLIST:
+        if blocked in title_lower:
+            return False
+
+    for allowed in ALLOWLIST:
+        if allowed in title_lower:
+            return True
+
+    for prefix in SENIOR_PREFIXES:
+        if title_lower.startswith(prefix):
+            return True
+
+    return False
+
+
+def synth_titles(n, distinct, seed=42):
+    """n titles drawn (Zipf-ish) from `distinct` generated title strings."""
+    rng = random.Random(seed)
+    vocab = ALLOWLIST + BLOCKLIST + SENIOR_PREFIXES + BLOCKLIST_EXACT + FILLER
+    pool = list(COMMON_TITLES)
+    while len(pool) < distinct:
+        words = [rng.choice(vocab).strip() for _ in range(rng.randint(1, 5))]
+        title = ' '.join(words)
+        if rng.random() < 0.5:
+            title = title.title()
+        if rng.random() < 0.05:
+            title = f'  {title}\t'
+        pool.append(title)
+    weights = [1 / (rank + 1) for rank in range(len(pool))]
+    return rng.choices(pool, weights=weights, k=n)
+
+
+def _timed(fn, titles):
+    start = time.perf_counter()
+    result = fn(titles)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark linear vs compiled title classification")
+    parser.add_argument("--titles", type=int, default=1_000_000, help="Titles to classify (default: 1000000)")
+    parser.add_argument("--distinct", type=int, default=50_000, help="Distinct titles in the pool (default: 50000)")
+    args = parser.parse_args()
+
+    print(f"Generating {args.titles:,} synthetic titles ({args.distinct:,} distinct)...")
+    titles = synth_titles(args.titles, args.distinct)
+
+    linear, linear_s = _timed(lambda ts: [legacy_is_relevant_title(t) for t in ts], titles)
+
+    title_filter.classify_title.cache_clear()
+    uncached = title_filter.classify_title.__wrapped__
+    compiled, compiled_s = _timed(lambda ts: [uncached(t)[0] for t in ts], titles)
+
+    title_filter.classify_title.cache_clear()
+    batch, batch_s = _timed(lambda ts: [r for r, _ in title_filter.classify_titles(ts)], titles)
+
+    print(f"  linear:   {linear_s:8.2f}s  ({args.titles / linear_s:,.0f} titles/s)")
+    print(f"  compiled: {compiled_s:8.2f}s  ({args.titles / compiled_s:,.0f} titles/s)  {linear_s / compiled_s:.1f}x")
+    print(f"  batch:    {batch_s:8.2f}s  ({args.titles / batch_s:,.0f} titles/s)  {linear_s / batch_s:.1f}x")
+
+    mismatches = [t for t, a, b, c in zip(titles, linear, compiled, batch) if not a == b == c]
+    if mismatches:
+        print(f"MISMATCH on {len(mismatches):,} titles, e.g. {mismatches[:5]!r}", file=sys.stderr)
+        return 1
+    print(f"  parity:   {sum(linear):,} relevant / {args.titles:,} titles in all three")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,9 +6,15 @@ Connects to each Maildoso IMAP inbox that has active sends,
 matches replies to original sends via In-Reply-To / References headers,
 updates email_sends and account statuses.
 
+Inboxes are scanned concurrently. Only the From / In-Reply-To / References
+headers are fetched (in batched UID ranges); a body is downloaded only for
+messages that reference one of our sends. The last-seen UID per inbox is
+saved, so later runs only look at new mail.
+
 Usage:
   python3 scripts/abm/check_replies.py --dry-run
   python3 scripts/abm/check_replies.py
+  python3 scripts/abm/check_replies.py --full-rescan   # ignore saved UIDs
 """
 
 import argparse
@@ -19,6 +25,7 @@ import os
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -28,6 +35,13 @@ load_env()
 
 from db_supabase import get_supabase
 
+LOOKBACK_DAYS = 7  # first scan of an inbox (or after UIDVALIDITY changes)
+SCAN_WORKERS = 8  # inboxes scanned at once
+FETCH_BATCH = 200  # UIDs per header FETCH
+HEADER_FIELDS = 'FROM IN-REPLY-TO REFERENCES'
+
+UID_STATE_PATH = os.path.join(SCRIPT_DIR, '.check_replies_state.json')
+
 OPT_OUT_PATTERNS = re.compile(
     r'\b(unsubscribe|stop\s+emailing|remove\s+me|opt\s*out|no\s+thanks|not\s+interested|do\s+not\s+contact)\b',
     re.IGNORECASE
@@ -63,13 +77,54 @@ def load_maildoso_accounts():
 
 
 def get_imap_for_account(config, account_email):
-    """Connect to IMAP for a specific account and select inbox."""
+    """Connect to IMAP for a specific account and select inbox (read-only)."""
     imap = imaplib.IMAP4_SSL(config['imap_host'])
     imap.login(account_email, config['password'])
-    imap.select('INBOX')
+    imap.select('INBOX', readonly=True)
     return imap
 
 
+def load_uid_state():
+    """Return {account_email: {'uidvalidity': str, 'last_uid': int}}."""
+    try:
+        with open(UID_STATE_PATH) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_uid_state(state):
+    """Write the per-inbox UID state atomically (tmp file + rename)."""
+    tmp = UID_STATE_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp, UID_STATE_PATH)
+
+
+def _fetch_parts(data, uids=()):
+    """Yield (uid, payload bytes) from an IMAP UID FETCH response.
+
+    The UID item can come before the literal (in its prefix) or after it
+    (in the trailing b' UID n)' element). If a server sends neither and
+    returned one message per requested UID, `uids` fills them in by order.
+    """
+    parts = []
+    for i, item in enumerate(data):
+        if not isinstance(item, tuple):
+            continue  # b')' separators
+        match = re.search(rb'UID (\d+)', item[0])
+        if not match and i + 1 < len(data) and isinstance(data[i + 1], bytes):
+            match = re.search(rb'UID (\d+)', data[i + 1])
+        parts.append((int(match.group(1)) if match else None, item[1]))
+    if any(uid is None for uid, _ in parts):
+        if len(parts) != len(uids):
+            parts = [(uid, payload) for uid, payload in parts if uid is not None]
+        else:
+            parts = [(uid if uid is not None else want, payload)
+                     for (uid, payload), want in zip(parts, sorted(uids))]
+    yield from parts
+
+
 def get_body_text(msg):
     """Extract plain text body from email message."""
     if msg.is_multipart():
@@ -105,81 +160,94 @@ def extract_references(msg):
     return refs
 
 
-def scan_inbox(config, account_email, msg_id_lookup, sb, dry_run):
-    """Scan a single IMAP inbox for replies. Returns (new_replies, opt_outs)."""
-    new_replies = 0
-    opt_outs = 0
+def scan_inbox(config, account_email, msg_id_lookup, inbox_state=None):
+    """Scan a single IMAP inbox for replies to our sends.
+
+    Runs on a worker thread and touches neither Supabase nor stdout:
+    progress lines are returned for the caller to print.
+
+    Args:
+        msg_id_lookup: message_id -> send record (read-only here)
+        inbox_state: {'uidvalidity', 'last_uid'} from the previous run, or None
+
+    Returns:
+        dict with 'matches' [(send, from_addr, is_opt_out)], 'state'
+        (new inbox_state, None if the scan failed) and 'lines'
+    """
+    result = {'matches': [], 'state': None, 'lines': []}
+    lines = result['lines']
 
     try:
         imap = get_imap_for_account(config, account_email)
     except Exception as e:
-        print(f"    [!] IMAP login failed for {account_email}: {e}")
-        return 0, 0
+        lines.append(f"    [!] IMAP login failed for {account_email}: {e}")
+        return result
 
     try:
-        # Search for recent messages (last 7 days)
-        date_str = time.strftime('%d-%b-%Y', time.gmtime(time.time() - 7 * 86400))
-        status, message_nums = imap.search(None, f'(SINCE {date_str})')
-
-        if status != 'OK' or not message_nums[0]:
-            print(f"    No recent messages")
-            return 0, 0
-
-        msg_ids = message_nums[0].split()
-        print(f"    {len(msg_ids)} messages in last 7 days")
-
-        for num in msg_ids:
-            status, data = imap.fetch(num, '(RFC822)')
+        uidvalidity = (imap.response('UIDVALIDITY')[1] or [b''])[0]
+        uidvalidity = uidvalidity.decode() if isinstance(uidvalidity, bytes) else str(uidvalidity or '')
+        last_uid = 0
+        if inbox_state and inbox_state.get('uidvalidity') == uidvalidity:
+            last_uid = int(inbox_state.get('last_uid') or 0)
+
+        if last_uid:
+            status, data = imap.uid('SEARCH', None, f'UID {last_uid + 1}:*')
+        else:
+            date_str = time.strftime('%d-%b-%Y', time.gmtime(time.time() - LOOKBACK_DAYS * 86400))
+            status, data = imap.uid('SEARCH', None, f'(SINCE {date_str})')
+        if status != 'OK':
+            lines.append(f"    [!] IMAP search failed: {status}")
+            return result
+
+        # "N:*" always returns the newest message, even when its UID < N
+        uids = sorted(u for u in (int(x) for x in (data[0] or b'').split()) if u > last_uid)
+        result['state'] = {'uidvalidity': uidvalidity, 'last_uid': max(uids, default=last_uid)}
+
+        if not uids:
+            lines.append("    No new messages")
+            return result
+        scope = f"since UID {last_uid}" if last_uid else f"in last {LOOKBACK_DAYS} days"
+        lines.append(f"    {len(uids)} messages {scope}")
+
+        # Headers only, in UID batches; remember which messages reply to us
+        matched = []
+        seen_sends = set()
+        fetched = set()
+        for i in range(0, len(uids), FETCH_BATCH):
+            batch_uids = uids[i:i + FETCH_BATCH]
+            batch = ','.join(str(u) for u in batch_uids)
+            status, data = imap.uid('FETCH', batch, f'(UID BODY.PEEK[HEADER.FIELDS ({HEADER_FIELDS})])')
             if status != 'OK':
-                continue
-
-            raw_email = data[0][1]
-            msg = email.message_from_bytes(raw_email)
-
-            # Check if this is a reply to one of our sends
-            references = extract_references(msg)
-            matched_send = None
-
-            for ref in references:
-                if ref in msg_id_lookup:
-                    matched_send = msg_id_lookup[ref]
-                    break
-
-            if not matched_send:
-                continue
-
-            from_addr = email.utils.parseaddr(msg.get('From', ''))[1]
-            body = get_body_text(msg)
-
-            print(f"    Reply from: {from_addr} (re: send #{matched_send['id']})")
-
-            is_opt_out = bool(OPT_OUT_PATTERNS.search(body))
-
-            if is_opt_out:
-                new_status = 'opted_out'
-                acct_status = 'opted_out'
-                print(f"      -> Opt-out detected")
-                opt_outs += 1
-            else:
-                new_status = 'replied'
-                acct_status = 'replied'
-                new_replies += 1
-
-            if dry_run:
-                print(f"      [DRY RUN] Would update send #{matched_send['id']} -> {new_status}")
-                continue
-
-            sb.table('email_sends').update({
-                'status': new_status,
-                'replied_at': time.strftime('%Y-%m-%dT%H:%M:%SZ'),
-            }).eq('id', matched_send['id']).execute()
-
-            sb.table('accounts').update({
-                'outreach_status': acct_status,
-            }).eq('id', matched_send['account_id']).execute()
-
-            del msg_id_lookup[matched_send['message_id']]
-
+                lines.append(f"    [!] Header fetch failed for UIDs {batch[:40]}...")
+                result['state'] = None  # don't skip past messages we never saw
+                return result
+            for uid, header_bytes in _fetch_parts(data, batch_uids):
+                fetched.add(uid)
+                headers = email.message_from_bytes(header_bytes)
+                send = next((msg_id_lookup[ref] for ref in extract_references(headers)
+                             if ref in msg_id_lookup), None)
+                if send and send['id'] not in seen_sends:  # first reply per send counts
+                    seen_sends.add(send['id'])
+                    matched.append((uid, send, email.utils.parseaddr(headers.get('From', ''))[1]))
+
+        # Only advance past UIDs whose headers we actually read
+        missing = [u for u in uids if u not in fetched]
+        if missing:
+            lines.append(f"    [!] No headers returned for {len(missing)} UIDs (from {missing[0]})")
+            result['state']['last_uid'] = max(last_uid, missing[0] - 1)
+
+        # Full message only for actual replies (PEEK: leave \Seen alone)
+        for uid, send, from_addr in matched:
+            status, data = imap.uid('FETCH', str(uid), '(UID BODY.PEEK[])')
+            body = ''
+            if status == 'OK':
+                for _, raw_email in _fetch_parts(data, [uid]):
+                    body = get_body_text(email.message_from_bytes(raw_email))
+            result['matches'].append((send, from_addr, bool(OPT_OUT_PATTERNS.search(body))))
+
+    except imaplib.IMAP4.error as e:
+        lines.append(f"    [!] IMAP error for {account_email}: {e}")
+        result['state'] = None
     finally:
         try:
             imap.close()
@@ -187,11 +255,15 @@ def scan_inbox(config, account_email, msg_id_lookup, sb, dry_run):
         except Exception:
             pass
 
-    return new_replies, opt_outs
+    return result
 
 
-def run(dry_run=False):
-    """Check for replies across all sending accounts."""
+def run(dry_run=False, full_rescan=False):
+    """Check for replies across all sending accounts.
+
+    Dry runs don't advance the saved per-inbox UIDs. full_rescan ignores
+    them and looks back LOOKBACK_DAYS in every inbox.
+    """
     print(f"\n[Reply Check] {'DRY RUN - ' if dry_run else ''}Scanning inboxes\n")
 
     sb = get_supabase()
@@ -235,21 +307,84 @@ def run(dry_run=False):
 
     print(f"  Scanning {len(inboxes_to_scan)} inbox(es)\n")
 
-    total_replies = 0
-    total_opt_outs = 0
-
-    for account_email in sorted(inboxes_to_scan):
-        print(f"  [{account_email}]")
-        replies, opt_outs = scan_inbox(config, account_email, msg_id_lookup, sb, dry_run)
-        total_replies += replies
-        total_opt_outs += opt_outs
+    uid_state = {} if full_rescan else load_uid_state()
+    new_state = dict(uid_state)
+
+    # Scan inboxes concurrently; gather matches, then write once
+    updates = {}  # send id -> (send, new_status)
+    workers = max(1, min(SCAN_WORKERS, len(inboxes_to_scan)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(scan_inbox, config, account_email, msg_id_lookup,
+                            uid_state.get(account_email)): account_email
+            for account_email in sorted(inboxes_to_scan)
+        }
+        for future in as_completed(futures):
+            account_email = futures[future]
+            result = future.result()
+            print(f"  [{account_email}]")
+            for line in result['lines']:
+                print(line)
+            if result['state']:
+                new_state[account_email] = result['state']
+
+            for send, from_addr, is_opt_out in result['matches']:
+                if send['id'] in updates:
+                    continue  # several replies in one thread
+                print(f"    Reply from: {from_addr} (re: send #{send['id']})")
+                if is_opt_out:
+                    print(f"      -> Opt-out detected")
+                new_status = 'opted_out' if is_opt_out else 'replied'
+                updates[send['id']] = (send, new_status)
+                if dry_run:
+                    print(f"      [DRY RUN] Would update send #{send['id']} -> {new_status}")
+
+    total_opt_outs = sum(1 for _, status in updates.values() if status == 'opted_out')
+    total_replies = len(updates) - total_opt_outs
+
+    if not dry_run:
+        apply_reply_updates(sb, updates.values())
+        save_uid_state(new_state)
 
     print(f"\n  Done. {total_replies} new replies, {total_opt_outs} opt-outs detected.")
     return total_replies + total_opt_outs
 
 
+def apply_reply_updates(sb, updates):
+    """Write reply statuses with one update per status per table.
+
+    Args:
+        updates: iterable of (send record, 'replied' | 'opted_out')
+    """
+    replied_at = time.strftime('%Y-%m-%dT%H:%M:%SZ')
+    sends_by_status = {}
+    account_status = {}
+    for send, status in updates:
+        sends_by_status.setdefault(status, []).append(send['id'])
+        # An opt-out anywhere on the account wins over a reply
+        if account_status.get(send['account_id']) != 'opted_out':
+            account_status[send['account_id']] = status
+
+    for status, send_ids in sends_by_status.items():
+        sb.table('email_sends').update({
+            'status': status,
+            'replied_at': replied_at,
+        }).in_('id', send_ids).execute()
+
+    accounts_by_status = {}
+    for account_id, status in account_status.items():
+        if account_id is not None:
+            accounts_by_status.setdefault(status, []).append(account_id)
+    for status, account_ids in accounts_by_status.items():
+        sb.table('accounts').update({
+            'outreach_status': status,
+        }).in_('id', account_ids).execute()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Check for replies to outreach emails')
     parser.add_argument('--dry-run', action='store_true', help='Preview without updating')
+    parser.add_argument('--full-rescan', action='store_true',
+                        help=f'Ignore saved UIDs and rescan the last {LOOKBACK_DAYS} days')
     args = parser.parse_args()
-    run(dry_run=args.dry_run)
+    run(dry_run=args.dry_run, full_rescan=args.full_rescan)
@@ -14,7 +14,6 @@ Usage:
 import argparse
 import os
 import sys
-import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -79,7 +78,6 @@ def get_all_attio_people():
         if len(records) < page_size:
             break
         offset += page_size
-        time.sleep(0.3)
     return all_records
 
 
@@ -153,7 +151,6 @@ def run(dry_run=False, report_only=False):
                 print(f"    Deleted.")
             else:
                 print(f"    [!] Failed to delete")
-            time.sleep(0.3)
 
     # Step 4: Clean orphaned people
     print(f"\n[4/4] Checking for orphaned people records...")
@@ -187,7 +184,6 @@ def run(dry_run=False, report_only=False):
                 if delete_attio_record('people', person_id):
                     orphaned += 1
                     print(f"    Removed orphan: {person_name} ({email})")
-                time.sleep(0.3)
 
     # Summary
     print(f"\n{'='*60}")
@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
-"""Shared configuration, env loading, API clients, and retry logic for ABM pipeline."""
+"""Shared configuration, env loading, API clients, and retry logic for ABM pipeline.
+
+All HTTP goes through api_request: one keep-alive session, a per-host token
+bucket that follows the provider's rate-limit headers, jittered retries and
+per-host request/latency metrics (print_http_metrics).
+"""
 
 import os
+import random
+import threading
 import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from log import log
 
@@ -74,13 +85,18 @@ def get_apollo_headers():
     }
 
 
-def get_grok_headers():
-    """Return xAI/Grok API auth headers."""
+def get_grok_key():
+    """Return the xAI/Grok API key."""
     key = os.environ.get('XAI_API_KEY', '')
     if not key:
         raise ValueError("XAI_API_KEY not set. Export it or add to scripts/abm/.env")
+    return key
+
+
+def get_grok_headers():
+    """Return xAI/Grok API auth headers."""
     return {
-        'Authorization': f'Bearer {key}',
+        'Authorization': f'Bearer {get_grok_key()}',
         'Content-Type': 'application/json',
     }
 
@@ -113,50 +129,337 @@ def get_prospeo_headers():
     }
 
 
+# ---------------------------------------------------------------------------
+# Pooled session + rate limiting
+# ---------------------------------------------------------------------------
+
+# Keep-alive connections per host; sized for the sync_attio worker pool
+POOL_MAXSIZE = 16
+
+# Attio's published workspace limits: 100 reads/s, 25 writes/s
+ATTIO_READ_RATE = 100
+ATTIO_WRITE_RATE = 25
+
+EXA_HOST = 'api.exa.ai'
+
+# Per-host (requests/s, burst). Starting points from each provider's docs;
+# the buckets then follow RateLimit/Retry-After headers and back off on 429.
+HOST_LIMITS = {
+    'api.attio.com': (ATTIO_WRITE_RATE, ATTIO_WRITE_RATE),
+    'api.apollo.io': (200 / 60, 10),        # 200/min on current plan
+    'api.prospeo.io': (5, 5),
+    EXA_HOST: (5, 5),                       # 5 QPS on /search
+    'api.firecrawl.dev': (100 / 60, 5),     # 100 scrapes/min
+    'api.x.ai': (8, 8),
+    'us.posthog.com': (240 / 60, 10),       # 240/min on query endpoints
+    'api.lemlist.com': (10, 20),            # 20 requests per 2s
+    'www.googleapis.com': (1, 2),
+    'boards-api.greenhouse.io': (2, 4),
+    'api.lever.co': (2, 4),
+}
+DEFAULT_HOST_LIMIT = (5, 5)  # company websites etc. — be polite per host
+
+# Statuses worth retrying; 5xx only for idempotent methods
+RETRY_STATUSES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+MAX_BACKOFF = 30
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills `rate` tokens/s up to `capacity`.
+
+    The rate halves on throttling and creeps back to its ceiling on
+    success; pause() holds every caller until a server-given reset time.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Hold all callers for `seconds` and drain the bucket."""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0
+            self._updated = max(now, self._paused_until)
+
+    def throttled(self):
+        """Halve the rate after a 429 (floor: 1/16 of the ceiling)."""
+        with self._lock:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    def succeeded(self, remaining=None):
+        """Recover the rate additively; cap tokens at the server's remaining count."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+
+
+class _HostStats:
+    """Request counters and a rolling latency window for one host."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.latencies = deque(maxlen=1000)
+        self._lock = threading.Lock()
+
+    def record(self, latency=None, error=False, retry=False, throttled=False):
+        """Count one attempt."""
+        with self._lock:
+            self.requests += 1
+            self.errors += error
+            self.retries += retry
+            self.throttled += throttled
+            if latency is not None:
+                self.latencies.append(latency)
+
+    def snapshot(self):
+        """Consistent copy of the counters and sorted latencies."""
+        with self._lock:
+            return (self.requests, self.errors, self.retries, self.throttled,
+                    sorted(self.latencies))
+
+
+_buckets = {}
+_stats = {}
+_registry_lock = threading.Lock()
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the shared keep-alive requests.Session (created on first use)."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=len(HOST_LIMITS) + 4, pool_maxsize=POOL_MAXSIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+    return _session
+
+
+def _bucket_key(method, url):
+    """Bucket name for a request: its host, with Attio split into reads/writes."""
+    host = urlsplit(url).hostname or url
+    if host == 'api.attio.com':
+        # Attio counts GETs and record queries as reads, everything else as writes
+        if method.upper() == 'GET' or url.endswith('/query'):
+            return 'api.attio.com:read'
+        return 'api.attio.com:write'
+    return host
+
+
+def _get_bucket(key):
+    """Return (creating on first use) the token bucket for a bucket key."""
+    with _registry_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            if key == 'api.attio.com:read':
+                rate, burst = ATTIO_READ_RATE, ATTIO_READ_RATE
+            else:
+                rate, burst = HOST_LIMITS.get(key.split(':')[0], DEFAULT_HOST_LIMIT)
+            bucket = _buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+
+def _get_stats(host):
+    """Return (creating on first use) the metrics for a host."""
+    with _registry_lock:
+        stats = _stats.get(host)
+        if stats is None:
+            stats = _stats[host] = _HostStats()
+        return stats
+
+
+def throttle(host):
+    """Wait for a token on `host`'s bucket.
+
+    For calls that go through a vendor SDK (e.g. Exa) rather than
+    api_request, so they still share the per-host limit.
+    """
+    _get_bucket(host).acquire()
+
+
+def _header_seconds(value):
+    """Parse a delay header: delta-seconds, epoch seconds/ms, or an HTTP date."""
+    if not value:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    if number > 1e12:  # epoch milliseconds
+        number /= 1000
+    if number > 1e9:  # epoch timestamp, not a delta
+        return max(0.0, number - time.time())
+    return max(0.0, number)
+
+
+def _rate_limit_headers(resp):
+    """Extract (remaining, reset_seconds, retry_after_seconds) from a response."""
+    headers = resp.headers
+    remaining = headers.get('X-RateLimit-Remaining') or headers.get('RateLimit-Remaining')
+    try:
+        remaining = int(float(remaining)) if remaining is not None else None
+    except ValueError:
+        remaining = None
+    reset = _header_seconds(headers.get('X-RateLimit-Reset') or headers.get('RateLimit-Reset'))
+    retry_after = _header_seconds(headers.get('Retry-After'))
+    return remaining, reset, retry_after
+
+
+def _backoff(attempt, backoff_base):
+    """Exponential backoff with jitter: half fixed, half random."""
+    ceiling = min(backoff_base ** (attempt + 1), MAX_BACKOFF)
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def http_metrics():
+    """Per-host request counters and latency percentiles (ms)."""
+    metrics = {}
+    with _registry_lock:
+        items = list(_stats.items())
+    for host, stats in items:
+        count, errors, retries, throttled, latencies = stats.snapshot()
+        n = len(latencies)
+        metrics[host] = {
+            'requests': count,
+            'errors': errors,
+            'retries': retries,
+            'throttled': throttled,
+            'p50_ms': round(latencies[n // 2] * 1000) if n else None,
+            'p95_ms': round(latencies[min(n - 1, int(n * 0.95))] * 1000) if n else None,
+        }
+    return metrics
+
+
+def print_http_metrics():
+    """Print a per-host HTTP summary (nothing if no requests were made)."""
+    metrics = http_metrics()
+    if not metrics:
+        return
+    print(f"\n  HTTP {'host':28s} {'reqs':>6s} {'retry':>6s} {'429':>5s} {'err':>5s} {'p50':>7s} {'p95':>7s}")
+    for host, m in sorted(metrics.items(), key=lambda kv: -kv[1]['requests']):
+        p50 = f"{m['p50_ms']}ms" if m['p50_ms'] is not None else '-'
+        p95 = f"{m['p95_ms']}ms" if m['p95_ms'] is not None else '-'
+        print(f"       {host[:28]:28s} {m['requests']:6d} {m['retries']:6d} {m['throttled']:5d} "
+              f"{m['errors']:5d} {p50:>7s} {p95:>7s}")
+
+
 # ---------------------------------------------------------------------------
 # Retry-aware HTTP wrapper
 # ---------------------------------------------------------------------------
 
 
 def api_request(method, url, max_retries=3, backoff_base=2, **kwargs):
-    """HTTP request with exponential backoff on 429 and transient errors.
+    """HTTP request with rate limiting, jittered backoff and metrics.
+
+    Requests go through the shared pooled session and wait on the host's
+    token bucket. 429s honour Retry-After / RateLimit-Reset and slow the
+    bucket down for every caller; 502/503/504 are retried for idempotent
+    methods; connection errors are retried for all.
 
     Args:
         method: HTTP method string ('GET', 'POST', 'PUT', 'PATCH', 'DELETE')
         url: Full URL
         max_retries: Number of attempts (default 3)
         backoff_base: Base for exponential backoff (default 2)
-        **kwargs: Passed through to requests.request (json, headers, timeout, etc.)
+        **kwargs: Passed through to Session.request (json, headers, timeout, etc.)
 
     Returns:
-        requests.Response object
+        requests.Response object (the last one, if retries ran out on a 429/5xx)
 
     Raises:
         requests.exceptions.RequestException on final failure
     """
     kwargs.setdefault('timeout', 30)
+    session = get_session()
+    key = _bucket_key(method, url)
+    bucket = _get_bucket(key)
+    stats = _get_stats(key.split(':')[0])
+    retryable = RETRY_STATUSES if method.upper() in IDEMPOTENT_METHODS else {429}
     last_exc = None
 
     for attempt in range(max_retries):
+        last = attempt == max_retries - 1
+        retry = attempt > 0
+        bucket.acquire()
+        started = time.perf_counter()
         try:
-            resp = requests.request(method, url, **kwargs)
-
-            if resp.status_code == 429:
-                wait = min(backoff_base ** (attempt + 1), 30)
-                log.warn(f"Rate limited. Waiting {wait}s...")
-                time.sleep(wait)
-                continue
-
-            return resp
-
+            resp = session.request(method, url, **kwargs)
         except requests.exceptions.RequestException as e:
+            stats.record(error=True, retry=retry)
             last_exc = e
             log.warn(f"Request failed (attempt {attempt + 1}): {e}")
             if hasattr(e, 'response') and e.response is not None:
                 log.error(f"Response: {e.response.text[:300]}")
-            time.sleep(backoff_base ** attempt)
+            if not last:
+                time.sleep(_backoff(attempt, backoff_base))
+            continue
+
+        latency = time.perf_counter() - started
+        remaining, reset, retry_after = _rate_limit_headers(resp)
+        stats.record(latency, error=resp.status_code >= 500, retry=retry,
+                     throttled=resp.status_code == 429)
+
+        if resp.status_code == 429:
+            bucket.throttled()
+            wait = retry_after if retry_after is not None else reset
+            if wait is None:
+                wait = _backoff(attempt, backoff_base)
+            wait = min(wait, MAX_BACKOFF * 4)
+            bucket.pause(wait)
+            if last:
+                return resp
+            log.warn(f"Rate limited by {key}. Waiting {wait:.1f}s...")
+            continue
+
+        if resp.status_code >= 500:
+            if resp.status_code in retryable and not last:
+                wait = retry_after if retry_after is not None else _backoff(attempt, backoff_base)
+                log.warn(f"{key} returned {resp.status_code}. Retrying in {wait:.1f}s...")
+                time.sleep(wait)
+                continue
+            return resp
+
+        bucket.succeeded(remaining)
+        if remaining == 0 and reset:
+            wait = min(reset, MAX_BACKOFF * 4)
+            bucket.pause(wait)
+            log.warn(f"Rate limit for {key} exhausted. Pausing {wait:.1f}s...")
+        return resp
 
-    # All retries exhausted — raise last exception or return last 429 response
-    if last_exc:
-        raise last_exc
-    return resp
+    # All retries exhausted on connection errors
+    raise last_exc
@@ -65,7 +65,6 @@ def get_attio_domains():
         offset = data.get('next_cursor')
         if not offset or not batch:
             break
-        time.sleep(0.3)
 
     return domains
 
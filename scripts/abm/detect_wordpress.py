@@ -10,24 +10,40 @@ Signals:
   - <meta name="generator" content="WordPress"> (weight: 40)
   - /wp-login.php exists (weight: 30)
 
+Large lists are streamed: domains flow through a bounded queue to a
+fixed pool of workers, and each result is written to a SQLite store
+(scripts/abm/.wp_scans.db, one row per domain per fetch date) as it
+lands. Domains scanned within the freshness window are served from the
+store, so an interrupted scan resumes where it stopped and re-runs
+don't re-fetch. Memory stays flat regardless of list size.
+
 Usage:
   # As module
-  from detect_wordpress import scan_batch
+  from detect_wordpress import scan_batch, scan_stream, ScanStore
   results = asyncio.run(scan_batch(["example.com", "other.com"]))
 
   # Standalone
   python3 scripts/abm/detect_wordpress.py domain1.com domain2.com
   python3 scripts/abm/detect_wordpress.py --file domains.txt
+  python3 scripts/abm/detect_wordpress.py --file 100k.txt --concurrency 50 --fresh-days 14
+  python3 scripts/abm/detect_wordpress.py --file domains.txt --no-store
 """
 
 import asyncio
 import argparse
 import json
+import os
+import sqlite3
+import statistics
 import sys
 import time
+from array import array
+from itertools import islice
 
 import aiohttp
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 }
@@ -37,6 +53,28 @@ DELAY = 0.5
 TIMEOUT = 15
 CONFIDENCE_THRESHOLD = 40
 
+# Result store: reuse a scan for FRESH_DAYS, but retry failures after a day
+STORE_PATH = os.path.join(SCRIPT_DIR, '.wp_scans.db')
+FRESH_DAYS = 30
+ERROR_FRESH_DAYS = 1
+LOOKUP_CHUNK = 500   # domains per freshness lookup
+WRITE_BATCH = 100    # results per store commit
+
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    domain TEXT NOT NULL,
+    fetched_on TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    is_wordpress INTEGER NOT NULL,
+    confidence INTEGER NOT NULL,
+    signals TEXT NOT NULL,
+    error TEXT,
+    latency REAL,
+    PRIMARY KEY (domain, fetched_on)
+);
+CREATE INDEX IF NOT EXISTS scans_domain_fetched_at ON scans (domain, fetched_at);
+"""
+
 
 async def _fetch(session, url):
     """Fetch URL, return (status_code, text) or (None, None) on failure."""
@@ -69,7 +107,7 @@ async def detect_wordpress(session, domain, semaphore):
     """Check a single domain for WordPress signals.
 
     Returns dict with:
-      domain, is_wordpress, confidence, signals, error
+      domain, is_wordpress, confidence, signals, error, latency (seconds)
     """
     result = {
         'domain': domain,
@@ -80,6 +118,7 @@ async def detect_wordpress(session, domain, semaphore):
     }
 
     async with semaphore:
+        started = time.perf_counter()
         base_url = f'https://{domain}'
         signals = {}
         confidence = 0
@@ -93,6 +132,7 @@ async def detect_wordpress(session, domain, semaphore):
 
         if status is None:
             result['error'] = 'unreachable'
+            result['latency'] = time.perf_counter() - started
             return result
 
         if html and '/wp-content/' in html:
@@ -131,36 +171,230 @@ async def detect_wordpress(session, domain, semaphore):
         result['confidence'] = confidence
         result['is_wordpress'] = confidence >= CONFIDENCE_THRESHOLD
         result['signals'] = signals
+        result['latency'] = time.perf_counter() - started
 
         await asyncio.sleep(DELAY)
 
     return result
 
 
-async def scan_batch(domains):
-    """Scan a batch of domains for WordPress. Returns list of result dicts."""
-    semaphore = asyncio.Semaphore(CONCURRENCY)
-    connector = aiohttp.TCPConnector(limit=CONCURRENCY, ssl=False)
+def _error_result(domain, error):
+    return {
+        'domain': domain,
+        'is_wordpress': False,
+        'confidence': 0,
+        'signals': {},
+        'error': error,
+    }
+
+
+class ScanStore:
+    """SQLite store of scan results, keyed by (domain, fetch date).
 
-    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
-        tasks = [detect_wordpress(session, d, semaphore) for d in domains]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Convert exceptions to error results
-    clean = []
-    for i, r in enumerate(results):
-        if isinstance(r, Exception):
-            clean.append({
-                'domain': domains[i],
-                'is_wordpress': False,
-                'confidence': 0,
-                'signals': {},
-                'error': str(r),
-            })
+    Re-scanning a domain on the same day replaces that day's row; older
+    rows are kept as history.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(STORE_SCHEMA)
+        self._pending = []
+
+    def fresh(self, domains, fresh_days=FRESH_DAYS):
+        """Latest stored result per domain still inside the freshness window.
+
+        Failed scans count as fresh for ERROR_FRESH_DAYS only.
+
+        Returns:
+            {domain: result dict (with 'cached': True)}
+        """
+        if not domains or fresh_days <= 0:
+            return {}
+        now = time.time()
+        ok_since = now - fresh_days * 86400
+        error_since = now - min(fresh_days, ERROR_FRESH_DAYS) * 86400
+        marks = ','.join('?' * len(domains))
+        rows = self.db.execute(
+            f"""SELECT domain, is_wordpress, confidence, signals, error, latency
+                FROM scans
+                WHERE domain IN ({marks})
+                  AND fetched_at >= CASE WHEN error IS NULL THEN ? ELSE ? END
+                ORDER BY fetched_at""",
+            (*domains, ok_since, error_since),
+        ).fetchall()
+        found = {}
+        for domain, is_wp, confidence, signals, error, latency in rows:
+            found[domain] = {
+                'domain': domain,
+                'is_wordpress': bool(is_wp),
+                'confidence': confidence,
+                'signals': json.loads(signals),
+                'error': error,
+                'latency': latency,
+                'cached': True,
+            }
+        return found
+
+    def add(self, result):
+        """Queue a result; committed every WRITE_BATCH results."""
+        now = time.time()
+        self._pending.append((
+            result['domain'], time.strftime('%Y-%m-%d', time.gmtime(now)), now,
+            int(result['is_wordpress']), result['confidence'],
+            json.dumps(result['signals'], sort_keys=True), result.get('error'),
+            result.get('latency'),
+        ))
+        if len(self._pending) >= WRITE_BATCH:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        with self.db:
+            self.db.executemany(
+                'INSERT OR REPLACE INTO scans VALUES (?, ?, ?, ?, ?, ?, ?, ?)', self._pending)
+        self._pending.clear()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ScanStats:
+    """Counts, throughput and fetch latency percentiles for a scan."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.scanned = 0
+        self.cached = 0
+        self.wordpress = 0
+        self.errors = 0
+        self.latencies = array('d')
+
+    def record(self, result):
+        if result.get('cached'):
+            self.cached += 1
         else:
-            clean.append(r)
+            self.scanned += 1
+            if result.get('latency') is not None:
+                self.latencies.append(result['latency'])
+        if result.get('error'):
+            self.errors += 1
+        if result['is_wordpress']:
+            self.wordpress += 1
+
+    def summary(self):
+        """Human-readable summary lines."""
+        elapsed = time.perf_counter() - self.started
+        total = self.scanned + self.cached
+        lines = [
+            f"{self.wordpress}/{total} confirmed WordPress "
+            f"({self.scanned} scanned, {self.cached} from store, {self.errors} errors)",
+            f"{elapsed:.1f}s, {self.scanned / elapsed if elapsed else 0:.1f} domains/s scanned",
+        ]
+        if len(self.latencies) >= 2:
+            cuts = statistics.quantiles(self.latencies, n=100, method='inclusive')
+            lines.append(f"fetch latency p50={cuts[49]:.2f}s p90={cuts[89]:.2f}s "
+                         f"p99={cuts[98]:.2f}s max={max(self.latencies):.2f}s")
+        return lines
+
+
+async def scan_stream(domains, store=None, fresh_days=FRESH_DAYS,
+                      concurrency=CONCURRENCY, stats=None):
+    """Scan domains as a stream, yielding result dicts as they complete.
+
+    `domains` can be any iterable (e.g. a file being read line by line);
+    at most ~3x `concurrency` domains are in flight or buffered at once.
+    With a store, fresh stored results are yielded (marked 'cached')
+    instead of re-fetched, and new results are written as they land.
+    Results come back in completion order, not input order.
+    """
+    stats = stats if stats is not None else ScanStats()
+    todo = asyncio.Queue(maxsize=concurrency * 2)
+    done = asyncio.Queue(maxsize=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, ssl=False)
+
+    async def produce():
+        try:
+            domain_iter = iter(domains)
+            while chunk := list(islice(domain_iter, LOOKUP_CHUNK)):
+                cached = store.fresh(chunk, fresh_days) if store else {}
+                for domain in chunk:
+                    if domain in cached:
+                        await done.put(cached[domain])
+                    else:
+                        await todo.put(domain)
+        except Exception:
+            # Release the workers so the error surfaces instead of hanging
+            for _ in range(concurrency):
+                await todo.put(None)
+            raise
+        for _ in range(concurrency):
+            await todo.put(None)
+
+    async def work(session):
+        while (domain := await todo.get()) is not None:
+            try:
+                result = await detect_wordpress(session, domain, semaphore)
+            except Exception as e:
+                result = _error_result(domain, str(e))
+            await done.put(result)
+        await done.put(None)
 
-    return clean
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(work(session)) for _ in range(concurrency)]
+        try:
+            finished_workers = 0
+            while finished_workers < concurrency:
+                result = await done.get()
+                if result is None:
+                    finished_workers += 1
+                    continue
+                if store and not result.get('cached'):
+                    store.add(result)
+                stats.record(result)
+                yield result
+            await tasks[0]  # surface producer errors (e.g. a bad store)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if store:
+                store.flush()
+
+
+async def scan_batch(domains, store=None, fresh_days=FRESH_DAYS):
+    """Scan a batch of domains for WordPress. Returns list of result dicts.
+
+    Results are in input order, one per distinct domain. Pass a
+    ScanStore to reuse fresh results and persist new ones.
+    """
+    unique = list(dict.fromkeys(domains))
+    results = {}
+    async for result in scan_stream(unique, store=store, fresh_days=fresh_days):
+        results[result['domain']] = result
+    return [results[d] for d in unique]
+
+
+def _read_domains(domains, path=None):
+    """Yield domains from CLI args, then from the file line by line."""
+    yield from domains
+    if path:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield line.strip()
 
 
 def run_cli():
@@ -169,35 +403,55 @@ def run_cli():
     parser.add_argument('domains', nargs='*', help='Domains to check')
     parser.add_argument('--file', '-f', help='File with one domain per line')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--concurrency', type=int, default=CONCURRENCY,
+                        help=f'Domains scanned at once (default: {CONCURRENCY})')
+    parser.add_argument('--fresh-days', type=int, default=FRESH_DAYS,
+                        help=f'Reuse stored scans newer than this; 0 re-scans all (default: {FRESH_DAYS})')
+    parser.add_argument('--store', default=STORE_PATH, help='SQLite result store path')
+    parser.add_argument('--no-store', action='store_true', help='Neither read nor write the result store')
     args = parser.parse_args()
 
-    domains = list(args.domains)
-    if args.file:
-        with open(args.file) as f:
-            domains.extend(line.strip() for line in f if line.strip())
-
-    if not domains:
+    if not args.domains and not args.file:
         print("No domains provided. Pass domains as args or --file.")
         sys.exit(1)
 
-    print(f"\nScanning {len(domains)} domains for WordPress...\n")
-    start = time.time()
-    results = asyncio.run(scan_batch(domains))
-    elapsed = time.time() - start
-
-    wp_count = sum(1 for r in results if r['is_wordpress'])
-
-    if args.json:
-        print(json.dumps(results, indent=2))
-    else:
-        for r in results:
+    print(f"\nScanning {'domains from ' + args.file if args.file else f'{len(args.domains)} domains'} "
+          f"for WordPress...\n", file=sys.stderr if args.json else sys.stdout)
+    stats = ScanStats()
+    store = None if args.no_store else ScanStore(args.store)
+
+    async def _scan():
+        first = True
+        async for r in scan_stream(_read_domains(args.domains, args.file), store=store,
+                                   fresh_days=args.fresh_days, concurrency=args.concurrency,
+                                   stats=stats):
+            if args.json:
+                # Stream the array instead of holding every result for one dump
+                print(('[\n  ' if first else ',\n  ') + json.dumps(r), end='')
+                first = False
+                continue
             status = 'WordPress' if r['is_wordpress'] else 'Not WP'
             err = f" ({r['error']})" if r.get('error') else ''
             active_signals = [k for k, v in r['signals'].items() if v]
             sig_str = ', '.join(active_signals) if active_signals else 'none'
-            print(f"  [{status:>12}] {r['domain']:<40} conf={r['confidence']:>3}  signals: {sig_str}{err}")
+            cached = ' [stored]' if r.get('cached') else ''
+            print(f"  [{status:>12}] {r['domain']:<40} conf={r['confidence']:>3}  signals: {sig_str}{err}{cached}")
 
-    print(f"\n  {wp_count}/{len(results)} confirmed WordPress ({elapsed:.1f}s)\n")
+    try:
+        asyncio.run(_scan())
+    except KeyboardInterrupt:
+        print("\n  Interrupted; finished results are saved, re-run to resume.", file=sys.stderr)
+    finally:
+        if store:
+            store.close()
+        if args.json:
+            print('\n]' if stats.scanned + stats.cached else '[]')
+
+    out = sys.stderr if args.json else sys.stdout
+    print(file=out)
+    for line in stats.summary():
+        print(f"  {line}", file=out)
+    print(file=out)
 
 
 if __name__ == '__main__':
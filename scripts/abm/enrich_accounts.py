@@ -17,14 +17,11 @@ import argparse
 import json
 import os
 import sys
-import time
-
-import requests
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from config import get_exa_client, get_grok_headers, XAI_BASE
+from config import EXA_HOST, XAI_BASE, api_request, get_exa_client, get_grok_headers, throttle
 from db_supabase import get_supabase
 
 # Grok extraction prompt
@@ -61,13 +58,13 @@ def exa_research(domain, company_name):
 
     for query in queries:
         try:
+            throttle(EXA_HOST)
             results = exa.search(query, num_results=3)
             for r in results.results:
                 text = getattr(r, 'text', '') or ''
                 title = getattr(r, 'title', '') or ''
                 if text:
                     texts.append(f"## {title}\n{text[:1500]}")
-            time.sleep(0.5)
         except Exception as e:
             print(f"    [!] Exa search failed: {e}")
 
@@ -88,7 +85,8 @@ def firecrawl_scrape(domain):
         return None
 
     try:
-        resp = requests.post(
+        resp = api_request(
+            'POST',
             'https://api.firecrawl.dev/v1/scrape',
             headers={
                 'Authorization': f'Bearer {api_key}',
@@ -144,7 +142,8 @@ def grok_extract(company_name, domain, content):
     )
 
     try:
-        resp = requests.post(
+        resp = api_request(
+            'POST',
             f'{XAI_BASE}/chat/completions',
             headers=get_grok_headers(),
             json={
@@ -263,7 +262,6 @@ def run(limit=20, dry_run=False, force=False, source='exa'):
             sb.table('accounts').update({
                 'exa_research': {'error': 'no_content', 'domain': domain},
             }).eq('id', account_id).execute()
-            time.sleep(0.5)
             continue
 
         content_ok += 1
@@ -282,7 +280,6 @@ def run(limit=20, dry_run=False, force=False, source='exa'):
                 },
             }).eq('id', account_id).execute()
             print(f"    [!] Grok extraction failed, stored raw content")
-            time.sleep(0.5)
             continue
 
         # Step 3: Update account
@@ -294,8 +291,6 @@ def run(limit=20, dry_run=False, force=False, source='exa'):
             techs = ', '.join((extracted.get('tech_signals') or [])[:3])
             print(f"    + {ind} | ICP: {fit} | Tech: {techs}")
 
-        time.sleep(1)
-
     # Summary
     print(f"\n{'=' * 60}")
     print(f"  SUMMARY {'(DRY RUN)' if dry_run else ''}")
@@ -14,14 +14,11 @@ import argparse
 import json
 import os
 import sys
-import time
-
-import requests
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from config import get_exa_client
+from config import EXA_HOST, api_request, get_exa_client, throttle
 from db_supabase import get_supabase
 from name_validation import is_junk_domain, is_valid_company_name
 
@@ -90,7 +87,8 @@ def firecrawl_enrich(domain):
         return None
 
     try:
-        resp = requests.post(
+        resp = api_request(
+            'POST',
             'https://api.firecrawl.dev/v1/scrape',
             headers={
                 'Authorization': f'Bearer {api_key}',
@@ -145,6 +143,7 @@ def run(limit=20, seed='best', dry_run=False):
     # Call find_similar
     discovered = []
     try:
+        throttle(EXA_HOST)
         results = exa.find_similar(
             url=seed_urls[0] if len(seed_urls) == 1 else seed_urls[0],
             num_results=limit * 3,  # Over-fetch to account for dedup
@@ -202,7 +201,6 @@ def run(limit=20, seed='best', dry_run=False):
             firecrawl_data = firecrawl_enrich(company['domain'])
             if firecrawl_data:
                 print(f"    + Firecrawl enrichment OK")
-            time.sleep(1)
 
         # Build exa_research with discovery data + firecrawl
         exa_research = {
@@ -224,7 +222,6 @@ def run(limit=20, seed='best', dry_run=False):
         }, on_conflict='domain').execute()
 
         inserted += 1
-        time.sleep(0.5)
 
     print(f"\n  Done. {inserted} new accounts {'would be ' if dry_run else ''}inserted.")
     return inserted
@@ -14,7 +14,6 @@ import argparse
 import json
 import os
 import sys
-import time
 from datetime import datetime, timezone
 from urllib.parse import urljoin
 
@@ -24,7 +23,7 @@ from bs4 import BeautifulSoup
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from config import load_env
+from config import api_request, load_env
 load_env()
 
 from db_supabase import get_supabase
@@ -39,7 +38,8 @@ def fetch_page(domain):
     """Fetch homepage HTML. Returns (html, final_url) or (None, None)."""
     for scheme in ('https://', 'http://'):
         try:
-            resp = requests.get(f'{scheme}{domain}', headers=HEADERS, timeout=15, allow_redirects=True)
+            resp = api_request('GET', f'{scheme}{domain}', max_retries=1,
+                               headers=HEADERS, timeout=15, allow_redirects=True)
             if resp.status_code == 200:
                 return resp.text, resp.url
         except requests.RequestException:
@@ -86,7 +86,7 @@ def check_technical(domain):
 
     for path, key in [('/robots.txt', 'has_robots'), ('/sitemap.xml', 'has_sitemap')]:
         try:
-            resp = requests.get(f'https://{domain}{path}', headers=HEADERS, timeout=10)
+            resp = api_request('GET', f'https://{domain}{path}', max_retries=1, headers=HEADERS, timeout=10)
             results[key] = resp.status_code == 200 and len(resp.text) > 20
         except requests.RequestException:
             pass
@@ -103,7 +103,7 @@ def check_schema(soup):
 def check_pagespeed(domain):
     """Query Google PageSpeed Insights (free, no key needed)."""
     try:
-        resp = requests.get(PAGESPEED_API, params={
+        resp = api_request('GET', PAGESPEED_API, params={
             'url': f'https://{domain}',
             'strategy': 'mobile',
             'category': 'performance',
@@ -285,7 +285,6 @@ def run(limit=10, dry_run=False):
             print(f"      [{issue['severity'].upper()}] {issue['title']}")
 
         analyzed += 1
-        time.sleep(1)  # Be polite
 
     print(f"\n  Done. {analyzed} domains {'would be ' if dry_run else ''}analyzed.")
     return analyzed
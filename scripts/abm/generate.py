@@ -8,13 +8,13 @@ import sys
 import time
 from datetime import datetime, timedelta, timezone
 
-import requests
-
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
+sys.path.insert(1, os.path.dirname(SCRIPT_DIR))
 
-from config import get_grok_headers, get_exa_client, XAI_BASE
+from config import EXA_HOST, api_request, get_exa_client, get_grok_key, throttle
 from db_supabase import get_supabase
+from llm_client import grok_chat, print_metrics
 
 # Voice rules injected into Grok prompts
 VOICE_RULES = """
@@ -69,23 +69,27 @@ Requirements:
 """
 
 
-def grok_call(system_prompt, user_prompt, temperature=0.7):
-    """Call Grok (xAI) API."""
-    resp = requests.post(
-        f'{XAI_BASE}/chat/completions',
-        headers=get_grok_headers(),
-        json={
-            'model': 'grok-3-mini',
-            'messages': [
-                {'role': 'system', 'content': system_prompt},
-                {'role': 'user', 'content': user_prompt},
-            ],
-            'temperature': temperature,
-        },
+def grok_call(system_prompt, user_prompt, temperature=0.7, refresh=False):
+    """Call Grok (xAI) API.
+
+    Goes through the shared llm_client (response cache, metrics) with
+    api_request as transport, so the api.x.ai bucket still paces it.
+    Retries after a bad response pass refresh=True so they reach the API
+    instead of replaying the cached answer.
+    """
+    data = grok_chat(
+        [
+            {'role': 'system', 'content': system_prompt},
+            {'role': 'user', 'content': user_prompt},
+        ],
+        model='grok-3-mini',
+        temperature=temperature,
+        api_key=get_grok_key(),
         timeout=120,
+        transport=api_request,
+        refresh=refresh,
     )
-    resp.raise_for_status()
-    return resp.json()['choices'][0]['message']['content']
+    return data['choices'][0]['message']['content']
 
 
 def exa_deep_dive(company_name, domain):
@@ -102,6 +106,7 @@ def exa_deep_dive(company_name, domain):
 
     for query in queries:
         try:
+            throttle(EXA_HOST)
             results = exa.search(
                 query, num_results=2,
             )
@@ -111,10 +116,8 @@ def exa_deep_dive(company_name, domain):
                     'text': (getattr(r, 'text', '') or '')[:800],
                     'url': getattr(r, 'url', ''),
                 })
-            time.sleep(1)
         except Exception as e:
             print(f"    [!] Exa deep dive failed: {e}")
-            time.sleep(1)
 
     return research
 
@@ -168,7 +171,7 @@ Generate the complete PageData JSON for this company's personalized landing page
 
     for attempt in range(3):
         try:
-            raw = grok_call(system, user, temperature=0.7)
+            raw = grok_call(system, user, temperature=0.7, refresh=attempt > 0)
 
             # Strip markdown fences if present
             raw = raw.strip()
@@ -179,8 +182,6 @@ Generate the complete PageData JSON for this company's personalized landing page
             return json.loads(raw)
         except (json.JSONDecodeError, KeyError) as e:
             print(f"    [!] JSON parse failed (attempt {attempt+1}): {e}")
-            if attempt < 2:
-                time.sleep(2)
 
     return None
 
@@ -260,7 +261,6 @@ def run(limit=100, resume=True):
         # Exa deep dive
         print(f"    Deep researching...")
         deep_research = exa_deep_dive(name, domain)
-        time.sleep(1)
 
         # Generate contact vibe
         print(f"    Generating vibe for {contact['first_name']}...")
@@ -269,7 +269,6 @@ def run(limit=100, resume=True):
 
         # Save vibe to Supabase
         sb.table('contacts').update({'vibe': vibe}).eq('id', contact['id']).execute()
-        time.sleep(1)
 
         # Generate page copy
         print(f"    Generating page copy...")
@@ -344,9 +343,9 @@ def run(limit=100, resume=True):
 
         print(f"    Live at {page_url}")
         generated += 1
-        time.sleep(1)
 
     print(f"\n  Generation complete. {generated} pages created.")
+    print_metrics()
     return generated
 
 
@@ -0,0 +1,94 @@
+-- Migration 002: Server-side qualification (see qualify.py)
+-- Run this in Supabase SQL Editor (Dashboard > SQL Editor > New Query)
+--
+-- Moves is_actionable_contact into Postgres so get_qualified_accounts pages
+-- through qualified accounts by keyset instead of pulling every contact.
+-- Section 1 is generated: `python3 scripts/abm/title_filter.py --sql`.
+-- Re-run it (and sections 3-4) whenever the title_filter lists change.
+
+-- 1. SQL twin of title_filter.is_relevant_title
+CREATE OR REPLACE FUNCTION public.abm_is_relevant_title(title text)
+RETURNS boolean
+LANGUAGE plpgsql IMMUTABLE
+AS $$
+DECLARE
+    t text := lower(btrim(coalesce(title, ''), E' \t\n\r\f\013'));
+BEGIN
+    IF t = '' THEN
+        RETURN false;
+    END IF;
+    -- Exact-word blocklist
+    IF regexp_split_to_array(translate(t, ',-', '  '), '\s+') && ARRAY['ceo', 'cto', 'coo', 'cfo'] THEN
+        RETURN false;
+    END IF;
+    -- Substring blocklist (beats the allowlist)
+    IF t LIKE ANY (ARRAY['%recruit%', '%talent acq%', '%talent dir%', '%talent lead%', '%talent sourc%', '%talent &%', '%talent manager%', '%hr %', '%hr,%', '%human resource%', '%people ops%', '%people operations%', '%people &%', '%hrbp%', '%software engineer%', '%engineering manager%', '%engineering lead%', '%developer%', '%devops%', '%sre %', '%platform engineer%', '%creative director%', '%art director%', '%ux %', '%ui %', '%community lead%', '%community manager%', '%community dir%', '%social media%', '%content creator%', '%product manager%', '%product lead%', '%product dir%', '%legal%', '%counsel%', '%compliance%', '%finance director%', '%controller%', '%accounting%', '%cfo%', '%investment%', '%investor%', '%portfolio%', '%data scientist%', '%data engineer%', '%ml engineer%', '%machine learning%', '%research engineer%', '%research scientist%', '%editor%', '%editorial%', '%journalist%', '%writer%', '%professor%', '%academic%', '%teacher%', '%founder%', '%co-founder%']) THEN
+        RETURN false;
+    END IF;
+    IF t LIKE ANY (ARRAY['%sales%', '%revenue%', '%growth%', '%marketing%', '%demand gen%', '%demand generation%', '%business development%', '%bdm%', '%bdr%', '%sdr%', '%account exec%', '%account manager%', '% ae %', '%customer success%', '%client success%', '%enablement%', '%partnerships%', '%partner%', '%channel%', '%alliances%', '%go-to-market%', '%gtm%', '%commercial%', '%cro%', '%cmo%', '%cso%', '%chief revenue%', '%chief marketing%', '%chief sales%', '%chief commercial%', '%chief growth%', '%field marketing%', '%revops%', '%rev ops%', '%revenue operations%', '%sales operations%', '%marketing operations%', '%general manager%', '%managing director%', '%client%', '%customer%']) THEN
+        RETURN true;
+    END IF;
+    -- Senior titles without a specific function
+    RETURN t LIKE ANY (ARRAY['vp %', 'vp,%', 'vp of%', 'vice president%', 'svp%', 'evp%', 'avp%', 'director%', 'sr director%', 'senior director%', 'head of%']);
+END;
+$$;
+
+-- 2. Stored flag, maintained on every insert / title change
+ALTER TABLE public.contacts ADD COLUMN IF NOT EXISTS is_relevant_title boolean NOT NULL DEFAULT false;
+
+CREATE OR REPLACE FUNCTION public.abm_set_is_relevant_title()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.is_relevant_title := public.abm_is_relevant_title(NEW.title);
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS contacts_is_relevant_title ON public.contacts;
+CREATE TRIGGER contacts_is_relevant_title
+    BEFORE INSERT OR UPDATE OF title ON public.contacts
+    FOR EACH ROW EXECUTE FUNCTION public.abm_set_is_relevant_title();
+
+-- 3. Backfill existing rows
+UPDATE public.contacts
+SET is_relevant_title = public.abm_is_relevant_title(title)
+WHERE is_relevant_title IS DISTINCT FROM public.abm_is_relevant_title(title);
+
+-- 4. Actionable contacts: email + relevant title + not flagged + not invalid
+CREATE INDEX IF NOT EXISTS contacts_actionable_idx
+    ON public.contacts (account_id, is_primary DESC, id)
+    WHERE is_relevant_title AND email IS NOT NULL;
+
+CREATE OR REPLACE VIEW public.actionable_contacts WITH (security_invoker = on) AS
+SELECT id, account_id, first_name, last_name, email, email_status, title,
+       linkedin_url, vibe, notes, is_primary, lemlist_lead_id
+FROM public.contacts
+WHERE is_relevant_title
+  AND email IS NOT NULL
+  AND btrim(email) <> ''
+  AND coalesce(btrim(email_status), '') <> 'invalid'
+  AND coalesce(notes, '') NOT LIKE '%[auto-flagged]%';
+
+-- 5. Qualified accounts with their actionable contacts (primary first).
+--    Page by keyset: WHERE id > last_id ORDER BY id LIMIT n
+CREATE OR REPLACE VIEW public.qualified_accounts WITH (security_invoker = on) AS
+SELECT a.id, a.name, a.domain, a.stage, a.outreach_status, a.exa_research,
+       a.industry, a.icp_score, a.tech_stack, a.employee_count, a.gap_analysis,
+       jsonb_agg(to_jsonb(c) ORDER BY c.is_primary DESC, c.id) AS actionable_contacts
+FROM public.accounts a
+JOIN public.actionable_contacts c ON c.account_id = a.id
+WHERE a.domain IS NOT NULL
+GROUP BY a.id;
+
+-- 6. Pipeline-wide counts for get_qualification_stats
+CREATE OR REPLACE VIEW public.qualification_stats WITH (security_invoker = on) AS
+SELECT
+    (SELECT count(*) FROM public.accounts WHERE domain IS NOT NULL) AS total_accounts,
+    (SELECT count(*) FROM public.contacts WHERE email IS NOT NULL) AS total_contacts_with_email,
+    (SELECT count(*) FROM public.actionable_contacts) AS actionable_contacts,
+    (SELECT count(DISTINCT account_id) FROM public.actionable_contacts) AS qualified_accounts;
+
+-- Verify
+SELECT * FROM public.qualification_stats;
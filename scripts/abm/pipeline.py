@@ -36,7 +36,7 @@ import time
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from config import load_env
+from config import load_env, print_http_metrics
 load_env()
 
 
@@ -359,6 +359,7 @@ def main():
     seconds = int(elapsed % 60)
     print(f"\n{'=' * 60}")
     print(f"  Pipeline complete in {minutes}m {seconds}s")
+    print_http_metrics()
     print(f"{'=' * 60}")
 
 
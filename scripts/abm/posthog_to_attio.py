@@ -16,16 +16,13 @@ Requires in scripts/abm/.env:
 import argparse
 import os
 import sys
-import time
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 
-import requests
-
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from config import ATTIO_BASE, POSTHOG_BASE, get_attio_headers, get_posthog_headers
+from config import ATTIO_BASE, POSTHOG_BASE, api_request, get_attio_headers, get_posthog_headers
 
 
 # Local aliases for use within this file
@@ -47,15 +44,13 @@ def fetch_abm_events(days=7):
     }
 
     while url:
-        resp = requests.get(url, params=params, headers=posthog_headers(), timeout=30)
+        resp = api_request('GET', url, params=params, headers=posthog_headers())
         resp.raise_for_status()
         data = resp.json()
         results = data.get('results', [])
         all_events.extend(results)
         url = data.get('next')
         params = {}  # next URL includes params
-        if url:
-            time.sleep(0.3)
 
     return all_events
 
@@ -105,7 +100,8 @@ def upsert_attio_note(company_name, views, last_view, contacts, dry_run=False):
         return True
 
     # Find company in Attio by name
-    search_resp = requests.post(
+    search_resp = api_request(
+        'POST',
         f'{ATTIO_BASE}/objects/companies/records/query',
         json={
             'filter': {
@@ -140,7 +136,8 @@ def upsert_attio_note(company_name, views, last_view, contacts, dry_run=False):
         f"Contacts who viewed: {contact_list}"
     )
 
-    note_resp = requests.post(
+    note_resp = api_request(
+        'POST',
         f'{ATTIO_BASE}/notes',
         json={
             'data': {
@@ -260,7 +257,6 @@ def run(days=7, dry_run=False):
         )
         if success:
             synced += 1
-        time.sleep(0.5)
 
     print(f"\n  Done. {synced}/{len(companies)} companies synced to Attio.")
 
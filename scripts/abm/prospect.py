@@ -7,7 +7,6 @@ enter the pipeline. Title relevance is checked via title_filter module.
 
 import os
 import sys
-import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -126,7 +125,6 @@ def run(limit=100, resume=True):
         result = apollo_search(domain)
         if not result or 'people' not in result:
             print(f"    [!] No results from Apollo")
-            time.sleep(1)
             continue
 
         added = 0
@@ -160,7 +158,6 @@ def run(limit=100, resume=True):
                 ).execute()
 
         total_contacts += added
-        time.sleep(1)  # Rate limit between companies
 
     print(f"\n  Prospecting complete. {total_contacts} contacts added.")
     return total_contacts
@@ -14,15 +14,12 @@ import argparse
 import json
 import os
 import sys
-import time
 from urllib.parse import urlencode
 
-import requests
-
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from config import load_env
+from config import api_request, load_env
 load_env()
 
 from db_supabase import get_supabase
@@ -68,7 +65,8 @@ def create_lead(api_key, campaign_id, lead_data, dry_run=False):
 
     url = f'{LEMLIST_BASE}/campaigns/{campaign_id}/leads/'
 
-    resp = requests.post(
+    resp = api_request(
+        'POST',
         url,
         auth=lemlist_auth(api_key),
         json=lead_data,
@@ -90,7 +88,8 @@ def add_custom_variables(api_key, lead_id, variables, dry_run=False):
 
     url = f'{LEMLIST_BASE}/leads/{lead_id}/variables'
 
-    resp = requests.post(
+    resp = api_request(
+        'POST',
         url,
         auth=lemlist_auth(api_key),
         params=variables,
@@ -232,9 +231,6 @@ def run(campaign_id, limit=10, dry_run=False):
 
         pushed += 1
 
-        # Rate limit: 20 req / 2s, we made 2 requests (create + vars)
-        time.sleep(0.3)
-
     if skipped:
         print(f"\n  Skipped {skipped} contacts already in Lemlist")
     print(f"\n  Done. {pushed} leads {'would be ' if dry_run else ''}pushed to Lemlist.")
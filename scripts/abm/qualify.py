@@ -12,6 +12,11 @@ Usage:
 
   # Get accounts with at least 1 actionable contact
   accounts = get_qualified_accounts(sb, limit=500)
+
+Account qualification runs in Postgres (migrations/002): the
+qualified_accounts view joins accounts to actionable_contacts, which filters
+on the trigger-maintained contacts.is_relevant_title flag. Python pages
+through it by keyset, so memory scales with `limit`, not the contact table.
 """
 
 import os
@@ -55,12 +60,42 @@ def is_actionable_contact(contact):
     return True
 
 
+# Page size for keyset paging over the qualified_accounts view
+PAGE_SIZE = 100
+
+QUALIFIED_ACCOUNT_COLUMNS = (
+    'id, name, domain, stage, outreach_status, exa_research, '
+    'industry, icp_score, tech_stack, employee_count, gap_analysis, actionable_contacts'
+)
+
+
+def iter_qualified_accounts(sb, page_size=PAGE_SIZE):
+    """Yield qualified accounts in id order, one keyset page at a time.
+
+    Args:
+        sb: Supabase client
+        page_size: accounts fetched per request
+
+    Yields:
+        account dicts, each with 'actionable_contacts' (primary contact first)
+    """
+    last_id = None
+    while True:
+        query = sb.table('qualified_accounts').select(QUALIFIED_ACCOUNT_COLUMNS)
+        if last_id is not None:
+            query = query.gt('id', last_id)
+        page = query.order('id').limit(page_size).execute().data or []
+        yield from page
+        if len(page) < page_size:
+            return
+        last_id = page[-1]['id']
+
+
 def get_qualified_accounts(sb, limit=500):
     """Returns accounts that have at least 1 actionable contact.
 
-    Batch-fetches all contacts, groups by account_id, filters accounts
-    that have >= 1 actionable contact. Returns list of account dicts
-    with an extra 'actionable_contacts' key containing the filtered contacts.
+    Qualification happens server-side in the qualified_accounts view, so only
+    qualified accounts and their actionable contacts cross the wire.
 
     Args:
         sb: Supabase client
@@ -69,41 +104,12 @@ def get_qualified_accounts(sb, limit=500):
     Returns:
         list of account dicts, each with 'actionable_contacts' key
     """
-    # Fetch all accounts with domains
-    accounts_result = sb.table('accounts').select(
-        'id, name, domain, stage, outreach_status, exa_research, '
-        'industry, icp_score, tech_stack, employee_count, gap_analysis'
-    ).not_.is_('domain', 'null').order('id').limit(limit).execute()
-    accounts = accounts_result.data or []
-
-    if not accounts:
-        return []
-
-    # Batch-fetch all contacts (more efficient than per-account queries)
-    contacts_result = sb.table('contacts').select(
-        'id, account_id, first_name, last_name, email, title, '
-        'linkedin_url, vibe, notes, is_primary, lemlist_lead_id'
-    ).not_.is_('email', 'null').order('is_primary', desc=True).execute()
-    all_contacts = contacts_result.data or []
-
-    # Group contacts by account_id
-    contacts_by_account = {}
-    for c in all_contacts:
-        aid = c.get('account_id')
-        if aid:
-            contacts_by_account.setdefault(aid, []).append(c)
-
-    # Filter accounts: must have at least 1 actionable contact
-    qualified = []
-    for account in accounts:
-        account_contacts = contacts_by_account.get(account['id'], [])
-        actionable = [c for c in account_contacts if is_actionable_contact(c)]
-
-        if actionable:
-            account['actionable_contacts'] = actionable
-            qualified.append(account)
-
-    return qualified
+    accounts = []
+    for account in iter_qualified_accounts(sb, page_size=min(PAGE_SIZE, max(limit, 1))):
+        accounts.append(account)
+        if len(accounts) >= limit:
+            break
+    return accounts
 
 
 def get_qualification_stats(sb):
@@ -111,25 +117,17 @@ def get_qualification_stats(sb):
 
     Returns dict with counts for reporting.
     """
-    accounts_result = sb.table('accounts').select(
-        'id', count='exact'
-    ).not_.is_('domain', 'null').execute()
-    total_accounts = accounts_result.count or 0
-
-    contacts_result = sb.table('contacts').select(
-        'id, account_id, email, title, notes'
-    ).not_.is_('email', 'null').execute()
-    all_contacts = contacts_result.data or []
-
-    actionable = [c for c in all_contacts if is_actionable_contact(c)]
-    actionable_account_ids = set(c['account_id'] for c in actionable)
+    result = sb.table('qualification_stats').select('*').execute()
+    row = (result.data or [{}])[0]
+    total_accounts = row.get('total_accounts') or 0
+    qualified_accounts = row.get('qualified_accounts') or 0
 
     return {
         'total_accounts': total_accounts,
-        'total_contacts_with_email': len(all_contacts),
-        'actionable_contacts': len(actionable),
-        'qualified_accounts': len(actionable_account_ids),
-        'unqualified_accounts': total_accounts - len(actionable_account_ids),
+        'total_contacts_with_email': row.get('total_contacts_with_email') or 0,
+        'actionable_contacts': row.get('actionable_contacts') or 0,
+        'qualified_accounts': qualified_accounts,
+        'unqualified_accounts': total_accounts - qualified_accounts,
     }
 
 
@@ -14,7 +14,6 @@ Usage:
 import argparse
 import os
 import sys
-import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -126,7 +125,6 @@ def run(limit=50, dry_run=False, delete_only=False):
         result = apollo_search(domain)
         if not result or 'people' not in result:
             print(f"    [!] No results from Apollo")
-            time.sleep(1)
             continue
 
         added = 0
@@ -149,8 +147,6 @@ def run(limit=50, dry_run=False, delete_only=False):
         if title_skips:
             print(f"    ({title_skips} irrelevant titles skipped)")
 
-        time.sleep(1)  # Rate limit
-
     # Summary
     print(f"\n{'=' * 60}")
     print(f"  SUMMARY {'(DRY RUN)' if dry_run else ''}")
@@ -4,12 +4,11 @@
 import json
 import os
 import sys
-import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from config import get_exa_client
+from config import EXA_HOST, get_exa_client, throttle
 from db_supabase import get_supabase
 from name_validation import is_junk_domain, is_valid_company_name
 
@@ -78,6 +77,7 @@ def find_companies(exa, limit=100):
 
         print(f"  Searching: {query[:60]}...")
         try:
+            throttle(EXA_HOST)
             results = exa.search(
                 query,
                 num_results=per_query,
@@ -103,13 +103,10 @@ def find_companies(exa, limit=100):
                         'url': getattr(r, 'url', ''),
                         'snippet': (getattr(r, 'text', '') or '')[:500],
                     })
-
-            time.sleep(1)  # Rate limit
         except Exception as e:
             import traceback
             print(f"  [!] Search failed: {e}")
             traceback.print_exc()
-            time.sleep(2)
 
     if filtered:
         print(f"  Filtered {filtered} junk results (articles, job listings, etc.)")
@@ -132,6 +129,7 @@ def research_company(exa, company):
         )
 
         try:
+            throttle(EXA_HOST)
             results = exa.search(
                 query,
                 num_results=3,
@@ -144,11 +142,8 @@ def research_company(exa, company):
                     'url': getattr(r, 'url', ''),
                     'text': (getattr(r, 'text', '') or '')[:1000],
                 })
-
-            time.sleep(1)  # Rate limit
         except Exception as e:
             print(f"    [!] Deep research failed for query '{query[:40]}': {e}")
-            time.sleep(2)
 
     return research
 
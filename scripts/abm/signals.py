@@ -5,11 +5,17 @@ Collects hiring signals from public ATS APIs (Greenhouse, Lever),
 combines with LinkedIn relationship data and firmographics,
 and computes a composite priority score (0-100) for each account.
 
+Hiring probes fan out every slug x board candidate at once (per-board
+rate limits come from config.HOST_LIMITS) and stop at the first board
+with open jobs. Slugs a board answered 404 for are remembered in
+scripts/abm/.ats_negative_cache.json and skipped until the entry expires.
+
 Usage:
   python3 scripts/abm/signals.py --dry-run
   python3 scripts/abm/signals.py --limit 76
   python3 scripts/abm/signals.py --hiring-only --limit 10
   python3 scripts/abm/signals.py --score-only
+  python3 scripts/abm/signals.py --hiring-only --limit 2000 --workers 16
 """
 
 import argparse
@@ -17,7 +23,9 @@ import json
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta
 
 import requests
@@ -25,7 +33,7 @@ import requests
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
-from config import load_env
+from config import api_request, load_env
 load_env()
 
 from db_supabase import get_supabase
@@ -40,6 +48,19 @@ GTM_KEYWORDS = [
     'business development',
 ]
 
+# Probe engine: accounts in flight, and requests in flight per board. Keeping
+# the per-board pools small leaves queued probes in the executor, where a
+# match can still cancel them, instead of parked inside the rate limiter.
+ACCOUNT_WORKERS = 8
+PROBE_WORKERS_PER_BOARD = 4
+
+# board:slug pairs that 404'd, skipped until the entry expires
+NEGATIVE_CACHE_PATH = os.path.join(SCRIPT_DIR, '.ats_negative_cache.json')
+NEGATIVE_CACHE_TTL = 14 * 24 * 3600
+
+_negative_cache = None
+_negative_cache_lock = threading.Lock()
+
 
 def slugify(name):
     """Convert company name or domain to potential ATS slug."""
@@ -59,99 +80,181 @@ def is_gtm_title(title):
     return any(kw in title_lower for kw in GTM_KEYWORDS)
 
 
-def check_greenhouse(slug):
-    """Check Greenhouse public API for job listings.
+def _parse_greenhouse(data):
+    jobs = data.get('jobs', []) if isinstance(data, dict) else []
+    gtm_jobs = [j for j in jobs if is_gtm_title(j.get('title', ''))]
+    return {
+        'platform': 'greenhouse',
+        'total_jobs': len(jobs),
+        'gtm_jobs': len(gtm_jobs),
+        'gtm_titles': [j['title'] for j in gtm_jobs[:10]],
+    }
 
-    GET https://boards-api.greenhouse.io/v1/boards/{slug}/jobs
-    No auth required. Returns {jobs: [...], meta: {total: N}}.
+
+def _parse_lever(postings):
+    if not isinstance(postings, list):
+        return None
+    gtm_postings = [p for p in postings if is_gtm_title(p.get('text', ''))]
+    return {
+        'platform': 'lever',
+        'total_jobs': len(postings),
+        'gtm_jobs': len(gtm_postings),
+        'gtm_titles': [p['text'] for p in gtm_postings[:10]],
+    }
+
+
+# Board name -> (public postings URL, response parser); probed in this order
+BOARDS = {
+    # No auth. Returns {jobs: [...], meta: {total: N}}.
+    'greenhouse': ('https://boards-api.greenhouse.io/v1/boards/{slug}/jobs', _parse_greenhouse),
+    # No auth. Returns array of posting objects.
+    'lever': ('https://api.lever.co/v0/postings/{slug}', _parse_lever),
+}
+
+
+def probe_board(board, slug):
+    """Fetch one board's postings for a slug.
+
+    Returns:
+        (outcome, result): outcome is 'found', 'missing' (404, safe to
+        cache) or 'error' (anything transient); result is the parsed
+        job summary when found, else None.
     """
-    url = f'https://boards-api.greenhouse.io/v1/boards/{slug}/jobs'
+    url_template, parse = BOARDS[board]
     try:
-        resp = requests.get(url, timeout=10)
+        resp = api_request('GET', url_template.format(slug=slug), max_retries=1, timeout=10)
         if resp.status_code == 404:
-            return None
+            return 'missing', None
         if resp.status_code != 200:
-            return None
-        data = resp.json()
-        jobs = data.get('jobs', [])
-        gtm_jobs = [j for j in jobs if is_gtm_title(j.get('title', ''))]
-        return {
-            'platform': 'greenhouse',
-            'total_jobs': len(jobs),
-            'gtm_jobs': len(gtm_jobs),
-            'gtm_titles': [j['title'] for j in gtm_jobs[:10]],
-        }
+            return 'error', None
+        result = parse(resp.json())
     except (requests.RequestException, ValueError):
-        return None
+        return 'error', None
+    return ('found', result) if result else ('error', None)
+
+
+def check_greenhouse(slug):
+    """Check Greenhouse public API for job listings.
+
+    GET https://boards-api.greenhouse.io/v1/boards/{slug}/jobs
+    """
+    return probe_board('greenhouse', slug)[1]
 
 
 def check_lever(slug):
     """Check Lever public API for job listings.
 
     GET https://api.lever.co/v0/postings/{slug}
-    No auth required. Returns array of posting objects.
     """
-    url = f'https://api.lever.co/v0/postings/{slug}'
-    try:
-        resp = requests.get(url, timeout=10)
-        if resp.status_code == 404:
-            return None
-        if resp.status_code != 200:
-            return None
-        postings = resp.json()
-        if not isinstance(postings, list):
-            return None
-        gtm_postings = [p for p in postings if is_gtm_title(p.get('text', ''))]
-        return {
-            'platform': 'lever',
-            'total_jobs': len(postings),
-            'gtm_jobs': len(gtm_postings),
-            'gtm_titles': [p['text'] for p in gtm_postings[:10]],
-        }
-    except (requests.RequestException, ValueError):
-        return None
+    return probe_board('lever', slug)[1]
 
 
-def check_hiring_signals(domain, company_name):
-    """Check Greenhouse + Lever public APIs for GTM job listings.
+def _load_negative_cache():
+    """Return the in-memory negative cache, loading it from disk once."""
+    global _negative_cache
+    with _negative_cache_lock:
+        if _negative_cache is None:
+            try:
+                with open(NEGATIVE_CACHE_PATH) as f:
+                    _negative_cache = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                _negative_cache = {}
+        return _negative_cache
 
-    Tries multiple slug variations. Returns best result or None.
-    """
-    # Generate slug candidates
-    slugs = set()
+
+def is_known_missing(board, slug):
+    """True if `board` answered 404 for `slug` within NEGATIVE_CACHE_TTL."""
+    checked_at = _load_negative_cache().get(f'{board}:{slug}')
+    return checked_at is not None and time.time() - checked_at < NEGATIVE_CACHE_TTL
+
+
+def mark_missing(board, slug):
+    cache = _load_negative_cache()
+    with _negative_cache_lock:
+        cache[f'{board}:{slug}'] = time.time()
+
+
+def save_negative_cache():
+    """Write the negative cache atomically (tmp file + rename), dropping expired entries."""
+    cache = _load_negative_cache()
+    now = time.time()
+    with _negative_cache_lock:
+        fresh = {k: v for k, v in cache.items() if now - v < NEGATIVE_CACHE_TTL}
+    tmp = NEGATIVE_CACHE_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(fresh, f, sort_keys=True)
+    os.replace(tmp, NEGATIVE_CACHE_PATH)
+
+
+def slug_candidates(domain, company_name):
+    """Slug variations to try for a company, most likely first."""
+    slugs = []
     if domain:
-        slugs.add(slugify(domain))
+        slugs.append(slugify(domain))
         # Try without common prefixes
-        base = domain.replace('www.', '').split('.')[0]
-        slugs.add(base)
+        slugs.append(domain.replace('www.', '').split('.')[0])
     if company_name:
-        slugs.add(slugify(company_name))
+        slugs.append(slugify(company_name))
         # Try without spaces
-        slugs.add(re.sub(r'\s+', '', company_name.lower()))
+        slugs.append(re.sub(r'\s+', '', company_name.lower()))
+    return [s for s in dict.fromkeys(slugs) if s]
 
-    slugs.discard('')
 
-    best = None
+def _probe(board, slug, stop):
+    if stop.is_set():
+        return None  # another candidate already matched; skip the request
+    outcome, result = probe_board(board, slug)
+    if outcome == 'missing':
+        mark_missing(board, slug)
+    return result
 
-    for slug in slugs:
-        # Try Greenhouse
-        result = check_greenhouse(slug)
-        if result and (not best or result['total_jobs'] > best.get('total_jobs', 0)):
-            best = result
 
-        # Rate limit: 1 req/sec
-        time.sleep(0.5)
+def make_probe_executors():
+    """One small ThreadPoolExecutor per board, shared across accounts."""
+    return {board: ThreadPoolExecutor(max_workers=PROBE_WORKERS_PER_BOARD) for board in BOARDS}
 
-        # Try Lever
-        result = check_lever(slug)
-        if result and (not best or result['total_jobs'] > best.get('total_jobs', 0)):
-            best = result
 
-        time.sleep(0.5)
+def check_hiring_signals(domain, company_name, executors=None):
+    """Check Greenhouse + Lever public APIs for GTM job listings.
 
-        # Stop if we found a good match
-        if best and best['total_jobs'] > 0:
-            break
+    Probes every slug x board candidate concurrently (skipping pairs in
+    the negative cache) and cancels the rest once a board with open jobs
+    turns up; probes already handed to a worker see the stop flag and
+    skip their request. Returns best result or None.
+
+    Args:
+        executors: {board: ThreadPoolExecutor} from make_probe_executors();
+            private ones are used when omitted
+    """
+    candidates = [(board, slug) for slug in slug_candidates(domain, company_name)
+                  for board in BOARDS if not is_known_missing(board, slug)]
+    if not candidates:
+        return None
+
+    own_executors = executors is None
+    if own_executors:
+        executors = make_probe_executors()
+
+    best = None
+    stop = threading.Event()
+    pending = {executors[board].submit(_probe, board, slug, stop) for board, slug in candidates}
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result and (not best or result['total_jobs'] > best.get('total_jobs', 0)):
+                    best = result
+            # Stop if we found a good match
+            if best and best['total_jobs'] > 0:
+                break
+    finally:
+        stop.set()
+        for future in pending:
+            future.cancel()
+        if own_executors:
+            for executor in executors.values():
+                executor.shutdown(wait=False)
 
     if best:
         best['checked_at'] = datetime.now().strftime('%Y-%m-%d')
@@ -241,8 +344,47 @@ def priority_tier(score):
         return 'cold'
 
 
-def run(limit=100, dry_run=False, hiring_only=False, score_only=False):
-    """Collect all signals and compute priority scores."""
+def update_hiring_signals(account, probe_executors=None):
+    """Refresh account['signals']['hiring'] unless it was checked this month.
+
+    Returns:
+        (found, lines): whether a public ATS was found, and the output
+        lines to print for the account
+    """
+    signals = account['signals']
+    existing_hiring = signals.get('hiring', {})
+    checked_at = existing_hiring.get('checked_at', '')
+    if checked_at and is_within_months(checked_at, 1):
+        return False, [f"    [skip] Hiring checked recently ({checked_at})"]
+
+    lines = [f"    Checking hiring signals..."]
+    hiring = check_hiring_signals(account.get('domain', ''), account['name'], probe_executors)
+    if hiring:
+        signals['hiring'] = hiring
+        lines.append(f"    + {hiring['platform']}: {hiring['total_jobs']} total, "
+                     f"{hiring['gtm_jobs']} GTM jobs")
+        for title in hiring['gtm_titles'][:3]:
+            lines.append(f"      - {title}")
+        return True, lines
+
+    signals['hiring'] = {
+        'platform': None,
+        'total_jobs': 0,
+        'gtm_jobs': 0,
+        'gtm_titles': [],
+        'checked_at': datetime.now().strftime('%Y-%m-%d'),
+    }
+    lines.append(f"    [none] No public ATS found")
+    return False, lines
+
+
+def run(limit=100, dry_run=False, hiring_only=False, score_only=False, workers=ACCOUNT_WORKERS):
+    """Collect all signals and compute priority scores.
+
+    Hiring checks for up to `workers` accounts run at once, sharing the
+    per-board probe pools; results are printed, scored and written as
+    each account finishes.
+    """
     print(f"\n{'=' * 60}")
     print(f"  Signal Collection & Priority Scoring {'(DRY RUN)' if dry_run else ''}")
     print(f"{'=' * 60}\n")
@@ -262,51 +404,28 @@ def run(limit=100, dry_run=False, hiring_only=False, score_only=False):
 
     print(f"  Processing {len(accounts)} accounts\n")
 
+    for account in accounts:
+        account['signals'] = account.get('signals') or {}
+
     hiring_found = 0
     scored = 0
+    finished = 0
     tier_counts = {'hot': 0, 'warm': 0, 'cool': 0, 'cold': 0}
 
-    for i, account in enumerate(accounts):
-        name = account['name']
-        domain = account.get('domain', '')
-        signals = account.get('signals') or {}
-
-        print(f"  [{i+1}/{len(accounts)}] {name} ({domain})")
-
-        # Phase 3: Hiring signals (skip if score_only)
-        if not score_only:
-            # Skip if already checked recently
-            existing_hiring = signals.get('hiring', {})
-            checked_at = existing_hiring.get('checked_at', '')
-            if checked_at and is_within_months(checked_at, 1):
-                print(f"    [skip] Hiring checked recently ({checked_at})")
-            else:
-                print(f"    Checking hiring signals...")
-                hiring = check_hiring_signals(domain, name)
-                if hiring:
-                    signals['hiring'] = hiring
-                    hiring_found += 1
-                    print(f"    + {hiring['platform']}: {hiring['total_jobs']} total, "
-                          f"{hiring['gtm_jobs']} GTM jobs")
-                    if hiring['gtm_titles']:
-                        for title in hiring['gtm_titles'][:3]:
-                            print(f"      - {title}")
-                else:
-                    signals['hiring'] = {
-                        'platform': None,
-                        'total_jobs': 0,
-                        'gtm_jobs': 0,
-                        'gtm_titles': [],
-                        'checked_at': datetime.now().strftime('%Y-%m-%d'),
-                    }
-                    print(f"    [none] No public ATS found")
+    def finish(account, lines):
+        nonlocal scored, finished
+        finished += 1
+        signals = account['signals']
+        print(f"  [{finished}/{len(accounts)}] {account['name']} ({account.get('domain', '')})")
+        for line in lines:
+            print(line)
 
         if hiring_only:
             if not dry_run:
                 sb.table('accounts').update({
                     'signals': json.dumps(signals),
                 }).eq('id', account['id']).execute()
-            continue
+            return
 
         # Phase 4: Compute priority score
         score = compute_priority_score(account, signals)
@@ -322,6 +441,32 @@ def run(limit=100, dry_run=False, hiring_only=False, score_only=False):
                 'priority_score': score,
             }).eq('id', account['id']).execute()
 
+    # Phase 3: Hiring signals (skip if score_only)
+    if score_only:
+        for account in accounts:
+            finish(account, [])
+    else:
+        probe_executors = make_probe_executors()
+        account_executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        futures = {
+            account_executor.submit(update_hiring_signals, account, probe_executors): account
+            for account in accounts
+        }
+        try:
+            for future in as_completed(futures):
+                account = futures[future]
+                try:
+                    found, lines = future.result()
+                except Exception as e:
+                    found, lines = False, [f"    [!] Hiring check failed: {e}"]
+                hiring_found += found
+                finish(account, lines)
+        finally:
+            account_executor.shutdown(wait=False, cancel_futures=True)
+            for executor in probe_executors.values():
+                executor.shutdown(wait=False, cancel_futures=True)
+            save_negative_cache()
+
     # Summary
     print(f"\n{'=' * 60}")
     print(f"  SUMMARY {'(DRY RUN)' if dry_run else ''}")
@@ -347,5 +492,8 @@ if __name__ == '__main__':
     parser.add_argument('--dry-run', action='store_true', help='Preview without changes')
     parser.add_argument('--hiring-only', action='store_true', help='Only check hiring signals, skip scoring')
     parser.add_argument('--score-only', action='store_true', help='Only compute scores from existing signals')
+    parser.add_argument('--workers', type=int, default=ACCOUNT_WORKERS,
+                        help=f'Accounts checked concurrently (default: {ACCOUNT_WORKERS})')
     args = parser.parse_args()
-    run(limit=args.limit, dry_run=args.dry_run, hiring_only=args.hiring_only, score_only=args.score_only)
+    run(limit=args.limit, dry_run=args.dry_run, hiring_only=args.hiring_only,
+        score_only=args.score_only, workers=args.workers)
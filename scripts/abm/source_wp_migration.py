@@ -28,7 +28,7 @@ from config import (
 )
 from db_supabase import get_supabase, get_all_supabase_domains
 from name_validation import is_junk_domain, is_valid_company_name
-from detect_wordpress import scan_batch
+from detect_wordpress import ScanStore, scan_batch
 
 # City -> segment slug mapping
 CITY_SEGMENTS = {
@@ -122,7 +122,6 @@ def discover_apollo(city, limit, existing_domains):
                     })
 
                 page += 1
-                time.sleep(0.5)
 
             except Exception as e:
                 print(f"    [!] Apollo search failed (page {page}): {e}")
@@ -162,7 +161,9 @@ def detect_phase(companies):
     domains = [c['domain'] for c in companies]
     print(f"\n  Scanning {len(domains)} domains for WordPress...")
 
-    results = asyncio.run(scan_batch(domains))
+    # Domains scanned recently (or by an interrupted run) come from the store
+    with ScanStore() as store:
+        results = asyncio.run(scan_batch(domains, store=store))
 
     # Build lookup map
     results_map = {r['domain']: r for r in results}
@@ -17,15 +17,14 @@ import argparse
 import json
 import os
 import sys
-import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
 
 from config import (
-    APOLLO_BASE, PROSPEO_BASE,
+    APOLLO_BASE, PROSPEO_BASE, EXA_HOST,
     get_exa_client, get_apollo_headers, get_prospeo_headers,
-    api_request,
+    api_request, throttle,
 )
 from db_supabase import get_supabase
 from name_validation import is_junk_domain, is_valid_company_name
@@ -76,6 +75,7 @@ def discover_yc_companies(exa, existing_domains, limit=500):
 
         print(f"  Searching: {query[:60]}...")
         try:
+            throttle(EXA_HOST)
             results = exa.search(
                 query,
                 num_results=per_query,
@@ -109,10 +109,8 @@ def discover_yc_companies(exa, existing_domains, limit=500):
                     'snippet': (getattr(r, 'text', '') or '')[:500],
                 })
 
-            time.sleep(1)
         except Exception as e:
             print(f"  [!] Search failed: {e}")
-            time.sleep(2)
 
     if filtered:
         print(f"  Filtered {filtered} junk results")
@@ -134,6 +132,7 @@ def research_company(exa, company):
             domain=company['domain'],
         )
         try:
+            throttle(EXA_HOST)
             results = exa.search(query, num_results=3)
             for r in results.results:
                 research['deep_research'].append({
@@ -142,10 +141,8 @@ def research_company(exa, company):
                     'url': getattr(r, 'url', ''),
                     'text': (getattr(r, 'text', '') or '')[:1000],
                 })
-            time.sleep(0.5)
         except Exception as e:
             print(f"    [!] Deep research failed: {e}")
-            time.sleep(1)
 
     return research
 
@@ -347,7 +344,6 @@ def run(limit=200, dry_run=False):
         if not contacts:
             print(f"    [void] No relevant contacts found")
             voided += 1
-            time.sleep(0.5)
             continue
 
         # Step 3: Verify emails via Prospeo
@@ -370,12 +366,9 @@ def run(limit=200, dry_run=False):
                     person.get('email') and person.get('title')):
                 valid_contacts.append(person)
 
-            time.sleep(0.3)  # Prospeo rate limit
-
         if not valid_contacts:
             print(f"    [void] No contacts with valid email")
             voided += 1
-            time.sleep(0.5)
             continue
 
         # Extract org data from first contact's Apollo response
@@ -402,8 +395,6 @@ def run(limit=200, dry_run=False):
             print(f"    [!] Failed to save account")
             voided += 1
 
-        time.sleep(0.5)
-
     # Summary
     print(f"\n{'=' * 60}")
     print(f"  SUMMARY {'(DRY RUN)' if dry_run else ''}")
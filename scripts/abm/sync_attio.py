@@ -4,8 +4,12 @@
 Pushes companies + contacts from local crm.db to Attio,
 links contacts to companies, and sets the ABM landing page URL.
 
+Accounts are synced by a bounded worker pool; Attio's rate limits are
+enforced by the token buckets in config.api_request. Finished account IDs
+are checkpointed so an interrupted sync resumes where it stopped.
+
 Usage:
-  python3 scripts/abm/sync_attio.py [--limit 100] [--dry-run]
+  python3 scripts/abm/sync_attio.py sync [--limit 100] [--dry-run] [--workers 8] [--restart]
 """
 
 import argparse
@@ -13,6 +17,7 @@ import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -22,8 +27,26 @@ from db_supabase import get_supabase
 from name_validation import classify_junk_name
 from qualify import is_actionable_contact, get_qualified_accounts
 
+# Concurrent accounts in flight; the Attio token buckets set the real pace
+SYNC_WORKERS = 8
+
+# Account IDs per landing_pages `in_` query (keeps the PostgREST URL short)
+LANDING_PAGE_BATCH = 200
+
+CHECKPOINT_PATH = os.path.join(SCRIPT_DIR, '.sync_attio_checkpoint.json')
+CHECKPOINT_MAX_AGE = 24 * 3600  # older checkpoints are stale data, start over
+CHECKPOINT_EVERY = 10  # flush the checkpoint after this many finished accounts
+
+
+def _log(lines, message):
+    """Append to a worker's buffered output, or print when called directly."""
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
 
-def upsert_company(account, abm_page_url=None, dry_run=False):
+def upsert_company(account, abm_page_url=None, dry_run=False, lines=None):
     """Upsert a company in Attio using domain as matching attribute."""
     research = {}
     if account.get('exa_research'):
@@ -81,7 +104,7 @@ def upsert_company(account, abm_page_url=None, dry_run=False):
         payload['data']['values']['description'] = [{'value': description}]
 
     if dry_run:
-        print(f"    [DRY RUN] Would upsert company: {account['name']} ({account['domain']})")
+        _log(lines, f"    [DRY RUN] Would upsert company: {account['name']} ({account['domain']})")
         return {'id': {'record_id': 'dry-run'}}
 
     try:
@@ -95,11 +118,11 @@ def upsert_company(account, abm_page_url=None, dry_run=False):
         data = resp.json().get('data', {})
         return data.get('id', {})
     except Exception as e:
-        print(f"    [!] Attio company upsert failed: {e}")
+        _log(lines, f"    [!] Attio company upsert failed: {e}")
         return None
 
 
-def link_person_to_company(person_record_id, company_record_id, dry_run=False):
+def link_person_to_company(person_record_id, company_record_id, dry_run=False, lines=None):
     """Link a person record to a company record in Attio.
 
     Uses PATCH on the person record to set the 'company' record-reference attribute.
@@ -124,14 +147,14 @@ def link_person_to_company(person_record_id, company_record_id, dry_run=False):
         resp = api_request('PATCH', url, json=payload, headers=get_attio_headers(), timeout=15)
         if resp.status_code in (200, 201):
             return True
-        print(f"    [!] Link failed ({resp.status_code}): {resp.text[:200]}")
+        _log(lines, f"    [!] Link failed ({resp.status_code}): {resp.text[:200]}")
         return False
     except Exception as e:
-        print(f"    [!] Link error: {e}")
+        _log(lines, f"    [!] Link error: {e}")
         return False
 
 
-def upsert_person(contact, company_record_id=None, abm_page_url=None, dry_run=False):
+def upsert_person(contact, company_record_id=None, abm_page_url=None, dry_run=False, lines=None):
     """Upsert a person in Attio using email as matching attribute.
 
     REQUIRES email — contacts without email are skipped to prevent
@@ -177,7 +200,7 @@ def upsert_person(contact, company_record_id=None, abm_page_url=None, dry_run=Fa
     }
 
     if dry_run:
-        print(f"    [DRY RUN] Would upsert person: {first} {last} ({contact['email']})")
+        _log(lines, f"    [DRY RUN] Would upsert person: {first} {last} ({contact['email']})")
         return {'id': {'record_id': 'dry-run'}}
 
     # Always PUT with email matching — never POST (which creates duplicates)
@@ -193,19 +216,19 @@ def upsert_person(contact, company_record_id=None, abm_page_url=None, dry_run=Fa
         if person_id and company_record_id:
             person_record_id = person_id.get('record_id') if isinstance(person_id, dict) else None
             if person_record_id:
-                link_person_to_company(person_record_id, company_record_id, dry_run=dry_run)
+                link_person_to_company(person_record_id, company_record_id, dry_run=dry_run, lines=lines)
 
         return person_id
 
     except Exception as e:
-        print(f"    [!] Attio person upsert failed: {e}")
+        _log(lines, f"    [!] Attio person upsert failed: {e}")
         return None
 
 
-def add_company_note(company_record_id, title, body, dry_run=False):
+def add_company_note(company_record_id, title, body, dry_run=False, lines=None):
     """Add a note to a company record in Attio."""
     if dry_run:
-        print(f"    [DRY RUN] Would add note: {title}")
+        _log(lines, f"    [DRY RUN] Would add note: {title}")
         return True
 
     payload = {
@@ -222,7 +245,7 @@ def add_company_note(company_record_id, title, body, dry_run=False):
         resp.raise_for_status()
         return True
     except Exception as e:
-        print(f"    [!] Note creation failed: {e}")
+        _log(lines, f"    [!] Note creation failed: {e}")
         return False
 
 
@@ -241,7 +264,7 @@ def get_company_notes(company_record_id):
     return []
 
 
-def add_enrichment_note(account, company_record_id, actionable_count, dry_run=False):
+def add_enrichment_note(account, company_record_id, actionable_count, dry_run=False, lines=None):
     """Add a structured enrichment note to a company if one doesn't exist yet."""
     # Check for existing enrichment note
     existing_notes = get_company_notes(company_record_id)
@@ -251,41 +274,41 @@ def add_enrichment_note(account, company_record_id, actionable_count, dry_run=Fa
             return False  # Already has one
 
     # Build note body from enrichment data
-    lines = []
+    body_lines = []
 
     industry = account.get('industry') or ''
     if industry:
-        lines.append(f"Industry: {industry}")
+        body_lines.append(f"Industry: {industry}")
 
     icp_score = account.get('icp_score')
     if icp_score:
-        lines.append(f"ICP Score: {icp_score}/100")
+        body_lines.append(f"ICP Score: {icp_score}/100")
 
     tech_stack = account.get('tech_stack') or ''
     if tech_stack:
         if isinstance(tech_stack, list):
             tech_stack = ', '.join(tech_stack)
-        lines.append(f"Tech Stack: {tech_stack}")
+        body_lines.append(f"Tech Stack: {tech_stack}")
 
     employee_count = account.get('employee_count')
     if employee_count:
-        lines.append(f"Employees: {employee_count}")
+        body_lines.append(f"Employees: {employee_count}")
 
-    lines.append(f"Actionable Contacts: {actionable_count}")
+    body_lines.append(f"Actionable Contacts: {actionable_count}")
 
     # Landing page URL
     lp_url = account.get('_landing_page_url')
     if lp_url:
-        lines.append(f"Landing Page: {lp_url}")
+        body_lines.append(f"Landing Page: {lp_url}")
 
-    if not lines:
+    if not body_lines:
         return False
 
-    body = '\n'.join(lines)
-    return add_company_note(company_record_id, 'Enrichment Summary', body, dry_run=dry_run)
+    body = '\n'.join(body_lines)
+    return add_company_note(company_record_id, 'Enrichment Summary', body, dry_run=dry_run, lines=lines)
 
 
-def sync_engagement(sb, account, company_record_id, dry_run=False):
+def sync_engagement(sb, account, company_record_id, dry_run=False, lines=None):
     """Push outreach engagement data to Attio for a single account."""
     outreach_status = account.get('outreach_status', 'new')
     if outreach_status == 'new':
@@ -320,17 +343,142 @@ def sync_engagement(sb, account, company_record_id, dry_run=False):
             note_body = f"Reply detected at {r['replied_at']}. Account status: {outreach_status}."
             if opted_out:
                 note_body += " Contact has opted out of future emails."
-            add_company_note(company_record_id, note_title, note_body, dry_run=dry_run)
+            add_company_note(company_record_id, note_title, note_body, dry_run=dry_run, lines=lines)
 
     if dry_run:
-        print(f"    [DRY RUN] Engagement: {status_label}")
+        _log(lines, f"    [DRY RUN] Engagement: {status_label}")
+
+
+def prefetch_landing_pages(sb, account_ids):
+    """Map account_id -> landing page URL with batched `in_` queries."""
+    urls = {}
+    ids = list(account_ids)
+    for i in range(0, len(ids), LANDING_PAGE_BATCH):
+        batch = ids[i:i + LANDING_PAGE_BATCH]
+        result = sb.table('landing_pages').select('account_id, url').in_('account_id', batch).execute()
+        for row in result.data or []:
+            urls.setdefault(row['account_id'], row['url'])
+    return urls
+
+
+def load_checkpoint(mode):
+    """Return (synced account IDs, started_at) from an interrupted run.
+
+    started_at is when the interrupted run began; resumed runs keep it, so
+    a checkpoint expires CHECKPOINT_MAX_AGE after the original run no
+    matter how many times it is resumed. Returns (set(), None) when there
+    is no usable checkpoint.
+    """
+    try:
+        with open(CHECKPOINT_PATH) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return set(), None
+    if data.get('mode') != mode:
+        return set(), None
+    started_at = data.get('started_at', 0)
+    if time.time() - started_at > CHECKPOINT_MAX_AGE:
+        return set(), None
+    return set(data.get('done', [])), started_at
+
+
+def save_checkpoint(mode, done, started_at):
+    """Write the synced account IDs atomically (tmp file + rename)."""
+    tmp = CHECKPOINT_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'mode': mode, 'started_at': started_at, 'done': sorted(done, key=str)}, f)
+    os.replace(tmp, CHECKPOINT_PATH)
+
+
+def clear_checkpoint():
+    """Remove the checkpoint once a sync has run to completion."""
+    try:
+        os.remove(CHECKPOINT_PATH)
+    except FileNotFoundError:
+        pass
+
+
+def sync_account(sb, account, abm_page_url, dry_run=False):
+    """Sync one account (company, contacts, notes, engagement) to Attio.
+
+    Runs on a worker thread. Progress lines are collected and returned
+    rather than printed, so each account's output stays together.
+
+    Returns:
+        dict with 'company' (bool), 'contacts', 'skipped' counts and 'lines'
+    """
+    stats = {'company': False, 'contacts': 0, 'skipped': 0, 'lines': []}
+
+    # exa_research is already a dict from JSONB
+    if isinstance(account.get('exa_research'), str):
+        try:
+            account['exa_research'] = json.loads(account['exa_research'])
+        except (json.JSONDecodeError, TypeError):
+            account['exa_research'] = {}
+
+    account['_landing_page_url'] = abm_page_url
 
+    # Upsert company
+    company_id = upsert_company(account, abm_page_url=abm_page_url, dry_run=dry_run, lines=stats['lines'])
+    if not company_id:
+        stats['lines'].append("    [!] Failed to upsert company, skipping contacts")
+        return stats
 
-def run(limit=100, dry_run=False, full=False):
+    company_record_id = company_id.get('record_id') if isinstance(company_id, dict) else None
+    stats['company'] = True
+
+    # Get contacts - use pre-filtered actionable contacts when available
+    if account.get('actionable_contacts') is not None:
+        contacts = account['actionable_contacts']
+    else:
+        # Full mode: fetch all contacts, skip non-actionable
+        contacts_result = sb.table('contacts').select(
+            'id, first_name, last_name, email, title, linkedin_url, vibe, notes'
+        ).eq('account_id', account['id']).order('is_primary', desc=True).order('id').execute()
+        contacts = contacts_result.data or []
+
+    for contact in contacts:
+        # Always enforce quality gate — email + relevant title required
+        if not is_actionable_contact(contact):
+            stats['skipped'] += 1
+            continue
+
+        person_id = upsert_person(
+            contact,
+            company_record_id=company_record_id,
+            abm_page_url=abm_page_url,
+            dry_run=dry_run,
+            lines=stats['lines'],
+        )
+        if person_id:
+            stats['contacts'] += 1
+            stats['lines'].append(
+                f"    + {contact.get('first_name', '')} {contact.get('last_name', '')} - {contact.get('title', '')}"
+            )
+
+    # Add enrichment note if we have data
+    if company_record_id:
+        actionable_count = len(account.get('actionable_contacts') or [])
+        add_enrichment_note(account, company_record_id, actionable_count, dry_run=dry_run,
+                            lines=stats['lines'])
+
+    # Sync engagement data
+    if company_record_id:
+        sync_engagement(sb, account, company_record_id, dry_run=dry_run, lines=stats['lines'])
+
+    return stats
+
+
+def run(limit=100, dry_run=False, full=False, workers=SYNC_WORKERS, restart=False):
     """Sync qualified accounts and actionable contacts to Attio.
 
     Default: only syncs accounts with at least 1 actionable contact.
     Use full=True to bypass qualification (with warning).
+
+    Accounts finished by an interrupted run are skipped unless restart=True.
+    A run that reaches the end clears the checkpoint, even if some accounts
+    failed: those are simply retried, with everything else, next run.
+    Dry runs neither read nor write the checkpoint.
     """
     if full:
         print(f"\n  [!] WARNING: --full bypasses qualification. Unqualified accounts will sync.")
@@ -356,73 +504,68 @@ def run(limit=100, dry_run=False, full=False):
         # Default: only sync qualified accounts
         accounts = get_qualified_accounts(sb, limit=limit)
 
-    print(f"  Found {len(accounts)} accounts to sync\n")
+    print(f"  Found {len(accounts)} accounts to sync")
+
+    checkpoint_mode = 'full' if full else 'qualified'
+    done, started_at = set(), None
+    if not dry_run and not restart:
+        done, started_at = load_checkpoint(checkpoint_mode)
+        if done:
+            accounts = [a for a in accounts if a['id'] not in done]
+            print(f"  Resuming: {len(done)} already synced, {len(accounts)} remaining")
+    print()
+    if started_at is None:
+        started_at = time.time()
+
+    landing_pages = prefetch_landing_pages(sb, [a['id'] for a in accounts])
 
     synced_companies = 0
     synced_contacts = 0
     skipped_contacts = 0
+    finished = 0
+    interrupted = False
 
-    for i, account in enumerate(accounts):
-        print(f"  [{i+1}/{len(accounts)}] {account['name']} ({account['domain']})")
-
-        # exa_research is already a dict from JSONB
-        if isinstance(account.get('exa_research'), str):
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    futures = {
+        executor.submit(sync_account, sb, account, landing_pages.get(account['id']), dry_run): account
+        for account in accounts
+    }
+    try:
+        for future in as_completed(futures):
+            account = futures[future]
+            finished += 1
             try:
-                account['exa_research'] = json.loads(account['exa_research'])
-            except (json.JSONDecodeError, TypeError):
-                account['exa_research'] = {}
-
-        # Get landing page URL from Supabase
-        lp_result = sb.table('landing_pages').select('url').eq('account_id', account['id']).limit(1).execute()
-        abm_page_url = lp_result.data[0]['url'] if lp_result.data else None
-        account['_landing_page_url'] = abm_page_url
-
-        # Upsert company
-        company_id = upsert_company(account, abm_page_url=abm_page_url, dry_run=dry_run)
-        if not company_id:
-            print(f"    [!] Failed to upsert company, skipping contacts")
-            continue
-
-        company_record_id = company_id.get('record_id') if isinstance(company_id, dict) else None
-        synced_companies += 1
+                stats = future.result()
+            except Exception as e:
+                stats = {'company': False, 'contacts': 0, 'skipped': 0,
+                         'lines': [f"    [!] Sync failed: {e}"]}
+
+            print(f"  [{finished}/{len(accounts)}] {account['name']} ({account['domain']})")
+            for line in stats['lines']:
+                print(line)
+
+            synced_contacts += stats['contacts']
+            skipped_contacts += stats['skipped']
+            if stats['company']:
+                synced_companies += 1
+                done.add(account['id'])
+                if not dry_run and finished % CHECKPOINT_EVERY == 0:
+                    # Kept only if this run dies before the end
+                    save_checkpoint(checkpoint_mode, done, started_at)
+    except KeyboardInterrupt:
+        interrupted = True
+        executor.shutdown(wait=False, cancel_futures=True)
+    else:
+        executor.shutdown()
 
-        # Get contacts - use pre-filtered actionable contacts when available
-        if account.get('actionable_contacts') is not None:
-            contacts = account['actionable_contacts']
+    if not dry_run:
+        if interrupted:
+            save_checkpoint(checkpoint_mode, done, started_at)
         else:
-            # Full mode: fetch all contacts, skip non-actionable
-            contacts_result = sb.table('contacts').select(
-                'id, first_name, last_name, email, title, linkedin_url, vibe, notes'
-            ).eq('account_id', account['id']).order('is_primary', desc=True).order('id').execute()
-            contacts = contacts_result.data or []
-
-        for contact in contacts:
-            # Always enforce quality gate — email + relevant title required
-            if not is_actionable_contact(contact):
-                skipped_contacts += 1
-                continue
-
-            person_id = upsert_person(
-                contact,
-                company_record_id=company_record_id,
-                abm_page_url=abm_page_url,
-                dry_run=dry_run,
-            )
-            if person_id:
-                synced_contacts += 1
-                print(f"    + {contact.get('first_name', '')} {contact.get('last_name', '')} - {contact.get('title', '')}")
-
-        # Add enrichment note if we have data
-        if company_record_id:
-            actionable_count = len(account.get('actionable_contacts', []))
-            add_enrichment_note(account, company_record_id, actionable_count, dry_run=dry_run)
-
-        # Sync engagement data
-        if company_record_id:
-            sync_engagement(sb, account, company_record_id, dry_run=dry_run)
-
-        time.sleep(0.5)  # Be nice to Attio
+            clear_checkpoint()
 
+    if interrupted:
+        print(f"\n  Interrupted. Progress saved; rerun to resume ({len(done)} accounts done).")
     print(f"\n  Sync complete. {synced_companies} companies, {synced_contacts} contacts pushed to Attio.")
     if skipped_contacts:
         print(f"  Skipped {skipped_contacts} non-actionable contacts.")
@@ -458,7 +601,6 @@ def cleanup_phantom_companies(dry_run=False):
         offset = data.get('next_cursor')
         if not offset or not batch:
             break
-        time.sleep(0.3)
 
     print(f"  {len(attio_companies)} companies in Attio")
 
@@ -507,7 +649,6 @@ def cleanup_phantom_companies(dry_run=False):
                 deleted += 1
             else:
                 print(f"    [!] Failed to delete {p['name']}: {resp.status_code}")
-            time.sleep(0.3)
         except Exception as e:
             print(f"    [!] Error deleting {p['name']}: {e}")
 
@@ -550,6 +691,10 @@ if __name__ == "__main__":
     sync_parser.add_argument('--limit', type=int, default=100)
     sync_parser.add_argument('--dry-run', action='store_true', help='Preview without pushing')
     sync_parser.add_argument('--full', action='store_true', help='Sync ALL accounts (bypass outreach gate)')
+    sync_parser.add_argument('--workers', type=int, default=SYNC_WORKERS,
+                             help=f'Accounts synced concurrently (default: {SYNC_WORKERS})')
+    sync_parser.add_argument('--restart', action='store_true',
+                             help='Ignore the checkpoint from an interrupted sync')
 
     # Phantom cleanup
     cleanup_parser = sub.add_parser('cleanup-phantoms', help='Delete Attio companies not in Supabase')
@@ -569,4 +714,6 @@ if __name__ == "__main__":
         limit = getattr(args, 'limit', 100)
         dry_run = getattr(args, 'dry_run', False)
         full = getattr(args, 'full', False)
-        run(limit=limit, dry_run=dry_run, full=full)
+        workers = getattr(args, 'workers', SYNC_WORKERS)
+        restart = getattr(args, 'restart', False)
+        run(limit=limit, dry_run=dry_run, full=full, workers=workers, restart=restart)
@@ -11,14 +11,23 @@ Usage:
   is_relevant_title("VP of Sales")  # True
   is_relevant_title("HR Manager")   # False
 
+  # Decision plus the rule that decided it, single or batched
+  classify_title("HR Manager")              # (False, 'blocklist:hr ')
+  classify_titles(["VP of Sales", "CTO"])   # [(True, 'allowlist:sales'), (False, 'blocklist_exact:cto')]
+
   # Bulk flag existing contacts
   python3 scripts/abm/title_filter.py --dry-run
   python3 scripts/abm/title_filter.py --flag
+
+  # Print the SQL twin of is_relevant_title (see migrations/002)
+  python3 scripts/abm/title_filter.py --sql
 """
 
 import argparse
 import os
+import re
 import sys
+from functools import lru_cache
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -79,6 +88,72 @@ SENIOR_PREFIXES = [
 ]
 
 
+def _trie_regex(words):
+    """Compile keywords into one trie-shaped alternation.
+
+    Shared prefixes are factored out, so the regex engine tests each
+    position in O(keyword length) instead of once per keyword. A keyword
+    that is a prefix of a longer one ends its branch: for "contains any
+    keyword" the shorter match already decides.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node):
+        if '' in node:
+            return ''
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    return build(trie)
+
+
+# One pattern, one match() call: lookaheads are tried in rule priority order
+# (exact-word block, substring block, allow, senior prefix) and the named
+# group that matched is both the decision and the rule.
+_SEPARATOR = r'\s,\-'  # split() whitespace plus the ',' and '-' the exact check splits on
+_TITLE_MATCHER = re.compile(
+    rf'(?=.*?(?<![^{_SEPARATOR}])(?P<blocklist_exact>{_trie_regex(BLOCKLIST_EXACT)})(?![^{_SEPARATOR}]))'
+    rf'|(?=.*?(?P<blocklist>{_trie_regex(BLOCKLIST)}))'
+    rf'|(?=.*?(?P<allowlist>{_trie_regex(ALLOWLIST)}))'
+    rf'|(?=(?P<senior_prefix>{_trie_regex(SENIOR_PREFIXES)}))',
+    re.DOTALL,
+)
+_RELEVANT_RULES = {'allowlist', 'senior_prefix'}
+
+
+@lru_cache(maxsize=65536)
+def classify_title(title):
+    """Classify a job title in a single regex pass.
+
+    Returns:
+        (relevant, rule) where rule is '<list>:<keyword>' for the rule that
+        decided, e.g. 'blocklist:recruit' or 'allowlist:sales', or None when
+        the title is empty or matches nothing (not relevant).
+    """
+    if not title:
+        return False, None
+    match = _TITLE_MATCHER.match(title.lower().strip())
+    if not match:
+        return False, None
+    rule = match.lastgroup
+    return rule in _RELEVANT_RULES, f'{rule}:{match.group(rule)}'
+
+
+def classify_titles(titles):
+    """Classify a list/column of titles, classifying each distinct title once.
+
+    Returns:
+        list of (relevant, rule) tuples aligned with `titles`
+    """
+    decided = {title: classify_title(title) for title in set(titles)}
+    return [decided[title] for title in titles]
+
+
 def is_relevant_title(title):
     """Check if a job title is relevant for GTM outreach.
 
@@ -86,32 +161,50 @@ def is_relevant_title(title):
     growth, or customer success function. Returns False for HR,
     engineering, product, legal, finance, and other non-GTM roles.
     """
-    if not title:
-        return False
-    title_lower = title.lower().strip()
+    return classify_title(title)[0]
 
-    # Check exact-match blocklist (whole title matches like "ceo", "cto")
-    title_words = set(title_lower.replace(',', ' ').replace('-', ' ').split())
-    for exact in BLOCKLIST_EXACT:
-        if exact in title_words:
-            return False
 
-    # Check substring blocklist (higher priority than allowlist)
-    for blocked in BLOCKLIST:
-        if blocked in title_lower:
-            return False
+def _sql_array(values, pattern='{}'):
+    """Render strings as a Postgres text[] literal of LIKE patterns."""
+    escaped = []
+    for value in values:
+        value = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        escaped.append("'" + pattern.format(value).replace("'", "''") + "'")
+    return 'ARRAY[' + ', '.join(escaped) + ']'
 
-    # Check allowlist
-    for allowed in ALLOWLIST:
-        if allowed in title_lower:
-            return True
 
-    # Senior titles without specific function - borderline relevant
-    for prefix in SENIOR_PREFIXES:
-        if title_lower.startswith(prefix):
-            return True
+def sql_title_function():
+    """Return CREATE FUNCTION SQL mirroring is_relevant_title.
 
-    return False
+    Generated from the lists above so the stored contacts.is_relevant_title
+    flag (maintained by a trigger, see migrations/002) can't drift from the
+    Python rules. Re-run `title_filter.py --sql` after editing the lists.
+    """
+    return f"""CREATE OR REPLACE FUNCTION public.abm_is_relevant_title(title text)
+RETURNS boolean
+LANGUAGE plpgsql IMMUTABLE
+AS $$
+DECLARE
+    t text := lower(btrim(coalesce(title, ''), E' \\t\\n\\r\\f\\013'));
+BEGIN
+    IF t = '' THEN
+        RETURN false;
+    END IF;
+    -- Exact-word blocklist
+    IF regexp_split_to_array(translate(t, ',-', '  '), '\\s+') && {_sql_array(BLOCKLIST_EXACT)} THEN
+        RETURN false;
+    END IF;
+    -- Substring blocklist (beats the allowlist)
+    IF t LIKE ANY ({_sql_array(BLOCKLIST, '%{}%')}) THEN
+        RETURN false;
+    END IF;
+    IF t LIKE ANY ({_sql_array(ALLOWLIST, '%{}%')}) THEN
+        RETURN true;
+    END IF;
+    -- Senior titles without a specific function
+    RETURN t LIKE ANY ({_sql_array(SENIOR_PREFIXES, '{}%')});
+END;
+$$;"""
 
 
 def flag_irrelevant_contacts(dry_run=False):
@@ -129,7 +222,9 @@ def flag_irrelevant_contacts(dry_run=False):
     irrelevant = 0
     no_title = 0
 
-    for contact in contacts:
+    decisions = classify_titles([c.get('title', '') for c in contacts])
+
+    for contact, (is_relevant, rule) in zip(contacts, decisions):
         title = contact.get('title', '')
         name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
 
@@ -137,12 +232,12 @@ def flag_irrelevant_contacts(dry_run=False):
             no_title += 1
             continue
 
-        if is_relevant_title(title):
+        if is_relevant:
             relevant += 1
         else:
             irrelevant += 1
             if dry_run:
-                print(f"  [irrelevant] {name:30s} | {title}")
+                print(f"  [irrelevant] {name:30s} | {title}  ({rule or 'no match'})")
             else:
                 notes = contact.get('notes', '') or ''
                 if '[auto-flagged]' not in notes:
@@ -164,9 +259,12 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Flag contacts with irrelevant titles')
     parser.add_argument('--dry-run', action='store_true', help='Preview without flagging')
     parser.add_argument('--flag', action='store_true', help='Actually flag irrelevant contacts')
+    parser.add_argument('--sql', action='store_true', help='Print the SQL abm_is_relevant_title function')
     args = parser.parse_args()
 
-    if args.flag or args.dry_run:
+    if args.sql:
+        print(sql_title_function())
+    elif args.flag or args.dry_run:
         flag_irrelevant_contacts(dry_run=args.dry_run)
     else:
         parser.print_help()
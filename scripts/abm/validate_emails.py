@@ -5,22 +5,33 @@ Checks every contact email domain for MX records and classifies the
 email provider (Google Workspace, Microsoft 365, Other). Optionally
 does SMTP RCPT TO validation to check if the mailbox exists.
 
-Results stored in Supabase contacts table (notes field until dedicated
-columns are added via migration).
+MX lookups are resolved once per domain, fanned out over a thread pool
+and cached on disk (scripts/abm/.mx_cache.json) with a TTL, so repeat
+runs skip DNS for known domains. SMTP probes reuse one connection per
+MX host for many recipients, with a cap on connections per host.
+
+Results stored in Supabase contacts table, written in bulk (one update
+per provider/status group).
 
 Usage:
   python3 scripts/abm/validate_emails.py --dry-run
   python3 scripts/abm/validate_emails.py --limit 50
   python3 scripts/abm/validate_emails.py --limit 50 --smtp-check
+  python3 scripts/abm/validate_emails.py --limit 10000 --smtp-check --workers 16
 """
 
 import argparse
+import dns.exception
 import dns.resolver
+import json
 import os
 import smtplib
 import socket
 import sys
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -36,27 +47,103 @@ MICROSOFT_MX = ['outlook', 'microsoft', 'office365', 'protection.outlook']
 ZOHO_MX = ['zoho']
 PROTONMAIL_MX = ['protonmail', 'proton']
 
-# Cache MX lookups per domain (avoids redundant DNS queries)
+# MX cache: persisted across runs, positive answers live longer than misses
+MX_CACHE_PATH = os.path.join(SCRIPT_DIR, '.mx_cache.json')
+MX_CACHE_TTL = 7 * 24 * 3600
+MX_NEGATIVE_TTL = 6 * 3600
+DNS_TIMEOUT = 5
+DNS_WORKERS = 32
+
+# SMTP probing: pool size overall, connections per MX host, and how many
+# RCPTs share one MAIL FROM before an RSET
+SMTP_WORKERS = 8
+SMTP_PER_HOST = 2
+SMTP_RCPT_PER_MAIL = 25
+SMTP_TIMEOUT = 10
+
+PAGE_SIZE = 1000
+UPDATE_BATCH = 200
+
+# Domain -> {'mx': [[priority, exchange], ...], 'checked_at': epoch}
 _mx_cache = {}
+_mx_cache_lock = threading.Lock()
+_mx_cache_loaded = False
+
+
+def load_mx_cache():
+    """Load the on-disk MX cache into memory (once per process)."""
+    global _mx_cache_loaded
+    with _mx_cache_lock:
+        if _mx_cache_loaded:
+            return
+        try:
+            with open(MX_CACHE_PATH) as f:
+                _mx_cache.update(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            pass
+        _mx_cache_loaded = True
+
+
+def save_mx_cache():
+    """Write the MX cache atomically (tmp file + rename), dropping expired entries."""
+    now = time.time()
+    with _mx_cache_lock:
+        fresh = {d: e for d, e in _mx_cache.items()
+                 if e.get('checked_at') and not _expired(e, now)}
+    tmp = MX_CACHE_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(fresh, f, sort_keys=True)
+    os.replace(tmp, MX_CACHE_PATH)
+
+
+def _expired(entry, now):
+    ttl = MX_CACHE_TTL if entry['mx'] else MX_NEGATIVE_TTL
+    return now - entry['checked_at'] > ttl
 
 
 def get_mx_records(domain):
-    """Get MX records for a domain. Returns list of (priority, exchange) tuples."""
-    if domain in _mx_cache:
-        return _mx_cache[domain]
+    """Get MX records for a domain. Returns list of (priority, exchange) tuples.
 
+    Answers (and NXDOMAIN/no-MX misses) are cached with a TTL. Transient
+    failures (timeouts, no reachable nameservers) only stick for the
+    current run so the next run asks again.
+    """
+    load_mx_cache()
+    domain = domain.lower()
+    with _mx_cache_lock:
+        entry = _mx_cache.get(domain)
+    if entry and (not entry['checked_at'] or not _expired(entry, time.time())):
+        return [tuple(r) for r in entry['mx']]
+
+    checked_at = time.time()
     try:
-        answers = dns.resolver.resolve(domain, 'MX')
+        answers = dns.resolver.resolve(domain, 'MX', lifetime=DNS_TIMEOUT)
         records = sorted(
             [(r.preference, str(r.exchange).rstrip('.').lower()) for r in answers],
             key=lambda x: x[0]
         )
-        _mx_cache[domain] = records
-        return records
-    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN,
-            dns.resolver.NoNameservers, dns.exception.Timeout) as e:
-        _mx_cache[domain] = []
-        return []
+    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
+        records = []
+    except (dns.resolver.NoNameservers, dns.exception.Timeout):
+        records = []
+        checked_at = 0  # transient: in-memory only, never persisted
+
+    with _mx_cache_lock:
+        _mx_cache[domain] = {'mx': [list(r) for r in records], 'checked_at': checked_at}
+    return records
+
+
+def resolve_domains(domains, workers=DNS_WORKERS):
+    """Resolve MX records for many domains concurrently.
+
+    Returns:
+        {domain: [(priority, exchange), ...]}
+    """
+    domains = sorted(set(domains))
+    if not domains:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(domains))) as pool:
+        return dict(zip(domains, pool.map(get_mx_records, domains)))
 
 
 def classify_provider(mx_records):
@@ -87,7 +174,76 @@ def classify_provider(mx_records):
     return 'other'
 
 
-def smtp_verify(email, mx_host, timeout=10):
+def _smtp_open(mx_host, timeout):
+    server = smtplib.SMTP(timeout=timeout)
+    server.connect(mx_host, 25)
+    server.helo('thegtmos.ai')
+    server.mail('verify@thegtmos.ai')
+    return server
+
+
+def smtp_verify_many(emails, mx_host, timeout=SMTP_TIMEOUT):
+    """SMTP RCPT TO checks for many mailboxes over one connection.
+
+    Each domain also gets one probe for a random mailbox: if the server
+    accepts that, the domain is catch-all and its 250s mean nothing.
+    A dropped connection is reopened once; anything still unchecked
+    after that is 'unknown'.
+
+    Returns:
+        {email: 'valid' | 'invalid' | 'catch_all' | 'unknown'}
+    """
+    results = {}
+    catch_all = {}
+    server = None
+    rcpts = 0
+    reconnected = False
+    pending = list(emails)
+
+    while pending:
+        email = pending[0]
+        domain = email.rsplit('@', 1)[-1].lower()
+        try:
+            if server is None:
+                server = _smtp_open(mx_host, timeout)
+                rcpts = 0
+            elif rcpts >= SMTP_RCPT_PER_MAIL:
+                server.rset()
+                server.mail('verify@thegtmos.ai')
+                rcpts = 0
+
+            if domain not in catch_all:
+                code, _ = server.rcpt(f'{uuid.uuid4().hex[:16]}@{domain}')
+                rcpts += 1
+                catch_all[domain] = code == 250
+
+            code, _ = server.rcpt(email)
+            rcpts += 1
+        except (smtplib.SMTPException, socket.error, OSError):
+            server = None
+            if reconnected:
+                results.update((e, 'unknown') for e in pending)
+                break
+            reconnected = True
+            continue
+
+        if code == 250:
+            results[email] = 'catch_all' if catch_all[domain] else 'valid'
+        elif code == 550:
+            results[email] = 'invalid'
+        else:
+            results[email] = 'unknown'
+        pending.pop(0)
+
+    if server is not None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, socket.error, OSError):
+            pass
+    return results
+
+
+def smtp_verify(email, mx_host, timeout=SMTP_TIMEOUT):
     """SMTP RCPT TO check to verify if mailbox exists.
 
     Returns: 'valid', 'invalid', 'catch_all', or 'unknown'
@@ -95,40 +251,88 @@ def smtp_verify(email, mx_host, timeout=10):
     Note: Many servers reject RCPT TO checks or return 250 for
     everything (catch-all). This is a best-effort check.
     """
-    try:
-        server = smtplib.SMTP(timeout=timeout)
-        server.connect(mx_host, 25)
-        server.helo('thegtmos.ai')
-        server.mail('verify@thegtmos.ai')
-        code, _ = server.rcpt(email)
-        server.quit()
+    return smtp_verify_many([email], mx_host, timeout)[email]
 
-        if code == 250:
-            return 'valid'
-        elif code == 550:
-            return 'invalid'
-        else:
-            return 'unknown'
 
-    except (smtplib.SMTPException, socket.error, OSError):
-        return 'unknown'
+def smtp_verify_all(emails_by_host, workers=SMTP_WORKERS, per_host=SMTP_PER_HOST):
+    """Probe mailboxes concurrently, at most `per_host` connections per MX host.
 
+    Args:
+        emails_by_host: {mx_host: [email, ...]}
 
-def run(limit=50, dry_run=False, smtp_check=False):
+    Returns:
+        {email: status}
+    """
+    tasks = []
+    for mx_host, emails in emails_by_host.items():
+        # Keep a domain's addresses together so its catch-all probe is shared
+        emails = sorted(emails, key=lambda e: e.rsplit('@', 1)[-1].lower())
+        chunks = min(per_host, len(emails))
+        size = -(-len(emails) // chunks)
+        tasks.extend((mx_host, emails[i:i + size]) for i in range(0, len(emails), size))
+
+    results = {}
+    if not tasks:
+        return results
+    with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = [pool.submit(smtp_verify_many, emails, mx_host) for mx_host, emails in tasks]
+        for future in as_completed(futures):
+            results.update(future.result())
+    return results
+
+
+def iter_contacts_with_email(sb, limit, page_size=PAGE_SIZE):
+    """Yield up to `limit` contacts with a non-empty email, keyset-paged by id."""
+    last_id = None
+    remaining = limit
+    while remaining > 0:
+        query = sb.table('contacts').select(
+            'id, first_name, last_name, email, account_id'
+        ).neq('email', '').not_.is_('email', 'null')
+        if last_id is not None:
+            query = query.gt('id', last_id)
+        size = min(page_size, remaining)
+        page = query.order('id').limit(size).execute().data or []
+        yield from page
+        remaining -= len(page)
+        if len(page) < size:
+            return
+        last_id = page[-1]['id']
+
+
+def write_results(sb, results):
+    """Write validation results with one update per (provider, status) group.
+
+    Args:
+        results: iterable of (contact id, {'mx_provider': ..., ['email_status': ...]})
+
+    Returns:
+        number of update requests made
+    """
+    groups = {}
+    for contact_id, updates in results:
+        groups.setdefault(tuple(sorted(updates.items())), []).append(contact_id)
+    requests_made = 0
+    for key, ids in groups.items():
+        for i in range(0, len(ids), UPDATE_BATCH):
+            sb.table('contacts').update(dict(key)).in_('id', ids[i:i + UPDATE_BATCH]).execute()
+            requests_made += 1
+    return requests_made
+
+
+def run(limit=50, dry_run=False, smtp_check=False, workers=SMTP_WORKERS):
     """Main validation: MX lookup + optional SMTP check for all contacts with email."""
     print(f"\n{'=' * 60}")
     print(f"  Email Validation {'(DRY RUN)' if dry_run else ''}")
     if smtp_check:
-        print(f"  SMTP verification: ENABLED")
+        print(f"  SMTP verification: ENABLED ({workers} workers, {SMTP_PER_HOST} per MX host)")
     print(f"{'=' * 60}\n")
 
+    started = time.monotonic()
     sb = get_supabase()
 
     # Get contacts with non-empty emails
-    result = sb.table('contacts').select(
-        'id, first_name, last_name, email, account_id, notes'
-    ).neq('email', '').not_.is_('email', 'null').order('id').limit(limit).execute()
-    contacts = result.data or []
+    contacts = list(iter_contacts_with_email(sb, limit))
 
     if not contacts:
         print("  No contacts with email addresses found.")
@@ -136,54 +340,76 @@ def run(limit=50, dry_run=False, smtp_check=False):
 
     print(f"  Found {len(contacts)} contacts with emails\n")
 
+    # One MX lookup per unique domain, concurrently, cache first
+    domains = {c['email'].split('@')[1].lower() for c in contacts if '@' in c['email']}
+    load_mx_cache()
+    with _mx_cache_lock:
+        cached = sum(1 for d in domains if d in _mx_cache)
+    mx_by_domain = resolve_domains(domains)
+    save_mx_cache()
+    print(f"  Resolved {len(domains)} domains ({cached} from cache) "
+          f"in {time.monotonic() - started:.1f}s\n")
+
+    # SMTP verification (optional), grouped by primary MX host
+    smtp_status = {}
+    if smtp_check:
+        emails_by_host = {}
+        for contact in contacts:
+            email = contact['email']
+            mx_records = mx_by_domain.get(email.split('@')[1].lower()) if '@' in email else None
+            if mx_records:
+                emails_by_host.setdefault(mx_records[0][1], []).append(email)
+        smtp_status = smtp_verify_all(emails_by_host, workers=workers)
+
     # Stats
     providers = {'google': 0, 'microsoft': 0, 'zoho': 0, 'protonmail': 0, 'other': 0, 'no_mx': 0}
     smtp_results = {'valid': 0, 'invalid': 0, 'catch_all': 0, 'unknown': 0}
     domains_checked = set()
+    results = []
 
     for i, contact in enumerate(contacts):
         email = contact['email']
         name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
-        domain = email.split('@')[1] if '@' in email else ''
+        domain = email.split('@')[1].lower() if '@' in email else ''
 
         if not domain:
             print(f"  [{i + 1}] {name} | {email} - invalid format")
             continue
 
-        # MX lookup (cached per domain)
-        mx_records = get_mx_records(domain)
+        mx_records = mx_by_domain[domain]
         provider = classify_provider(mx_records)
         providers[provider] += 1
 
         mx_display = mx_records[0][1] if mx_records else 'none'
         print(f"  [{i + 1}/{len(contacts)}] {name:25s} | {email:35s} | {provider:10s} | {mx_display}")
 
-        # SMTP verification (optional)
-        email_status = 'unchecked'
-        if smtp_check and mx_records and provider != 'no_mx':
-            primary_mx = mx_records[0][1]
-            email_status = smtp_verify(email, primary_mx)
+        email_status = smtp_status.get(email, 'unchecked')
+        if email_status != 'unchecked':
             smtp_results[email_status] += 1
             if email_status == 'invalid':
                 print(f"    [!] SMTP says INVALID")
             elif email_status == 'valid':
                 print(f"    [ok] SMTP verified")
 
-        # Update contact with validation results
-        if not dry_run:
-            updates = {'mx_provider': provider}
-            if smtp_check:
-                updates['email_status'] = email_status
-            sb.table('contacts').update(updates).eq('id', contact['id']).execute()
+        updates = {'mx_provider': provider}
+        if smtp_check:
+            updates['email_status'] = email_status
+        results.append((contact['id'], updates))
 
         domains_checked.add(domain)
 
+    # Update contacts with validation results
+    if not dry_run and results:
+        writes = write_results(sb, results)
+        print(f"\n  Updated {len(results)} contacts in {writes} bulk writes")
+
     # Summary
     print(f"\n{'=' * 60}")
     print(f"  SUMMARY {'(DRY RUN)' if dry_run else ''}")
     print(f"{'=' * 60}")
     print(f"  Contacts checked:  {len(contacts)}")
     print(f"  Unique domains:    {len(domains_checked)}")
+    print(f"  Elapsed:           {time.monotonic() - started:.1f}s")
     print(f"\n  Provider Distribution:")
     for provider, count in sorted(providers.items(), key=lambda x: -x[1]):
         if count > 0:
@@ -204,5 +430,7 @@ if __name__ == '__main__':
     parser.add_argument('--limit', type=int, default=50, help='Max contacts to check')
     parser.add_argument('--dry-run', action='store_true', help='Preview without updating')
     parser.add_argument('--smtp-check', action='store_true', help='Also do SMTP RCPT TO verification')
+    parser.add_argument('--workers', type=int, default=SMTP_WORKERS,
+                        help=f'Concurrent SMTP connections (default: {SMTP_WORKERS})')
     args = parser.parse_args()
-    run(limit=args.limit, dry_run=args.dry_run, smtp_check=args.smtp_check)
+    run(limit=args.limit, dry_run=args.dry_run, smtp_check=args.smtp_check, workers=args.workers)
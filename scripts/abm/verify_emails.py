@@ -14,7 +14,6 @@ Usage:
 import argparse
 import os
 import sys
-import time
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, SCRIPT_DIR)
@@ -110,7 +109,6 @@ def run(limit=50, dry_run=False):
         }).eq('id', contact['id']).execute()
 
         verified += 1
-        time.sleep(1.0)  # Rate limit
 
     # Summary
     print(f"\n{'=' * 60}")
@@ -13,11 +13,15 @@ import argparse
 import json
 import os
 import pathlib
-import time
+import sys
 from datetime import datetime, timezone
 
 import requests
 
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+import llm_client  # pooled, cached, rate-limited Grok/Claude calls
+
 REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
 LOG_DIR = REPO_ROOT / "data" / "agent-logs" / "scout"
 
@@ -31,12 +35,10 @@ if ENV_FILE.exists():
             os.environ.setdefault(key.strip(), val.strip())
 
 XAI_API_KEY = os.environ.get("XAI_API_KEY", "")
-XAI_BASE_URL = "https://api.x.ai/v1"
 MODEL = "grok-4-1-fast-non-reasoning"
 
 # Fallback: Claude Opus 4.6
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
-ANTHROPIC_BASE_URL = "https://api.anthropic.com/v1"
 FALLBACK_MODEL = "claude-opus-4-6"
 
 # ── Research missions ─────────────────────────────────────────────
@@ -89,112 +91,23 @@ Suggest:
 
 def claude_chat(messages: list) -> str:
     """Fallback to Claude Opus 4.6 via Anthropic API. No tool use (no x_search)."""
-    headers = {
-        "Content-Type": "application/json",
-        "x-api-key": ANTHROPIC_API_KEY,
-        "anthropic-version": "2023-06-01",
-    }
-
-    # Convert openai-style messages to Anthropic format
-    system = ""
-    anthropic_messages = []
-    for msg in messages:
-        if msg["role"] == "system":
-            system = msg.get("content", "")
-        elif msg["role"] in ("user", "assistant"):
-            anthropic_messages.append({"role": msg["role"], "content": msg["content"]})
-
-    payload = {
-        "model": FALLBACK_MODEL,
-        "max_tokens": 4096,
-        "temperature": 0.3,
-        "messages": anthropic_messages,
-    }
-    if system:
-        payload["system"] = system
-
-    resp = requests.post(
-        f"{ANTHROPIC_BASE_URL}/messages",
-        headers=headers,
-        json=payload,
-        timeout=90,
-    )
-    resp.raise_for_status()
-    data = resp.json()
-    return data["content"][0]["text"]
+    return llm_client.claude_chat(messages, model=FALLBACK_MODEL, api_key=ANTHROPIC_API_KEY)
 
 
 def grok_chat(messages: list, tools: list = None) -> dict:
     """Make a Grok API call with optional tools."""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {XAI_API_KEY}",
-    }
-
-    payload = {
-        "model": MODEL,
-        "messages": messages,
-        "stream": False,
-        "temperature": 0.3,
-    }
-
-    if tools:
-        payload["tools"] = tools
-
-    resp = requests.post(
-        f"{XAI_BASE_URL}/chat/completions",
-        headers=headers,
-        json=payload,
-        timeout=60,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    return llm_client.grok_chat(messages, tools, model=MODEL, api_key=XAI_API_KEY)
 
 
 def _handle_tool_loop(messages: list, tools: list, max_rounds: int = 5) -> str:
     """Call Grok with tools and follow the tool-call loop until we get content.
 
-    Grok's built-in x_search/web_search tools are server-side — the API
-    executes them and returns results inside the assistant message. But the
-    first response often has tool_calls with no content. We send back a
-    synthetic tool result to prompt Grok to summarize the findings.
-
-    web_search is especially stubborn — Grok may fire multiple rounds of
-    searches before producing a summary, so we allow up to 5 rounds and
-    escalate the nudge message after round 2.
+    Grok's built-in x_search/web_search tools are server-side; see
+    llm_client.grok_tool_loop for how the nudges and repeated searches
+    are handled. web_search is especially stubborn, hence 5 rounds.
     """
-    for round_num in range(max_rounds):
-        result = grok_chat(messages, tools)
-        msg = result["choices"][0]["message"]
-
-        # If there's content, we're done
-        content = msg.get("content") or ""
-        if content.strip():
-            return content
-
-        # If there are tool_calls, acknowledge them and ask for the summary
-        tool_calls = msg.get("tool_calls")
-        if not tool_calls:
-            return content  # no content and no tool calls — nothing more to do
-
-        # Append the assistant message with tool_calls
-        messages.append(msg)
-
-        # Escalate nudge after multiple rounds of tool calls
-        if round_num >= 2:
-            nudge = "You have enough data. Stop searching and summarize all findings now."
-        else:
-            nudge = "Search executed successfully. Summarize the findings."
-
-        # Send a tool result for each call so Grok can continue
-        for tc in tool_calls:
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tc["id"],
-                "content": nudge,
-            })
-
-    return ""
+    return llm_client.grok_tool_loop(messages, tools, max_rounds=max_rounds,
+                                     model=MODEL, api_key=XAI_API_KEY)
 
 
 def search_x(prompt: str) -> str:
@@ -377,7 +290,6 @@ def run_scout(test_mode: bool = False) -> dict:
                 "tags": search["tags"],
                 "raw": raw,
             })
-            time.sleep(1)
         except Exception as e:
             raw_findings.append({
                 "domain": search["domain"],
@@ -398,7 +310,6 @@ def run_scout(test_mode: bool = False) -> dict:
                 "tags": search["tags"],
                 "raw": raw,
             })
-            time.sleep(1)
         except Exception as e:
             raw_findings.append({
                 "domain": search["domain"],
@@ -463,6 +374,7 @@ def main():
 
     print("[scout] starting daily research...")
     briefing = run_scout(test_mode=args.test)
+    llm_client.print_metrics()
 
     if args.test:
         print(json.dumps(briefing, indent=2, default=str))
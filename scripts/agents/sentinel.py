@@ -4,21 +4,31 @@ Sentinel — System Health Monitor Agent
 Checks website uptime, RSS feeds, cron pipeline status, git sync, and disk usage.
 Runs every 4 hours via launchd on Mac Mini.
 
+All checks run concurrently (asyncio over a worker pool), HTTP checks share
+keep-alive connections capped per host, and each check's latency is folded
+into a histogram in data/agent-logs/sentinel/latency-history.json. A run
+takes about as long as its slowest check.
+
 Usage:
   python3 scripts/agents/sentinel.py           # full run
   python3 scripts/agents/sentinel.py --test    # dry run, prints to stdout
 """
 
 import argparse
+import asyncio
+import http.client
 import json
 import os
 import pathlib
 import shutil
 import subprocess
+import threading
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+from urllib.parse import urljoin, urlsplit
 
 REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
 LOG_DIR = REPO_ROOT / "data" / "agent-logs" / "sentinel"
@@ -45,53 +55,160 @@ RSS_FEEDS = [
 ]
 
 TIMEOUT = 10
+USER_AGENT = "Sentinel/1.0 (ShawnOS Health Monitor)"
+PER_HOST_LIMIT = 4      # concurrent requests (and pooled connections) per host
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+ATOM_ENTRY = "{http://www.w3.org/2005/Atom}entry"
+
+LATENCY_HISTORY_PATH = LOG_DIR / "latency-history.json"
+# Histogram bucket upper bounds in ms; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections shared across checks, capped per host."""
+
+    def __init__(self, per_host: int = PER_HOST_LIMIT, timeout: float = TIMEOUT):
+        self.per_host = per_host
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle = {}     # (scheme, host, port) -> [connection]
+        self._slots = {}    # (scheme, host, port) -> BoundedSemaphore
+
+    @contextmanager
+    def _host_slot(self, key):
+        with self._lock:
+            slot = self._slots.setdefault(key, threading.BoundedSemaphore(self.per_host))
+        with slot:
+            yield
+
+    def _connect(self, key):
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=self.timeout)
+
+    def _checkout(self, key):
+        """Return (connection, reused) — an idle keep-alive one if available."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def _checkin(self, key, conn, resp):
+        if resp.will_close:
+            conn.close()
+            return
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def get(self, url: str, handle_body):
+        """GET url (following redirects) and pass the final response to handle_body.
+
+        handle_body(resp) may stream the body; whatever it leaves unread is
+        drained so the connection can go back to the pool. Returns
+        (status, reason, handle_body's result).
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            key = (parts.scheme, parts.hostname, parts.port)
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            with self._host_slot(key):
+                conn, reused = self._checkout(key)
+                try:
+                    try:
+                        conn.request("GET", path, headers={"User-Agent": USER_AGENT})
+                        resp = conn.getresponse()
+                    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                        if not reused:
+                            raise
+                        # Server dropped an idle keep-alive connection — retry fresh once
+                        conn.close()
+                        conn = self._connect(key)
+                        conn.request("GET", path, headers={"User-Agent": USER_AGENT})
+                        resp = conn.getresponse()
+
+                    location = resp.getheader("Location")
+                    if resp.status in REDIRECT_STATUSES and location:
+                        resp.read()
+                        self._checkin(key, conn, resp)
+                        url = urljoin(url, location)
+                        continue
+
+                    result = handle_body(resp)
+                    resp.read()
+                    self._checkin(key, conn, resp)
+                    return resp.status, resp.reason, result
+                except BaseException:
+                    conn.close()
+                    raise
+        raise http.client.HTTPException(f"too many redirects ({MAX_REDIRECTS})")
+
+    def close(self):
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+def check_website(pool: ConnectionPool, url: str):
+    """HTTP GET one site; return its status code or an "error: ..." string."""
+    try:
+        status, reason, _ = pool.get(url, lambda resp: None)
+    except Exception as e:
+        return f"error: {e}"
+    if status >= 400:
+        return f"error: {reason}"
+    return status
 
 
-def check_websites() -> dict:
-    """HTTP GET each site, return status codes."""
-    results = {}
-    for name, url in WEBSITES.items():
-        try:
-            req = Request(url, method="GET")
-            req.add_header("User-Agent", "Sentinel/1.0 (ShawnOS Health Monitor)")
-            with urlopen(req, timeout=TIMEOUT) as resp:
-                results[name] = resp.status
-        except URLError as e:
-            results[name] = f"error: {e.reason}" if hasattr(e, "reason") else f"error: {e}"
-        except Exception as e:
-            results[name] = f"error: {e}"
-    return results
-
-
-def check_rss_feeds() -> dict:
-    """Validate RSS feeds — HTTP 200, valid XML, has <item> elements."""
-    valid = 0
-    invalid = 0
-    details = []
-    for url in RSS_FEEDS:
-        try:
-            req = Request(url, method="GET")
-            req.add_header("User-Agent", "Sentinel/1.0 (ShawnOS Health Monitor)")
-            with urlopen(req, timeout=TIMEOUT) as resp:
-                if resp.status != 200:
-                    invalid += 1
-                    details.append({"url": url, "issue": f"HTTP {resp.status}"})
-                    continue
-                body = resp.read()
-                root = ET.fromstring(body)
-                items = root.findall(".//{http://www.w3.org/2005/Atom}entry") or root.findall(".//item")
-                if len(items) == 0:
-                    invalid += 1
-                    details.append({"url": url, "issue": "no items/entries"})
-                else:
-                    valid += 1
-        except ET.ParseError:
-            invalid += 1
-            details.append({"url": url, "issue": "invalid XML"})
-        except Exception as e:
-            invalid += 1
-            details.append({"url": url, "issue": str(e)})
-    return {"valid": valid, "invalid": invalid, "details": details}
+def count_feed_items(stream) -> int:
+    """Stream-parse a feed and count RSS <item> / Atom <entry> elements.
+
+    Elements are cleared as soon as they close, so a large feed is never
+    held in memory whole. Raises ET.ParseError on malformed XML.
+    """
+    items = 0
+    for _, elem in ET.iterparse(stream, events=("end",)):
+        if elem.tag == ATOM_ENTRY or elem.tag == "item":
+            items += 1
+        elem.clear()
+    return items
+
+
+def check_rss_feed(pool: ConnectionPool, url: str):
+    """Validate one feed — HTTP 200, valid XML, has <item> elements.
+
+    Returns None when valid, else the issue string.
+    """
+    def parse_if_ok(resp):
+        return count_feed_items(resp) if resp.status == 200 else None
+
+    try:
+        status, reason, items = pool.get(url, parse_if_ok)
+    except ET.ParseError:
+        return "invalid XML"
+    except Exception as e:
+        return str(e)
+    if status >= 400:
+        return f"HTTP Error {status}: {reason}"
+    if status != 200:
+        return f"HTTP {status}"
+    if items == 0:
+        return "no items/entries"
+    return None
+
+
+def summarize_rss(issues: dict) -> dict:
+    """Fold per-feed results (url -> issue or None) into the report shape."""
+    details = [{"url": url, "issue": issue} for url, issue in issues.items() if issue]
+    return {
+        "valid": len(issues) - len(details),
+        "invalid": len(details),
+        "details": details,
+    }
 
 
 def check_cron_pipeline() -> dict:
@@ -156,31 +273,91 @@ def check_disk() -> dict:
     return {"usage_percent": percent}
 
 
+async def gather_checks() -> tuple:
+    """Run every check concurrently; return (websites, rss, cron, git, disk, latency_ms)."""
+    loop = asyncio.get_running_loop()
+    pool = ConnectionPool()
+    latency_ms = {}
+    jobs = (
+        [(f"website:{name}", check_website, (pool, url)) for name, url in WEBSITES.items()]
+        + [(f"rss:{url}", check_rss_feed, (pool, url)) for url in RSS_FEEDS]
+        + [("cron_pipeline", check_cron_pipeline, ()),
+           ("git_sync", check_git_sync, ()),
+           ("disk", check_disk, ())]
+    )
+
+    async def timed(executor, name, fn, args):
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        finally:
+            latency_ms[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    # One worker per check: blocking I/O never queues behind another check;
+    # the per-host cap lives in the pool
+    try:
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            results = await asyncio.gather(*(timed(executor, *job) for job in jobs))
+    finally:
+        pool.close()
+
+    by_name = dict(zip((job[0] for job in jobs), results))
+    websites = {name: by_name[f"website:{name}"] for name in WEBSITES}
+    rss = summarize_rss({url: by_name[f"rss:{url}"] for url in RSS_FEEDS})
+    return (websites, rss, by_name["cron_pipeline"], by_name["git_sync"],
+            by_name["disk"], latency_ms)
+
+
+def record_latency(latency_ms: dict) -> None:
+    """Fold this run's per-check latencies into the histogram history file."""
+    try:
+        history = json.loads(LATENCY_HISTORY_PATH.read_text())
+        if not isinstance(history, dict):
+            history = {}
+    except (OSError, json.JSONDecodeError):
+        history = {}
+
+    labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+    for name, ms in latency_ms.items():
+        entry = history.get(name)
+        if not isinstance(entry, dict) or entry.get("buckets", {}).keys() != set(labels):
+            entry = {"count": 0, "sum_ms": 0.0, "max_ms": 0.0, "buckets": {l: 0 for l in labels}}
+        bucket = next((l for b, l in zip(LATENCY_BUCKETS_MS, labels) if ms <= b), labels[-1])
+        entry["buckets"][bucket] += 1
+        entry["count"] += 1
+        entry["sum_ms"] = round(entry["sum_ms"] + ms, 1)
+        entry["max_ms"] = max(entry["max_ms"], ms)
+        entry["last_ms"] = ms
+        history[name] = entry
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = LATENCY_HISTORY_PATH.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(history, indent=2))
+    os.replace(tmp, LATENCY_HISTORY_PATH)
+
+
 def run_all_checks() -> dict:
     """Run all health checks and compile report."""
     now = datetime.now(timezone.utc)
     issues = []
 
-    websites = check_websites()
+    websites, rss, cron, git, disk, latency_ms = asyncio.run(gather_checks())
+
     for name, status in websites.items():
         if status != 200:
             issues.append(f"website {name}: {status}")
 
-    rss = check_rss_feeds()
     if rss["invalid"] > 0:
         for detail in rss["details"]:
             issues.append(f"rss {detail['url']}: {detail['issue']}")
 
-    cron = check_cron_pipeline()
     # Only flag missing daily JSON after 1am (give cron time to run)
     if not cron["today_json_exists"] and now.hour >= 1:
         issues.append(f"cron pipeline: no daily JSON for {now.strftime('%Y-%m-%d')}")
 
-    git = check_git_sync()
     if git.get("behind", 0) > 3:
         issues.append(f"git: {git['behind']} commits behind origin/main")
 
-    disk = check_disk()
     if disk["usage_percent"] > 85:
         issues.append(f"disk: {disk['usage_percent']}% used")
 
@@ -213,6 +390,7 @@ def run_all_checks() -> dict:
         },
         "issues": issues,
         "summary": summary,
+        "latency_ms": latency_ms,
     }
 
 
@@ -235,6 +413,7 @@ def main():
 
     with open(log_path, "w") as f:
         json.dump(report, f, indent=2)
+    record_latency(report["latency_ms"])
 
     # Print summary to stdout for cron logs
     icon = {"healthy": "OK", "degraded": "WARN", "down": "CRIT"}.get(report["status"], "???")
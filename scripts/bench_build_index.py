@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+bench_build_index.py — Row-wise vs bulk loading benchmark for index.db.
+
+Generates a synthetic corpus of content rows (same shape as
+build_index.parse_content_file output) and loads it into two scratch
+databases:
+
+  row-wise  the pre-bulk path: one db.execute per row, FTS triggers firing
+            per row, default pragmas (rollback journal, synchronous=FULL)
+  bulk      build_index's path: BUILD_PRAGMAS, executemany in a single
+            transaction, FTS triggers suspended and content_fts rebuilt once
+
+Both databases are checked for identical row and FTS match counts.
+Nothing under data/ is touched.
+
+Usage:
+    python3 scripts/bench_build_index.py
+    python3 scripts/bench_build_index.py --posts 5000 --words 150
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import build_index
+
+VOCAB = (
+    "agent build ship content pipeline cursor claude skill repo commit draft "
+    "linkedin substack reddit thread hook voice system index query signal "
+    "outbound gtm workflow sprint deploy vercel nio progression xp avatar"
+).split()
+
+
+def synth_posts(n, words, seed=42):
+    """Generate n content rows with ~words-word bodies."""
+    rng = random.Random(seed)
+    platforms = build_index.PLATFORMS + build_index.FLAT_PLATFORMS
+    posts = []
+    for i in range(n):
+        day = f"2026-{(i // 28) % 12 + 1:02d}-{i % 28 + 1:02d}"
+        slug = f"post-{i}-{rng.choice(VOCAB)}"
+        platform = platforms[i % len(platforms)]
+        body = " ".join(rng.choice(VOCAB) for _ in range(words))
+        posts.append({
+            "file_path": f"content/{platform}/final/{day}_{slug}.md",
+            "platform": platform,
+            "stage": "final",
+            "title": slug.replace("-", " "),
+            "slug": slug,
+            "date": day,
+            "pillar": rng.choice(["Building & Sharing", "GTM", "Plays"]),
+            "arc": None,
+            "series": None,
+            "series_position": None,
+            "status_text": "final",
+            "energy": None,
+            "cta": None,
+            "structure": None,
+            "source": None,
+            "word_count": words,
+            "body": body,
+            "created_at": day,
+            "updated_at": day,
+        })
+    return posts
+
+
+def _fresh_db(path, pragmas=None):
+    """Create a scratch index.db with the build_index schema and triggers."""
+    db = sqlite3.connect(str(path))
+    if pragmas:
+        db.executescript(pragmas)
+    db.executescript(build_index.SCHEMA)
+    db.executescript(build_index.FTS_TRIGGERS)
+    return db
+
+
+def load_rowwise(path, posts):
+    """The pre-bulk insert_content: one execute per row, triggers firing."""
+    db = _fresh_db(path)
+    start = time.perf_counter()
+    for item in posts:
+        db.execute("""
+            INSERT OR REPLACE INTO content
+            (file_path, platform, stage, title, slug, date, pillar, arc, series,
+             series_position, status_text, energy, cta, structure, source,
+             word_count, body, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            item["file_path"], item["platform"], item["stage"],
+            item["title"], item["slug"], item["date"],
+            item["pillar"], item["arc"], item["series"],
+            item["series_position"], item["status_text"],
+            item["energy"], item["cta"], item["structure"],
+            item["source"], item["word_count"], item.get("body"),
+            item["created_at"], item["updated_at"],
+        ))
+    db.commit()
+    elapsed = time.perf_counter() - start
+    return db, elapsed
+
+
+def load_bulk(path, posts):
+    """build_index's bulk path: executemany + one FTS rebuild."""
+    db = _fresh_db(path, build_index.BUILD_PRAGMAS)
+    start = time.perf_counter()
+    with build_index.fts_bulk_load(db):
+        build_index.insert_content(db, posts)
+        db.commit()
+    elapsed = time.perf_counter() - start
+    return db, elapsed
+
+
+def _counts(db):
+    """Row count plus an FTS match count, for parity checks."""
+    rows = db.execute("SELECT COUNT(*) FROM content").fetchone()[0]
+    hits = db.execute(
+        "SELECT COUNT(*) FROM content_fts WHERE content_fts MATCH 'pipeline'"
+    ).fetchone()[0]
+    return rows, hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark row-wise vs bulk index.db loading")
+    parser.add_argument("--posts", type=int, default=50000, help="Synthetic posts to load (default: 50000)")
+    parser.add_argument("--words", type=int, default=300, help="Words per post body (default: 300)")
+    args = parser.parse_args()
+
+    print(f"Generating {args.posts:,} synthetic posts ({args.words} words each)...")
+    posts = synth_posts(args.posts, args.words)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        row_db, row_s = load_rowwise(Path(tmp) / "rowwise.db", posts)
+        bulk_db, bulk_s = load_bulk(Path(tmp) / "bulk.db", posts)
+        row_counts, bulk_counts = _counts(row_db), _counts(bulk_db)
+        row_db.close()
+        bulk_db.close()
+
+    print(f"  row-wise: {row_s:8.2f}s  ({args.posts / row_s:,.0f} rows/s)")
+    print(f"  bulk:     {bulk_s:8.2f}s  ({args.posts / bulk_s:,.0f} rows/s)")
+    print(f"  speedup:  {row_s / bulk_s:8.2f}x")
+
+    if row_counts != bulk_counts:
+        print(f"MISMATCH: row-wise {row_counts} vs bulk {bulk_counts}", file=sys.stderr)
+        return 1
+    print(f"  parity:   {bulk_counts[0]:,} rows, {bulk_counts[1]:,} FTS hits in both")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
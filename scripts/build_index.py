@@ -8,19 +8,37 @@ Produces data/index.db — a local, gitignored, queryable index.
 The .db file is derived from git-tracked files. Delete it and re-run
 to rebuild. Safe to run on any machine after git pull.
 
+Incremental mode keeps a per-file manifest (path, size, mtime, content
+hash) in index.db and only re-parses files that were added, changed, or
+removed since the last build.
+
+Scanners run concurrently in a process pool with per-file parse jobs; the
+main thread is the only writer and commits one transaction per table.
+
 Usage:
-    python3 scripts/build_index.py
+    python3 scripts/build_index.py                 # full rebuild
+    python3 scripts/build_index.py --incremental   # re-parse changed files only
+    python3 scripts/build_index.py --workers 1     # serial scan (default: CPU count)
 """
 
+import argparse
+import hashlib
 import json
 import os
 import re
 import socket
 import sqlite3
 import subprocess
+import sys
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from git_meta import get_git_date, load_git_dates  # one git log pass, cached by HEAD
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DB_PATH = REPO_ROOT / "data" / "index.db"
 CONTENT_DIR = REPO_ROOT / "content"
@@ -34,6 +52,16 @@ SKILL_DIRS = [
 PLATFORMS = ["linkedin", "x", "substack", "tiktok", "reddit", "website"]
 FLAT_PLATFORMS = ["nio-log"]  # no drafts/final subdirs — posts live flat in content/{platform}/
 
+# Progression avatar directories -> site label
+ASSET_DIRS = [
+    (REPO_ROOT / "website" / "apps" / "shawnos" / "public" / "progression" / "avatars", "shawnos"),
+    (REPO_ROOT / "website" / "apps" / "gtmos" / "public" / "progression" / "avatars", "gtmos"),
+    (REPO_ROOT / "website" / "apps" / "contentos" / "public" / "progression" / "avatars", "contentos"),
+    (REPO_ROOT / "website" / "apps" / "mission-control" / "public" / "progression" / "avatars", "mission-control"),
+    (REPO_ROOT / "data" / "progression" / "avatars", "canonical"),
+    (REPO_ROOT / "website" / "apps" / "video" / "public" / "progression" / "avatars", "video-source"),
+]
+
 # ── Schema ────────────────────────────────────────────────────────────
 
 SCHEMA = """
@@ -172,12 +200,51 @@ CREATE TABLE IF NOT EXISTS content_intel_runs (
     UNIQUE(date, phase)
 );
 
+-- Platforms named in each post's ## Cross-Platform Notes (parsed once at scan time)
+CREATE TABLE IF NOT EXISTS content_platform_refs (
+    content_id INTEGER NOT NULL REFERENCES content(id),
+    platform TEXT NOT NULL,
+    PRIMARY KEY (content_id, platform)
+);
+
+-- Per-file manifest for incremental builds (derived, dropped on full rebuild)
+CREATE TABLE IF NOT EXISTS file_manifest (
+    file_path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    row_key TEXT NOT NULL,
+    size_bytes INTEGER,
+    mtime_ns INTEGER,
+    content_hash TEXT,
+    indexed_at TEXT DEFAULT (datetime('now'))
+);
+
+-- Build metadata (last indexed git HEAD, etc.)
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
 -- FTS5 for content search (topic overlap, voice matching)
 CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5(
     title, body, content=content, content_rowid=rowid
 );
 """
 
+# Secondary indexes for the filters/sorts in query_index.py — created after
+# the bulk load so a full build doesn't maintain them row by row
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_content_date_platform ON content(date, platform);
+CREATE INDEX IF NOT EXISTS idx_content_platform_date ON content(platform, date);
+CREATE INDEX IF NOT EXISTS idx_content_date_slug ON content(date, slug);
+CREATE INDEX IF NOT EXISTS idx_content_slug ON content(slug);
+CREATE INDEX IF NOT EXISTS idx_content_links_target ON content_links(target_id);
+CREATE INDEX IF NOT EXISTS idx_skills_category_name ON skills(category, name);
+CREATE INDEX IF NOT EXISTS idx_assets_site_type ON assets(site, asset_type, file_path);
+CREATE INDEX IF NOT EXISTS idx_videos_brand ON videos(brand, file_path);
+CREATE INDEX IF NOT EXISTS idx_thumbnails_brand ON thumbnails(brand, variant);
+CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(session_date);
+"""
+
 # FTS5 sync triggers — applied after schema creation
 FTS_TRIGGERS = """
 CREATE TRIGGER IF NOT EXISTS content_fts_insert AFTER INSERT ON content BEGIN
@@ -198,6 +265,14 @@ CREATE TRIGGER IF NOT EXISTS content_fts_update AFTER UPDATE ON content BEGIN
 END;
 """
 
+# Write-optimised settings for the duration of a build (see finish_db)
+BUILD_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-65536;
+PRAGMA temp_store=MEMORY;
+"""
+
 # ── Helpers ───────────────────────────────────────────────────────────
 
 def run_git(*args):
@@ -209,14 +284,6 @@ def run_git(*args):
     return result.stdout.strip() if result.stdout else ""
 
 
-def get_git_date(filepath):
-    """Get last modified date from git log for a file."""
-    out = run_git("log", "-1", "--format=%ai", "--", str(filepath))
-    if out:
-        return out.split(" ")[0]
-    return None
-
-
 def count_words(filepath):
     """Count words in a text file."""
     try:
@@ -237,6 +304,37 @@ def get_machine_name():
     return hostname.split(".")[0]
 
 
+def file_digest(filepath):
+    """SHA-1 of a file's bytes, read in 1 MB chunks."""
+    h = hashlib.sha1()
+    with open(filepath, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def git_changes_since(prev_head):
+    """Return (head, touched) for the commits made since prev_head.
+
+    touched is the set of repo-relative paths changed between prev_head and
+    HEAD — their git dates moved even if the working-tree file did not.
+    None means "unknown" (no previous build, rewritten history, no git), in
+    which case every file must be treated as touched.
+    """
+    head = run_git("rev-parse", "HEAD") or None
+    if not prev_head or not head:
+        return head, None
+    if prev_head == head:
+        return head, set()
+    result = subprocess.run(
+        ["git", "-C", str(REPO_ROOT), "diff", "--name-only", prev_head, head],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return head, None
+    return head, set(result.stdout.splitlines())
+
+
 # ── Content metadata parsing ─────────────────────────────────────────
 
 def parse_blockquote_metadata(text):
@@ -288,6 +386,52 @@ def parse_series_position(arc_text):
     return int(m.group(1)) if m else None
 
 
+# Canonical platform names we recognise in ## Cross-Platform Notes, mapped
+# from common variations
+PLATFORM_ALIASES = {
+    "linkedin": "linkedin",
+    "x": "x",
+    "twitter": "x",
+    "substack": "substack",
+    "reddit": "reddit",
+    "tiktok": "tiktok",
+    "youtube": "website",
+}
+
+CROSS_PLATFORM_SECTION_RE = re.compile(
+    r"^##\s+Cross-Platform Notes\s*\n(.*?)(?=^##\s|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+# Patterns that capture a platform reference at the start of a bullet or
+# bold line inside the Cross-Platform Notes section.
+# Pattern 1: "- LinkedIn promo:" / "- X:" / "- Reddit promo:"
+CROSS_PLATFORM_BULLET_RE = re.compile(r"^-\s+(?:\*\*)?(\w+)\b.*?:", re.IGNORECASE)
+# Pattern 2: "**LinkedIn capstone (Day 4)**:" / "**X thread (Day 4)**:"
+CROSS_PLATFORM_BOLD_RE = re.compile(r"^\*\*(\w+)\b.*?\*\*\s*:", re.IGNORECASE)
+
+
+def extract_platform_refs(text):
+    """Return the sorted canonical platforms named in ## Cross-Platform Notes."""
+    section_match = CROSS_PLATFORM_SECTION_RE.search(text)
+    if not section_match:
+        return []
+
+    referenced_platforms = set()
+    for line in section_match.group(1).splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        # Try bullet format first, then bold format
+        m = CROSS_PLATFORM_BULLET_RE.match(stripped) or CROSS_PLATFORM_BOLD_RE.match(stripped)
+        if m:
+            canonical = PLATFORM_ALIASES.get(m.group(1).lower())
+            if canonical:
+                referenced_platforms.add(canonical)
+
+    return sorted(referenced_platforms)
+
+
 def parse_content_file(filepath, platform, stage):
     """Parse a content file and return a dict of metadata."""
     try:
@@ -353,45 +497,38 @@ def parse_content_file(filepath, platform, stage):
         "body": body,
         "created_at": created,
         "updated_at": updated,
+        "platform_refs": extract_platform_refs(text),
     }
 
 
 # ── Scanners ─────────────────────────────────────────────────────────
+#
+# Each source is split into a lister (cheap directory walk returning
+# (path, *parse_args) entries) and a per-file parser, so incremental builds
+# can stat every file but only parse the ones whose manifest entry is stale.
 
-def scan_content():
-    """Scan all content directories for drafts and finals."""
-    items = []
+def _is_content_file(f):
+    """True for indexable .md/.txt posts (skips _drafts, dotfiles, READMEs)."""
+    if not f.is_file():
+        return False
+    if f.name.startswith(("_", ".", "README")):
+        return False
+    return f.suffix in (".md", ".txt")
+
+
+def list_content_files():
+    """List (path, platform, stage) for all content drafts and finals."""
+    entries = []
 
     for platform in PLATFORMS:
         platform_dir = CONTENT_DIR / platform
-
-        # Drafts
-        drafts_dir = platform_dir / "drafts"
-        if drafts_dir.exists():
-            for f in sorted(drafts_dir.iterdir()):
-                if not f.is_file():
-                    continue
-                if f.name.startswith(("_", ".", "README")):
-                    continue
-                if f.suffix not in (".md", ".txt"):
-                    continue
-                item = parse_content_file(f, platform, "draft")
-                if item:
-                    items.append(item)
-
-        # Finals
-        final_dir = platform_dir / "final"
-        if final_dir.exists():
-            for f in sorted(final_dir.iterdir()):
-                if not f.is_file():
-                    continue
-                if f.name.startswith(("_", ".", "README")) or f.name == ".gitkeep":
-                    continue
-                if f.suffix not in (".md", ".txt"):
-                    continue
-                item = parse_content_file(f, platform, "final")
-                if item:
-                    items.append(item)
+        for subdir, stage in (("drafts", "draft"), ("final", "final")):
+            stage_dir = platform_dir / subdir
+            if not stage_dir.exists():
+                continue
+            for f in sorted(stage_dir.iterdir()):
+                if _is_content_file(f):
+                    entries.append((f, platform, stage))
 
     # Flat platforms (no drafts/final subdirs — posts live directly in content/{platform}/)
     for platform in FLAT_PLATFORMS:
@@ -399,48 +536,61 @@ def scan_content():
         if not platform_dir.exists():
             continue
         for f in sorted(platform_dir.iterdir()):
-            if not f.is_file():
-                continue
-            if f.name.startswith(("_", ".", "README")):
-                continue
-            if f.suffix not in (".md", ".txt"):
-                continue
-            item = parse_content_file(f, platform, "final")
-            if item:
-                items.append(item)
+            if _is_content_file(f):
+                entries.append((f, platform, "final"))
+
+    return entries
 
+
+def _parse_entries(entries, parser):
+    """Run a per-file parser over lister entries, dropping unreadable files."""
+    items = []
+    for entry in entries:
+        item = parser(*entry)
+        if item:
+            items.append(item)
     return items
 
 
-def scan_daily_logs():
-    """Scan daily log JSON files and extract stats."""
-    logs = []
+def scan_content():
+    """Scan all content directories for drafts and finals."""
+    return _parse_entries(list_content_files(), parse_content_file)
+
+
+def list_daily_log_files():
+    """List (path,) for every daily log JSON file."""
     if not LOG_DIR.exists():
-        return logs
+        return []
+    return [(f,) for f in sorted(LOG_DIR.glob("*.json"))]
 
-    for f in sorted(LOG_DIR.glob("*.json")):
-        try:
-            data = json.loads(f.read_text())
-        except (json.JSONDecodeError, OSError):
-            continue
 
-        stats = data.get("stats", {})
-        git = data.get("git_summary", {})
+def parse_daily_log(filepath):
+    """Parse one daily log JSON file into a daily_logs row."""
+    try:
+        data = json.loads(filepath.read_text())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+    stats = data.get("stats", {})
+    git = data.get("git_summary", {})
+
+    return {
+        "date": data.get("date", filepath.stem),
+        "output_score": stats.get("output_score"),
+        "letter_grade": stats.get("letter_grade"),
+        "words_today": stats.get("words_today"),
+        "shipped_count": stats.get("shipped_count"),
+        "draft_count": stats.get("draft_count"),
+        "agent_cost": stats.get("agent_cost"),
+        "roi_multiplier": stats.get("roi_multiplier"),
+        "commits_today": git.get("commits_today"),
+        "efficiency_rating": stats.get("efficiency_rating"),
+    }
 
-        logs.append({
-            "date": data.get("date", f.stem),
-            "output_score": stats.get("output_score"),
-            "letter_grade": stats.get("letter_grade"),
-            "words_today": stats.get("words_today"),
-            "shipped_count": stats.get("shipped_count"),
-            "draft_count": stats.get("draft_count"),
-            "agent_cost": stats.get("agent_cost"),
-            "roi_multiplier": stats.get("roi_multiplier"),
-            "commits_today": git.get("commits_today"),
-            "efficiency_rating": stats.get("efficiency_rating"),
-        })
 
-    return logs
+def scan_daily_logs():
+    """Scan daily log JSON files and extract stats."""
+    return _parse_entries(list_daily_log_files(), parse_daily_log)
 
 
 def scan_session_handoff():
@@ -493,9 +643,9 @@ def _extract_section(text, heading):
     return None
 
 
-def scan_skills():
-    """Scan skill directories for SKILL.md files."""
-    skills = []
+def list_skill_files():
+    """List (SKILL.md path, category) for every skill directory."""
+    entries = []
 
     for skill_dir in SKILL_DIRS:
         if not skill_dir.exists():
@@ -509,29 +659,35 @@ def scan_skills():
 
         for entry in sorted(skill_dir.iterdir()):
             skill_md = entry / "SKILL.md"
-            if not skill_md.is_file():
-                continue
+            if skill_md.is_file():
+                entries.append((skill_md, category))
+
+    return entries
 
-            slug = entry.name
-            rel_path = str(skill_md.relative_to(REPO_ROOT))
 
-            # Extract frontmatter
-            name, description = _extract_skill_frontmatter(skill_md)
-            if not name:
-                name = slug
+def parse_skill(skill_md, category):
+    """Parse one SKILL.md into a skills row."""
+    slug = skill_md.parent.name
+    rel_path = str(skill_md.relative_to(REPO_ROOT))
 
-            git_date = get_git_date(rel_path)
+    # Extract frontmatter
+    name, description = _extract_skill_frontmatter(skill_md)
+    if not name:
+        name = slug
+
+    return {
+        "name": name,
+        "slug": slug,
+        "description": description,
+        "file_path": rel_path,
+        "category": category,
+        "last_modified": get_git_date(rel_path),
+    }
 
-            skills.append({
-                "name": name,
-                "slug": slug,
-                "description": description,
-                "file_path": rel_path,
-                "category": category,
-                "last_modified": git_date,
-            })
 
-    return skills
+def scan_skills():
+    """Scan skill directories for SKILL.md files."""
+    return _parse_entries(list_skill_files(), parse_skill)
 
 
 def _extract_skill_frontmatter(filepath):
@@ -560,19 +716,10 @@ def _extract_skill_frontmatter(filepath):
     return name, desc
 
 
-def scan_assets():
-    """Scan progression avatar directories for .gif and .png visual assets."""
-    asset_dirs = [
-        (REPO_ROOT / "website" / "apps" / "shawnos" / "public" / "progression" / "avatars", "shawnos"),
-        (REPO_ROOT / "website" / "apps" / "gtmos" / "public" / "progression" / "avatars", "gtmos"),
-        (REPO_ROOT / "website" / "apps" / "contentos" / "public" / "progression" / "avatars", "contentos"),
-        (REPO_ROOT / "website" / "apps" / "mission-control" / "public" / "progression" / "avatars", "mission-control"),
-        (REPO_ROOT / "data" / "progression" / "avatars", "canonical"),
-        (REPO_ROOT / "website" / "apps" / "video" / "public" / "progression" / "avatars", "video-source"),
-    ]
-
-    items = []
-    for dir_path, site in asset_dirs:
+def list_asset_files():
+    """List (path, site) for progression avatar .gif and .png files."""
+    entries = []
+    for dir_path, site in ASSET_DIRS:
         if not dir_path.exists():
             continue
         for f in sorted(dir_path.iterdir()):
@@ -580,89 +727,97 @@ def scan_assets():
                 continue
             if f.suffix.lower() not in (".gif", ".png"):
                 continue
+            entries.append((f, site))
+    return entries
+
+
+def parse_asset(f, site):
+    """Parse an avatar filename into an assets row."""
+    rel_path = str(f.relative_to(REPO_ROOT))
+    stem = f.stem  # filename without extension
 
-            rel_path = str(f.relative_to(REPO_ROOT))
-            stem = f.stem  # filename without extension
-
-            asset_type = None
-            name = None
-            tier = None
-            class_name = None
-            variant = None
-            size_px = None
-
-            # Parse filename patterns
-            # tier-3-idle-advanced-256.gif -> tier=3, variant="idle-advanced", size_px=256
-            tier_match = re.match(r"^tier-(\d+)-(.+?)(?:-(\d+))?$", stem)
-            # class-alchemist-static.png -> class_name="alchemist", variant="static"
-            class_match = re.match(r"^class-(\w+)-(.+)$", stem)
-            # tool-clay-idle.gif -> name="clay", variant="idle"
-            tool_match = re.match(r"^tool-(\w+)-(.+)$", stem)
-            # nio-tier-2-static.png -> name="nio", tier=2, variant="static"
-            nio_match = re.match(r"^nio-tier-(\d+)-(.+)$", stem)
-            # sprite-sheet.png -> asset_type="sprite-sheet"
-            sprite_match = re.match(r"^sprite-sheet$", stem)
-            # current-idle.gif -> asset_type="current", variant="idle"
-            current_match = re.match(r"^current-(.+)$", stem)
-
-            if tier_match:
-                asset_type = "tier"
-                tier = int(tier_match.group(1))
-                rest = tier_match.group(2)
-                size_str = tier_match.group(3)
-                if size_str:
-                    size_px = int(size_str)
-                    variant = rest
-                else:
-                    # Check if the last segment is a number (size)
-                    parts = rest.rsplit("-", 1)
-                    if len(parts) == 2 and parts[1].isdigit():
-                        variant = parts[0]
-                        size_px = int(parts[1])
-                    else:
-                        variant = rest
-            elif class_match:
-                asset_type = "class"
-                class_name = class_match.group(1)
-                variant = class_match.group(2)
-            elif tool_match:
-                asset_type = "tool"
-                name = tool_match.group(1)
-                variant = tool_match.group(2)
-            elif nio_match:
-                asset_type = "nio"
-                name = "nio"
-                tier = int(nio_match.group(1))
-                variant = nio_match.group(2)
-            elif sprite_match:
-                asset_type = "sprite-sheet"
-                variant = "main"
-            elif current_match:
-                asset_type = "current"
-                variant = current_match.group(1)
+    asset_type = None
+    name = None
+    tier = None
+    class_name = None
+    variant = None
+    size_px = None
+
+    # Parse filename patterns
+    # tier-3-idle-advanced-256.gif -> tier=3, variant="idle-advanced", size_px=256
+    tier_match = re.match(r"^tier-(\d+)-(.+?)(?:-(\d+))?$", stem)
+    # class-alchemist-static.png -> class_name="alchemist", variant="static"
+    class_match = re.match(r"^class-(\w+)-(.+)$", stem)
+    # tool-clay-idle.gif -> name="clay", variant="idle"
+    tool_match = re.match(r"^tool-(\w+)-(.+)$", stem)
+    # nio-tier-2-static.png -> name="nio", tier=2, variant="static"
+    nio_match = re.match(r"^nio-tier-(\d+)-(.+)$", stem)
+    # sprite-sheet.png -> asset_type="sprite-sheet"
+    sprite_match = re.match(r"^sprite-sheet$", stem)
+    # current-idle.gif -> asset_type="current", variant="idle"
+    current_match = re.match(r"^current-(.+)$", stem)
+
+    if tier_match:
+        asset_type = "tier"
+        tier = int(tier_match.group(1))
+        rest = tier_match.group(2)
+        size_str = tier_match.group(3)
+        if size_str:
+            size_px = int(size_str)
+            variant = rest
+        else:
+            # Check if the last segment is a number (size)
+            parts = rest.rsplit("-", 1)
+            if len(parts) == 2 and parts[1].isdigit():
+                variant = parts[0]
+                size_px = int(parts[1])
             else:
-                # Fallback: unknown asset type
-                asset_type = "other"
-                name = stem
-
-            try:
-                file_size = os.path.getsize(f)
-            except OSError:
-                file_size = None
-
-            items.append({
-                "file_path": rel_path,
-                "site": site,
-                "asset_type": asset_type,
-                "name": name,
-                "tier": tier,
-                "class_name": class_name,
-                "variant": variant,
-                "size_px": size_px,
-                "file_size_bytes": file_size,
-            })
+                variant = rest
+    elif class_match:
+        asset_type = "class"
+        class_name = class_match.group(1)
+        variant = class_match.group(2)
+    elif tool_match:
+        asset_type = "tool"
+        name = tool_match.group(1)
+        variant = tool_match.group(2)
+    elif nio_match:
+        asset_type = "nio"
+        name = "nio"
+        tier = int(nio_match.group(1))
+        variant = nio_match.group(2)
+    elif sprite_match:
+        asset_type = "sprite-sheet"
+        variant = "main"
+    elif current_match:
+        asset_type = "current"
+        variant = current_match.group(1)
+    else:
+        # Fallback: unknown asset type
+        asset_type = "other"
+        name = stem
 
-    return items
+    try:
+        file_size = os.path.getsize(f)
+    except OSError:
+        file_size = None
+
+    return {
+        "file_path": rel_path,
+        "site": site,
+        "asset_type": asset_type,
+        "name": name,
+        "tier": tier,
+        "class_name": class_name,
+        "variant": variant,
+        "size_px": size_px,
+        "file_size_bytes": file_size,
+    }
+
+
+def scan_assets():
+    """Scan progression avatar directories for .gif and .png visual assets."""
+    return _parse_entries(list_asset_files(), parse_asset)
 
 
 def _parse_video_source(stem):
@@ -733,29 +888,18 @@ def _parse_video_source(stem):
     return brand, None, rest if rest else None
 
 
-def scan_videos():
-    """Scan video output and deployed directories for .mp4 files."""
-    items = []
+def list_video_files():
+    """List (path, deployed_to) for source and deployed .mp4 files.
+
+    deployed_to is None for source renders in website/apps/video/out/.
+    """
+    entries = []
 
     # Source videos: website/apps/video/out/*.mp4
     video_out_dir = REPO_ROOT / "website" / "apps" / "video" / "out"
     if video_out_dir.exists():
         for f in sorted(video_out_dir.glob("*.mp4")):
-            rel_path = str(f.relative_to(REPO_ROOT))
-            brand, aspect_ratio, fmt = _parse_video_source(f.stem)
-            try:
-                file_size = os.path.getsize(f)
-            except OSError:
-                file_size = None
-            items.append({
-                "file_path": rel_path,
-                "site": "video-source",
-                "brand": brand,
-                "aspect_ratio": aspect_ratio,
-                "format": fmt,
-                "file_size_bytes": file_size,
-                "deployed_to": None,
-            })
+            entries.append((f, None))
 
     # Deployed videos: website/apps/*/public/video/*.mp4
     apps_dir = REPO_ROOT / "website" / "apps"
@@ -769,73 +913,103 @@ def scan_videos():
             if not video_dir.exists():
                 continue
             for f in sorted(video_dir.glob("*.mp4")):
-                rel_path = str(f.relative_to(REPO_ROOT))
-                deployed_to = app_dir.name
-                # Infer brand from filename or deployed location
-                stem = f.stem
-                known_brands = ["shawnos", "gtmos", "contentos"]
-                brand = deployed_to  # default to the app name
-                for b in known_brands:
-                    if stem.startswith(b):
-                        brand = b
-                        break
-                try:
-                    file_size = os.path.getsize(f)
-                except OSError:
-                    file_size = None
-                items.append({
-                    "file_path": rel_path,
-                    "site": deployed_to,
-                    "brand": brand,
-                    "aspect_ratio": None,
-                    "format": None,
-                    "file_size_bytes": file_size,
-                    "deployed_to": deployed_to,
-                })
+                entries.append((f, app_dir.name))
 
-    return items
+    return entries
 
 
-def scan_thumbnails():
-    """Scan video output directory for .png thumbnail files."""
-    items = []
+def parse_video(f, deployed_to):
+    """Parse a source or deployed .mp4 into a videos row."""
+    rel_path = str(f.relative_to(REPO_ROOT))
+    try:
+        file_size = os.path.getsize(f)
+    except OSError:
+        file_size = None
+
+    if deployed_to is None:
+        brand, aspect_ratio, fmt = _parse_video_source(f.stem)
+        return {
+            "file_path": rel_path,
+            "site": "video-source",
+            "brand": brand,
+            "aspect_ratio": aspect_ratio,
+            "format": fmt,
+            "file_size_bytes": file_size,
+            "deployed_to": None,
+        }
+
+    # Infer brand from filename or deployed location
+    stem = f.stem
+    known_brands = ["shawnos", "gtmos", "contentos"]
+    brand = deployed_to  # default to the app name
+    for b in known_brands:
+        if stem.startswith(b):
+            brand = b
+            break
+    return {
+        "file_path": rel_path,
+        "site": deployed_to,
+        "brand": brand,
+        "aspect_ratio": None,
+        "format": None,
+        "file_size_bytes": file_size,
+        "deployed_to": deployed_to,
+    }
+
+
+def scan_videos():
+    """Scan video output and deployed directories for .mp4 files."""
+    return _parse_entries(list_video_files(), parse_video)
+
+
+def list_thumbnail_files():
+    """List (path,) for .png thumbnails in the video output directory."""
     video_out_dir = REPO_ROOT / "website" / "apps" / "video" / "out"
     if not video_out_dir.exists():
-        return items
+        return []
+    return [(f,) for f in sorted(video_out_dir.glob("*.png"))]
+
 
+def parse_thumbnail(f):
+    """Parse a thumbnail filename into a thumbnails row."""
+    rel_path = str(f.relative_to(REPO_ROOT))
+    stem = f.stem
     known_brands = ["shawnos", "gtmos", "contentos"]
 
-    for f in sorted(video_out_dir.glob("*.png")):
-        rel_path = str(f.relative_to(REPO_ROOT))
-        stem = f.stem
-
-        # Parse brand from prefix
-        brand = "shawnos"  # default
-        variant = stem
-        for b in known_brands:
-            if stem.startswith(f"{b}-"):
-                brand = b
-                variant = stem[len(b) + 1:]
-                break
+    # Parse brand from prefix
+    brand = "shawnos"  # default
+    variant = stem
+    for b in known_brands:
+        if stem.startswith(f"{b}-"):
+            brand = b
+            variant = stem[len(b) + 1:]
+            break
 
-        try:
-            file_size = os.path.getsize(f)
-        except OSError:
-            file_size = None
+    try:
+        file_size = os.path.getsize(f)
+    except OSError:
+        file_size = None
 
-        items.append({
-            "file_path": rel_path,
-            "brand": brand,
-            "variant": variant,
-            "file_size_bytes": file_size,
-        })
+    return {
+        "file_path": rel_path,
+        "brand": brand,
+        "variant": variant,
+        "file_size_bytes": file_size,
+    }
+
+
+def scan_thumbnails():
+    """Scan video output directory for .png thumbnail files."""
+    return _parse_entries(list_thumbnail_files(), parse_thumbnail)
 
-    return items
 
+def detect_content_links(db, only_ids=None):
+    """Detect cross-platform links by matching date+slug patterns.
 
-def detect_content_links(db):
-    """Detect cross-platform links by matching date+slug patterns."""
-    cursor = db.execute("SELECT id, slug, date, platform FROM content WHERE slug IS NOT NULL AND date IS NOT NULL")
+    With only_ids, only (date, slug) groups containing one of those content
+    ids are linked — used by incremental builds to relink changed rows.
+    """
+    cursor = db.execute("SELECT id, slug, date, platform FROM content WHERE slug IS NOT NULL AND date IS NOT NULL ORDER BY id")
     rows = cursor.fetchall()
 
     # Group by (date, slug)
@@ -851,6 +1025,8 @@ def detect_content_links(db):
     for (date, slug), members in groups.items():
         if len(members) < 2:
             continue
+        if only_ids is not None and not any(m[0] in only_ids for m in members):
+            continue
         for i, (src_id, src_plat) in enumerate(members):
             for dst_id, dst_plat in members[i + 1:]:
                 links.append((src_id, dst_id, "series_sibling"))
@@ -858,130 +1034,68 @@ def detect_content_links(db):
     return links
 
 
-def detect_explicit_links(db):
+def detect_explicit_links(db, only_ids=None):
     """Detect cross-platform links from ## Cross-Platform Notes sections.
 
-    Reads all content files that contain a '## Cross-Platform Notes' section,
-    parses the bullet points / bold headings to extract platform references
-    (e.g., 'LinkedIn promo:', 'X thread:', 'Reddit promo:'), then tries to
-    match the source file's date + referenced platform to an existing content
-    row.  Creates links with link_type 'cross_platform_note'.
-    """
-    # Build a lookup: (date, platform) -> list of content ids
-    cursor = db.execute(
-        "SELECT id, date, platform FROM content WHERE date IS NOT NULL"
-    )
-    date_platform_index = {}
-    for row_id, date, platform in cursor.fetchall():
-        key = (date, platform)
-        if key not in date_platform_index:
-            date_platform_index[key] = []
-        date_platform_index[key].append(row_id)
-
-    # Get all content rows to iterate over their files
-    all_rows = db.execute(
-        "SELECT id, file_path, date FROM content WHERE date IS NOT NULL"
-    ).fetchall()
-
-    # Canonical platform names we recognise, mapped from common variations
-    platform_aliases = {
-        "linkedin": "linkedin",
-        "x": "x",
-        "twitter": "x",
-        "substack": "substack",
-        "reddit": "reddit",
-        "tiktok": "tiktok",
-        "youtube": "website",
-    }
-
-    # Patterns that capture a platform reference at the start of a bullet or
-    # bold line inside the Cross-Platform Notes section.
-    # Pattern 1: "- LinkedIn promo:" / "- X:" / "- Reddit promo:"
-    bullet_re = re.compile(
-        r"^-\s+(?:\*\*)?(\w+)\b.*?:", re.IGNORECASE
-    )
-    # Pattern 2: "**LinkedIn capstone (Day 4)**:" / "**X thread (Day 4)**:"
-    bold_re = re.compile(
-        r"^\*\*(\w+)\b.*?\*\*\s*:", re.IGNORECASE
-    )
-
-    links = []
-
-    for src_id, file_path, src_date in all_rows:
-        full_path = REPO_ROOT / file_path
-        if not full_path.is_file():
-            continue
-
-        try:
-            text = full_path.read_text(errors="replace")
-        except OSError:
-            continue
-
-        # Extract the Cross-Platform Notes section
-        section_match = re.search(
-            r"^##\s+Cross-Platform Notes\s*\n(.*?)(?=^##\s|\Z)",
-            text,
-            re.MULTILINE | re.DOTALL,
-        )
-        if not section_match:
-            continue
-
-        section_text = section_match.group(1)
-
-        # Collect unique platforms referenced in this section
-        referenced_platforms = set()
-        for line in section_text.splitlines():
-            stripped = line.strip()
-            if not stripped:
-                continue
+    The notes are parsed once, during parse_content_file, into
+    content_platform_refs (content_id, referenced platform). Linking is then
+    a pure SQL join: each reference points at every other content row with
+    the source's date and the referenced platform. Creates links with
+    link_type 'cross_platform_note'.
 
-            # Try bullet format first, then bold format
-            m = bullet_re.match(stripped) or bold_re.match(stripped)
-            if m:
-                raw_platform = m.group(1).lower()
-                canonical = platform_aliases.get(raw_platform)
-                if canonical:
-                    referenced_platforms.add(canonical)
-
-        # For each referenced platform, look up content rows with
-        # (src_date, platform) and create a link
-        for platform in referenced_platforms:
-            key = (src_date, platform)
-            target_ids = date_platform_index.get(key, [])
-            for tgt_id in target_ids:
-                if tgt_id == src_id:
-                    continue  # don't self-link
-                links.append((src_id, tgt_id, "cross_platform_note"))
-
-    return links
+    With only_ids, only links that have a changed row at either end are
+    returned — every other link is already in content_links.
+    """
+    rows = db.execute("""
+        SELECT DISTINCT src.id, tgt.id
+        FROM content_platform_refs r
+        JOIN content src ON src.id = r.content_id
+        JOIN content tgt ON tgt.date = src.date AND tgt.platform = r.platform
+        WHERE src.date IS NOT NULL
+          AND tgt.id != src.id
+        ORDER BY src.id, tgt.id
+    """).fetchall()
+
+    return [
+        (src_id, tgt_id, "cross_platform_note")
+        for src_id, tgt_id in rows
+        if only_ids is None or src_id in only_ids or tgt_id in only_ids
+    ]
 
 
 # ── Database operations ──────────────────────────────────────────────
 
-def init_db():
+def init_db(rebuild=True):
     """Create or recreate the database with schema.
 
     Preserves append-only tables (sessions, blog_generations) across rebuilds.
-    Only the derived tables are dropped and recreated each run.
+    Only the derived tables are dropped and recreated each run. With
+    rebuild=False (incremental mode) nothing is dropped and the existing
+    rows are updated in place against the file manifest.
     """
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     db = sqlite3.connect(str(DB_PATH))
+    db.executescript(BUILD_PRAGMAS)
 
     # Drop only the derived tables — sessions + blog_generations are append-only
-    db.executescript("""
-        DROP TABLE IF EXISTS content_links;
-        DROP TRIGGER IF EXISTS content_fts_insert;
-        DROP TRIGGER IF EXISTS content_fts_delete;
-        DROP TRIGGER IF EXISTS content_fts_update;
-        DROP TABLE IF EXISTS content_fts;
-        DROP TABLE IF EXISTS content;
-        DROP TABLE IF EXISTS daily_logs;
-        DROP TABLE IF EXISTS skills;
-        DROP TABLE IF EXISTS assets;
-        DROP TABLE IF EXISTS videos;
-        DROP TABLE IF EXISTS thumbnails;
-    """)
+    if rebuild:
+        db.executescript("""
+            DROP TABLE IF EXISTS content_links;
+            DROP TABLE IF EXISTS content_platform_refs;
+            DROP TRIGGER IF EXISTS content_fts_insert;
+            DROP TRIGGER IF EXISTS content_fts_delete;
+            DROP TRIGGER IF EXISTS content_fts_update;
+            DROP TABLE IF EXISTS content_fts;
+            DROP TABLE IF EXISTS content;
+            DROP TABLE IF EXISTS daily_logs;
+            DROP TABLE IF EXISTS skills;
+            DROP TABLE IF EXISTS assets;
+            DROP TABLE IF EXISTS videos;
+            DROP TABLE IF EXISTS thumbnails;
+            DROP TABLE IF EXISTS file_manifest;
+            DROP TABLE IF EXISTS index_meta;
+        """)
 
     # Recreate all tables (sessions + blog_generations use IF NOT EXISTS)
     db.executescript(SCHEMA)
@@ -990,16 +1104,90 @@ def init_db():
     return db
 
 
+@contextmanager
+def fts_bulk_load(db):
+    """Suspend the content_fts triggers for a bulk content load.
+
+    Per-row trigger maintenance is replaced by a single FTS5 'rebuild' from
+    the content table once the load is done, then the triggers come back.
+    """
+    db.executescript("""
+        DROP TRIGGER IF EXISTS content_fts_insert;
+        DROP TRIGGER IF EXISTS content_fts_delete;
+        DROP TRIGGER IF EXISTS content_fts_update;
+    """)
+    try:
+        yield
+    finally:
+        db.execute("INSERT INTO content_fts(content_fts) VALUES('rebuild')")
+        db.commit()
+        db.executescript(FTS_TRIGGERS)
+
+
+def create_indexes(db, analyze=True):
+    """Create secondary indexes (no-op if present) and refresh planner stats.
+
+    A full build runs ANALYZE; incremental builds let PRAGMA optimize decide
+    whether the stats are stale enough to be worth refreshing.
+    """
+    db.executescript(INDEXES)
+    db.execute("ANALYZE" if analyze else "PRAGMA optimize")
+    db.commit()
+
+
+def finish_db(db):
+    """Checkpoint the build-time WAL and return to a rollback journal.
+
+    Readers (mission-control opens index.db read-only) then see a single
+    self-contained file with no -wal/-shm sidecars.
+    """
+    db.commit()
+    db.execute("PRAGMA journal_mode=DELETE")
+    db.close()
+
+
+def get_meta(db, key):
+    """Read a value from index_meta, or None."""
+    row = db.execute("SELECT value FROM index_meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def set_meta(db, key, value):
+    """Write a value to index_meta."""
+    db.execute(
+        "INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)",
+        (key, value),
+    )
+
+
+# Bulk inserters stream rows through executemany and leave the commit to
+# the caller, so each table lands in a single transaction.
+
 def insert_content(db, items):
-    """Insert content records."""
-    for item in items:
-        db.execute("""
-            INSERT OR REPLACE INTO content
-            (file_path, platform, stage, title, slug, date, pillar, arc, series,
-             series_position, status_text, energy, cta, structure, source,
-             word_count, body, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    """Insert or update content records.
+
+    Upserts (rather than INSERT OR REPLACE) so a changed file keeps its row
+    id — content_links reference it — and the FTS update trigger fires
+    (unless the load runs inside fts_bulk_load).
+    """
+    db.executemany("""
+        INSERT INTO content
+        (file_path, platform, stage, title, slug, date, pillar, arc, series,
+         series_position, status_text, energy, cta, structure, source,
+         word_count, body, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(file_path) DO UPDATE SET
+            platform = excluded.platform, stage = excluded.stage,
+            title = excluded.title, slug = excluded.slug, date = excluded.date,
+            pillar = excluded.pillar, arc = excluded.arc, series = excluded.series,
+            series_position = excluded.series_position,
+            status_text = excluded.status_text, energy = excluded.energy,
+            cta = excluded.cta, structure = excluded.structure,
+            source = excluded.source, word_count = excluded.word_count,
+            body = excluded.body, created_at = excluded.created_at,
+            updated_at = excluded.updated_at, indexed_at = datetime('now')
+    """, (
+        (
             item["file_path"], item["platform"], item["stage"],
             item["title"], item["slug"], item["date"],
             item["pillar"], item["arc"], item["series"],
@@ -1007,25 +1195,41 @@ def insert_content(db, items):
             item["energy"], item["cta"], item["structure"],
             item["source"], item["word_count"], item.get("body"),
             item["created_at"], item["updated_at"],
-        ))
-    db.commit()
+        )
+        for item in items
+    ))
+
+    # Replace each row's ## Cross-Platform Notes references
+    db.executemany("""
+        DELETE FROM content_platform_refs
+        WHERE content_id = (SELECT id FROM content WHERE file_path = ?)
+    """, ((item["file_path"],) for item in items))
+    db.executemany("""
+        INSERT OR IGNORE INTO content_platform_refs (content_id, platform)
+        SELECT id, ? FROM content WHERE file_path = ?
+    """, (
+        (ref, item["file_path"])
+        for item in items
+        for ref in item.get("platform_refs", ())
+    ))
 
 
 def insert_daily_logs(db, logs):
     """Insert daily log records."""
-    for log in logs:
-        db.execute("""
-            INSERT OR REPLACE INTO daily_logs
-            (date, output_score, letter_grade, words_today, shipped_count,
-             draft_count, agent_cost, roi_multiplier, commits_today, efficiency_rating)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    db.executemany("""
+        INSERT OR REPLACE INTO daily_logs
+        (date, output_score, letter_grade, words_today, shipped_count,
+         draft_count, agent_cost, roi_multiplier, commits_today, efficiency_rating)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        (
             log["date"], log["output_score"], log["letter_grade"],
             log["words_today"], log["shipped_count"], log["draft_count"],
             log["agent_cost"], log["roi_multiplier"],
             log["commits_today"], log["efficiency_rating"],
-        ))
-    db.commit()
+        )
+        for log in logs
+    ))
 
 
 def insert_session(db, session):
@@ -1056,95 +1260,321 @@ def insert_session(db, session):
 
 def insert_skills(db, skills):
     """Insert skill records."""
-    for skill in skills:
-        db.execute("""
-            INSERT OR REPLACE INTO skills
-            (name, slug, description, file_path, category, last_modified)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+    db.executemany("""
+        INSERT OR REPLACE INTO skills
+        (name, slug, description, file_path, category, last_modified)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, (
+        (
             skill["name"], skill["slug"], skill["description"],
             skill["file_path"], skill["category"], skill["last_modified"],
-        ))
-    db.commit()
+        )
+        for skill in skills
+    ))
 
 
 def insert_assets(db, items):
     """Insert asset records."""
-    for item in items:
-        db.execute("""
-            INSERT OR REPLACE INTO assets
-            (file_path, site, asset_type, name, tier, class_name, variant, size_px, file_size_bytes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    db.executemany("""
+        INSERT OR REPLACE INTO assets
+        (file_path, site, asset_type, name, tier, class_name, variant, size_px, file_size_bytes)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        (
             item["file_path"], item["site"], item["asset_type"],
             item["name"], item["tier"], item["class_name"],
             item["variant"], item["size_px"], item["file_size_bytes"],
-        ))
-    db.commit()
+        )
+        for item in items
+    ))
 
 
 def insert_videos(db, items):
     """Insert video records."""
-    for item in items:
-        db.execute("""
-            INSERT OR REPLACE INTO videos
-            (file_path, site, brand, aspect_ratio, format, file_size_bytes, deployed_to)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+    db.executemany("""
+        INSERT OR REPLACE INTO videos
+        (file_path, site, brand, aspect_ratio, format, file_size_bytes, deployed_to)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (
+        (
             item["file_path"], item["site"], item["brand"],
             item["aspect_ratio"], item["format"],
             item["file_size_bytes"], item["deployed_to"],
-        ))
-    db.commit()
+        )
+        for item in items
+    ))
 
 
 def insert_thumbnails(db, items):
     """Insert thumbnail records."""
-    for item in items:
-        db.execute("""
-            INSERT OR REPLACE INTO thumbnails
-            (file_path, brand, variant, file_size_bytes)
-            VALUES (?, ?, ?, ?)
-        """, (
+    db.executemany("""
+        INSERT OR REPLACE INTO thumbnails
+        (file_path, brand, variant, file_size_bytes)
+        VALUES (?, ?, ?, ?)
+    """, (
+        (
             item["file_path"], item["brand"],
             item["variant"], item["file_size_bytes"],
-        ))
-    db.commit()
+        )
+        for item in items
+    ))
 
 
 def insert_content_links(db, links):
     """Insert content link records."""
-    for src_id, dst_id, link_type in links:
-        db.execute("""
-            INSERT OR IGNORE INTO content_links (source_id, target_id, link_type)
-            VALUES (?, ?, ?)
-        """, (src_id, dst_id, link_type))
+    db.executemany("""
+        INSERT OR IGNORE INTO content_links (source_id, target_id, link_type)
+        VALUES (?, ?, ?)
+    """, links)
+
+
+# ── Incremental sync ─────────────────────────────────────────────────
+
+# table -> (lister, per-file parser, inserter, natural key column)
+SOURCES = {
+    "content": (list_content_files, parse_content_file, insert_content, "file_path"),
+    "daily_logs": (list_daily_log_files, parse_daily_log, insert_daily_logs, "date"),
+    "skills": (list_skill_files, parse_skill, insert_skills, "file_path"),
+    "assets": (list_asset_files, parse_asset, insert_assets, "file_path"),
+    "videos": (list_video_files, parse_video, insert_videos, "file_path"),
+    "thumbnails": (list_thumbnail_files, parse_thumbnail, insert_thumbnails, "file_path"),
+}
+
+PARSE_CHUNK = 64  # files per parse job
+FTS_BULK_THRESHOLD = 500  # content rows above which FTS is rebuilt once instead of per-row
+
+SYNC_LABELS = {
+    "content": "Content:      {} files indexed",
+    "daily_logs": "Daily logs:   {} days indexed",
+    "skills": "Skills:       {} indexed",
+    "assets": "Assets:       {} visual assets indexed",
+    "videos": "Videos:       {} video files indexed",
+    "thumbnails": "Thumbnails:   {} thumbnail files indexed",
+}
+
+
+def load_manifest(db, table):
+    """Return {file_path: (row_key, size_bytes, mtime_ns, content_hash)} for one table."""
+    return {
+        row[0]: row[1:]
+        for row in db.execute(
+            "SELECT file_path, row_key, size_bytes, mtime_ns, content_hash "
+            "FROM file_manifest WHERE kind = ?",
+            (table,),
+        )
+    }
+
+
+def plan_sync(table, stored, touched):
+    """Work out which files of one table need re-parsing. Runs in a worker.
+
+    Files whose size and mtime match the manifest are skipped without being
+    read. Files whose stat moved are hashed; only a changed hash (or a git
+    date change, via touched) marks them stale. touched=None forces every
+    file to re-parse.
+
+    Returns (stale, refreshed, removed): stale is a list of
+    (lister entry, rel_path, size, mtime_ns, digest), refreshed holds
+    manifest rows for touched-but-identical files, removed lists paths that
+    are in the manifest but gone from disk.
+    """
+    lister = SOURCES[table][0]
+    seen = set()
+    stale = []
+    refreshed = []
+    for entry in lister():
+        f = entry[0]
+        rel_path = str(f.relative_to(REPO_ROOT))
+        seen.add(rel_path)
+        old = stored.get(rel_path)
+        git_moved = touched is None or rel_path in touched
+        try:
+            st = f.stat()
+            if old and not git_moved and (old[1], old[2]) == (st.st_size, st.st_mtime_ns):
+                continue
+            digest = file_digest(f)
+        except OSError:
+            continue
+        if old and not git_moved and old[3] == digest:
+            # Touched but byte-identical — just refresh the stat fingerprint
+            refreshed.append((rel_path, table, old[0], st.st_size, st.st_mtime_ns, digest))
+            continue
+        stale.append((entry, rel_path, st.st_size, st.st_mtime_ns, digest))
+
+    removed = [path for path in stored if path not in seen]
+    return stale, refreshed, removed
+
+
+def parse_entries(table, entries):
+    """Parse a chunk of lister entries for one table. Runs in a worker."""
+    parser = SOURCES[table][1]
+    return [parser(*entry) for entry in entries]
+
+
+def apply_sync(db, table, stored, plan, parsed):
+    """Write one table's parse results in a single transaction.
+
+    Only ever called from the main (writer) thread. Rows for deleted files
+    are removed, parsed rows are upserted, and the manifest is updated.
+    Large content loads (a full build, or FTS_BULK_THRESHOLD+ changed
+    files) suspend the FTS triggers and rebuild content_fts once.
+
+    Returns a dict with total/added/changed/removed counts and the natural
+    keys of every row that was written.
+    """
+    inserter, key_col = SOURCES[table][2], SOURCES[table][3]
+    stale, manifest_rows, removed = plan
+    removed = list(removed)
+    manifest_rows = list(manifest_rows)
+    gone_keys = [stored[path][0] for path in removed]
+    items = []
+    added = 0
+    for (entry, rel_path, size, mtime_ns, digest), item in zip(stale, parsed):
+        old = stored.get(rel_path)
+        if item is None:
+            # Unreadable now — drop its row and retry on the next build
+            if old:
+                removed.append(rel_path)
+                gone_keys.append(old[0])
+            continue
+        key = str(item[key_col])
+        if old and old[0] != key:
+            gone_keys.append(old[0])
+        if not old:
+            added += 1
+        items.append(item)
+        manifest_rows.append((rel_path, table, key, size, mtime_ns, digest))
+
+    bulk = table == "content" and (not stored or len(items) >= FTS_BULK_THRESHOLD)
+    with fts_bulk_load(db) if bulk else nullcontext():
+        db.executemany(f"DELETE FROM {table} WHERE {key_col} = ?", [(k,) for k in gone_keys])
+        db.executemany("DELETE FROM file_manifest WHERE file_path = ?", [(p,) for p in removed])
+        inserter(db, items)
+        db.executemany("""
+            INSERT OR REPLACE INTO file_manifest
+            (file_path, kind, row_key, size_bytes, mtime_ns, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, manifest_rows)
+        db.commit()
+
+    return {
+        "total": db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0],
+        "added": added,
+        "changed": len(items) - added,
+        "removed": len(removed),
+        "keys": [str(item[key_col]) for item in items],
+    }
+
+
+def sync_tables(db, touched, workers):
+    """Scan and parse every source concurrently; yield (table, result) in SOURCES order.
+
+    Each table's listing/stat/hash pass runs as one job in the pool, then
+    its stale files are fanned out in PARSE_CHUNK-sized parse jobs as soon
+    as that plan is ready. The caller's thread is the single writer: it
+    applies each table in one transaction as its parses complete.
+    """
+    stored = {table: load_manifest(db, table) for table in SOURCES}
+    if workers > 1:
+        load_git_dates()  # warm the git date map before forking workers
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=1)
+
+    with pool:
+        plan_futures = {
+            pool.submit(plan_sync, table, stored[table], touched): table
+            for table in SOURCES
+        }
+        plans = {}
+        parse_futures = {}
+        for future in as_completed(plan_futures):
+            table = plan_futures[future]
+            plans[table] = future.result()
+            entries = [s[0] for s in plans[table][0]]
+            parse_futures[table] = [
+                pool.submit(parse_entries, table, entries[i:i + PARSE_CHUNK])
+                for i in range(0, len(entries), PARSE_CHUNK)
+            ]
+
+        for table in SOURCES:
+            parsed = [item for f in parse_futures[table] for item in f.result()]
+            yield table, apply_sync(db, table, stored[table], plans[table], parsed)
+
+
+def refresh_content_links(db, changed_paths):
+    """Re-detect content_links for changed content rows.
+
+    Links and platform refs pointing at deleted rows are dropped, links touching a changed row
+    are recomputed, and every other link is left as-is.
+    """
+    db.executescript("""
+        DELETE FROM content_platform_refs
+        WHERE content_id NOT IN (SELECT id FROM content);
+        DELETE FROM content_links
+        WHERE source_id NOT IN (SELECT id FROM content)
+           OR target_id NOT IN (SELECT id FROM content);
+    """)
+    if not changed_paths:
+        db.commit()
+        return
+
+    wanted = set(changed_paths)
+    ids = {
+        row_id for row_id, file_path in db.execute("SELECT id, file_path FROM content")
+        if file_path in wanted
+    }
+    db.executemany(
+        "DELETE FROM content_links WHERE source_id = ? OR target_id = ?",
+        [(row_id, row_id) for row_id in ids],
+    )
+    insert_content_links(db, detect_content_links(db, only_ids=ids))
+    insert_content_links(db, detect_explicit_links(db, only_ids=ids))
     db.commit()
 
 
+def _fmt_delta(result, incremental):
+    """Format an incremental sync summary suffix, e.g. ' (2 new, 1 changed, 0 removed)'."""
+    if not incremental:
+        return ""
+    return f" ({result['added']} new, {result['changed']} changed, {result['removed']} removed)"
+
+
 # ── Main ─────────────────────────────────────────────────────────────
 
 def main():
-    print(f"Building index: {DB_PATH.relative_to(REPO_ROOT)}")
+    parser = argparse.ArgumentParser(description="Build the SQLite content/data index")
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Re-parse only files added, changed, or removed since the last build",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for scanning/parsing (default: CPU count, 1 = serial)",
+    )
+    args = parser.parse_args()
+
+    mode = "incremental" if args.incremental else "full rebuild"
+    print(f"Building index: {DB_PATH.relative_to(REPO_ROOT)} ({mode})")
 
-    db = init_db()
+    db = init_db(rebuild=not args.incremental)
+    head, touched = git_changes_since(get_meta(db, "git_head"))
 
-    # Content
-    content_items = scan_content()
-    insert_content(db, content_items)
-    print(f"  Content:      {len(content_items)} files indexed")
+    # Content, daily logs, skills, assets, videos, thumbnails — scanned in parallel
+    results = {}
+    for table, result in sync_tables(db, touched, args.workers):
+        results[table] = result
+        print("  " + SYNC_LABELS[table].format(result["total"]) + _fmt_delta(result, args.incremental))
 
-    # Platform breakdown
-    platforms = {}
-    for item in content_items:
-        platforms[item["platform"]] = platforms.get(item["platform"], 0) + 1
-    for plat, count in sorted(platforms.items()):
-        print(f"    {plat}: {count}")
+        # Platform breakdown
+        if table == "content":
+            for plat, count in db.execute(
+                "SELECT platform, COUNT(*) FROM content GROUP BY platform ORDER BY platform"
+            ):
+                print(f"    {plat}: {count}")
 
-    # Daily logs
-    logs = scan_daily_logs()
-    insert_daily_logs(db, logs)
-    print(f"  Daily logs:   {len(logs)} days indexed")
+    # Secondary indexes — after the bulk load, before link detection uses them
+    create_indexes(db, analyze=not args.incremental)
 
     # Session handoff
     session = scan_session_handoff()
@@ -1152,37 +1582,17 @@ def main():
     total_sessions = db.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
     print(f"  Sessions:     {total_sessions} archived ({session_count} new)")
 
-    # Skills
-    skills = scan_skills()
-    insert_skills(db, skills)
-    print(f"  Skills:       {len(skills)} indexed")
-
-    # Visual assets
-    assets = scan_assets()
-    insert_assets(db, assets)
-    print(f"  Assets:       {len(assets)} visual assets indexed")
-
-    # Videos
-    videos = scan_videos()
-    insert_videos(db, videos)
-    print(f"  Videos:       {len(videos)} video files indexed")
-
-    # Thumbnails
-    thumbnails = scan_thumbnails()
-    insert_thumbnails(db, thumbnails)
-    print(f"  Thumbnails:   {len(thumbnails)} thumbnail files indexed")
-
-    # Content links (cross-platform detection)
-    links = detect_content_links(db)
-    insert_content_links(db, links)
-    print(f"  Content links: {len(links)} series-sibling pairs detected")
-
-    # Explicit cross-platform links from ## Cross-Platform Notes sections
-    explicit_links = detect_explicit_links(db)
-    insert_content_links(db, explicit_links)
-    print(f"  Explicit links: {len(explicit_links)} cross-platform notes detected")
-
-    db.close()
+    # Content links (series siblings + explicit ## Cross-Platform Notes)
+    refresh_content_links(db, results["content"]["keys"])
+    link_counts = dict(db.execute(
+        "SELECT link_type, COUNT(*) FROM content_links GROUP BY link_type"
+    ).fetchall())
+    print(f"  Content links: {link_counts.get('series_sibling', 0)} series-sibling pairs detected")
+    print(f"  Explicit links: {link_counts.get('cross_platform_note', 0)} cross-platform notes detected")
+
+    if head:
+        set_meta(db, "git_head", head)
+    finish_db(db)
     print(f"Done. Index at {DB_PATH}")
 
 
@@ -2,17 +2,22 @@
 """
 Cost Aggregator — populates data/daily-log/cost-tracker/*.json
 
-Reads each daily log's token_usage entries and produces per-day cost breakdowns:
+Flattens every daily log's token_usage entries into one table (via the
+shared daily-log cache) and produces per-day cost breakdowns:
   - total_cost
   - by_model (opus-4, sonnet-4, etc.)
   - by_source (claude-code, cursor, etc.)
   - cumulative_total (running sum across all days)
   - cost_per_xp_v3 (using V3 profile if available)
 
+plus weekly and monthly rollups (cost-tracker/rollups/) with XP per dollar.
+Only files whose content changed are rewritten.
+
 Usage:
-    python3 scripts/cost_aggregator.py           # normal run
-    python3 scripts/cost_aggregator.py -v         # verbose
-    python3 scripts/cost_aggregator.py --dry-run  # preview
+    python3 scripts/cost_aggregator.py                    # normal run
+    python3 scripts/cost_aggregator.py -v                  # verbose
+    python3 scripts/cost_aggregator.py --dry-run           # preview
+    python3 scripts/cost_aggregator.py --report monthly    # print a rollup table, write nothing
 """
 
 from __future__ import annotations
@@ -20,33 +25,24 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from datetime import date as date_cls
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from daily_log_store import load_token_rows
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = REPO_ROOT / "data"
 DAILY_LOG_DIR = DATA_DIR / "daily-log"
 COST_TRACKER_DIR = DAILY_LOG_DIR / "cost-tracker"
+# Rollups live in a subdirectory so readers globbing cost-tracker/*.json
+# (website costs.server.ts) only ever see per-day records
+COST_ROLLUP_DIR = COST_TRACKER_DIR / "rollups"
 PROFILE_V3_PATH = DATA_DIR / "progression" / "profile-v3.json"
 PROFILE_V2_PATH = DATA_DIR / "progression" / "profile-v2.json"
 
 
-def load_daily_logs() -> List[Dict[str, Any]]:
-    """Load all daily-log JSON files, sorted by date ascending."""
-    logs: List[Dict[str, Any]] = []
-    if not DAILY_LOG_DIR.exists():
-        return logs
-    for json_path in sorted(DAILY_LOG_DIR.glob("*.json")):
-        try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "date" in data:
-                logs.append(data)
-        except (json.JSONDecodeError, OSError):
-            continue
-    return logs
-
-
 def load_xp_map() -> Dict[str, int]:
     """Load per-day XP from V3 profile (falling back to V2)."""
     xp_map: Dict[str, int] = {}
@@ -74,6 +70,7 @@ def load_xp_map() -> Dict[str, int]:
     return xp_map
 
 
+@lru_cache(maxsize=None)
 def normalize_model(model: str) -> str:
     """Normalize model names for grouping."""
     m = model.lower().strip()
@@ -90,6 +87,7 @@ def normalize_model(model: str) -> str:
     return m or "unknown"
 
 
+@lru_cache(maxsize=None)
 def normalize_source(source: str) -> str:
     """Normalize source names for grouping."""
     s = source.lower().strip()
@@ -100,98 +98,213 @@ def normalize_source(source: str) -> str:
     return s or "unknown"
 
 
-def aggregate_costs(logs: List[Dict[str, Any]], xp_map: Dict[str, int], verbose: bool = False) -> List[Dict[str, Any]]:
-    """Process all daily logs and generate cost breakdowns."""
+def aggregate_costs(
+    dates: List[str],
+    rows: List[Tuple[int, str, str, float]],
+    xp_map: Dict[str, int],
+    verbose: bool = False,
+) -> List[Dict[str, Any]]:
+    """Build per-day cost breakdowns from the flattened token-usage table.
+
+    `dates` has one slot per daily log; `rows` are (day index, model, source,
+    cost) as returned by daily_log_store.load_token_rows(). Model and source
+    names go through the memoized normalizers, so each distinct raw name is
+    scanned once per run rather than once per entry.
+    """
+    totals = [0.0] * len(dates)
+    by_model: List[Dict[str, float]] = [{} for _ in dates]
+    by_source: List[Dict[str, float]] = [{} for _ in dates]
+
+    for day, model, source, cost in rows:
+        model = normalize_model(model)
+        source = normalize_source(source)
+        totals[day] += cost
+        day_models = by_model[day]
+        day_models[model] = day_models.get(model, 0) + cost
+        day_sources = by_source[day]
+        day_sources[source] = day_sources.get(source, 0) + cost
+
     results: List[Dict[str, Any]] = []
     cumulative_total = 0.0
-
-    for log in logs:
-        date = log.get("date", "")
-        token_usage = log.get("token_usage", [])
-
-        by_model: Dict[str, float] = {}
-        by_source: Dict[str, float] = {}
-        total_cost = 0.0
-
-        for entry in token_usage:
-            cost = entry.get("cost", 0)
-            if not isinstance(cost, (int, float)):
-                cost = 0
-
-            model = normalize_model(entry.get("model", ""))
-            source = normalize_source(entry.get("source", ""))
-
-            total_cost += cost
-            by_model[model] = by_model.get(model, 0) + cost
-            by_source[source] = by_source.get(source, 0) + cost
-
+    for day, date in enumerate(dates):
+        total_cost = totals[day]
         cumulative_total += total_cost
 
         # Round values
-        by_model = {k: round(v, 4) for k, v in by_model.items() if v > 0}
-        by_source = {k: round(v, 4) for k, v in by_source.items() if v > 0}
+        models = {k: round(v, 4) for k, v in by_model[day].items() if v > 0}
+        sources = {k: round(v, 4) for k, v in by_source[day].items() if v > 0}
 
         xp = xp_map.get(date, 0)
         cost_per_xp = round(total_cost / xp, 4) if xp > 0 else 0
 
-        record = {
+        results.append({
             "date": date,
             "total_cost": round(total_cost, 4),
-            "by_model": by_model,
-            "by_source": by_source,
+            "by_model": models,
+            "by_source": sources,
             "cumulative_total": round(cumulative_total, 4),
             "cost_per_xp_v3": cost_per_xp,
-        }
-        results.append(record)
+        })
 
         if verbose:
             print(f"  {date}: ${total_cost:.2f} (cum: ${cumulative_total:.2f}, "
-                  f"$/xp: {cost_per_xp:.4f}, models: {list(by_model.keys())}, "
-                  f"sources: {list(by_source.keys())})")
+                  f"$/xp: {cost_per_xp:.4f}, models: {list(models.keys())}, "
+                  f"sources: {list(sources.keys())})")
 
     return results
 
 
-def write_cost_files(results: List[Dict[str, Any]], dry_run: bool = False) -> None:
-    """Write per-day cost tracker JSON files."""
-    COST_TRACKER_DIR.mkdir(parents=True, exist_ok=True)
+def _period_keys(date: str) -> Optional[Tuple[str, str]]:
+    """(ISO week, month) keys for a log date, or None if it doesn't parse."""
+    try:
+        d = date_cls.fromisoformat(date)
+    except (TypeError, ValueError):
+        return None
+    year, week, _ = d.isocalendar()
+    return f"{year}-W{week:02d}", f"{d.year}-{d.month:02d}"
+
+
+def rollup_costs(
+    dates: List[str],
+    rows: List[Tuple[int, str, str, float]],
+    xp_map: Dict[str, int],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Weekly (ISO week) and monthly cost rollups with XP per dollar.
+
+    One pass over the flattened table buckets every entry into its week and
+    month; days are counted per period even when they had no usage.
+    """
+    keys = [_period_keys(d) for d in dates]
+    periods: Dict[str, Dict[str, Dict[str, Any]]] = {"weekly": {}, "monthly": {}}
+
+    def bucket(kind: str, key: str) -> Dict[str, Any]:
+        return periods[kind].setdefault(key, {
+            "period": key, "days": 0, "total_cost": 0.0, "xp": 0,
+            "by_model": {}, "by_source": {},
+        })
+
+    for day, date in enumerate(dates):
+        if keys[day] is None:
+            continue
+        for kind, key in zip(("weekly", "monthly"), keys[day]):
+            b = bucket(kind, key)
+            b["days"] += 1
+            b["xp"] += xp_map.get(date, 0)
 
-    for record in results:
-        filepath = COST_TRACKER_DIR / f"{record['date']}.json"
+    for day, model, source, cost in rows:
+        if keys[day] is None:
+            continue
+        model = normalize_model(model)
+        source = normalize_source(source)
+        for kind, key in zip(("weekly", "monthly"), keys[day]):
+            b = periods[kind][key]
+            b["total_cost"] += cost
+            b["by_model"][model] = b["by_model"].get(model, 0) + cost
+            b["by_source"][source] = b["by_source"].get(source, 0) + cost
+
+    rollups: Dict[str, List[Dict[str, Any]]] = {}
+    for kind, buckets in periods.items():
+        out = []
+        for key in sorted(buckets):
+            b = buckets[key]
+            total = b["total_cost"]
+            out.append({
+                "period": key,
+                "days": b["days"],
+                "total_cost": round(total, 4),
+                "avg_daily": round(total / b["days"], 4) if b["days"] else 0,
+                "by_model": {k: round(v, 4) for k, v in b["by_model"].items() if v > 0},
+                "by_source": {k: round(v, 4) for k, v in b["by_source"].items() if v > 0},
+                "xp_v3": b["xp"],
+                "xp_per_dollar": round(b["xp"] / total, 2) if total > 0 else None,
+            })
+        rollups[kind] = out
+    return rollups
+
+
+def _write_if_changed(filepath: Path, payload: Any) -> bool:
+    """Write JSON to filepath unless the file already holds exactly that content."""
+    text = json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+    try:
+        if filepath.read_text(encoding="utf-8") == text:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    filepath.write_text(text, encoding="utf-8")
+    return True
+
+
+def write_cost_files(
+    results: List[Dict[str, Any]],
+    rollups: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    dry_run: bool = False,
+) -> int:
+    """Write per-day cost tracker JSON files and rollups; returns files rewritten.
+
+    Files whose rendered content is unchanged are left untouched.
+    """
+    COST_TRACKER_DIR.mkdir(parents=True, exist_ok=True)
+    targets = [(COST_TRACKER_DIR / f"{record['date']}.json", record) for record in results]
+    if rollups:
+        if not dry_run:
+            COST_ROLLUP_DIR.mkdir(parents=True, exist_ok=True)
+        targets += [(COST_ROLLUP_DIR / f"{kind}.json", rows) for kind, rows in rollups.items()]
+
+    written = 0
+    for filepath, payload in targets:
         if dry_run:
             print(f"  [DRY RUN] Would write {filepath.name}")
             continue
+        if _write_if_changed(filepath, payload):
+            written += 1
+    return written
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(record, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+
+def print_rollup(rows: List[Dict[str, Any]]) -> None:
+    """Print a rollup table to stdout."""
+    print(f"  {'Period':>8s}  {'Days':>4s}  {'Cost':>10s}  {'Avg/day':>8s}  {'XP':>7s}  {'XP/$':>7s}  Top model")
+    for r in rows:
+        top = max(r["by_model"], key=r["by_model"].get) if r["by_model"] else "-"
+        xp_per = f"{r['xp_per_dollar']:.1f}" if r["xp_per_dollar"] is not None else "-"
+        cost = f"${r['total_cost']:,.2f}"
+        avg = f"${r['avg_daily']:,.2f}"
+        print(f"  {r['period']:>8s}  {r['days']:>4d}  {cost:>10s}  {avg:>8s}"
+              f"  {r['xp_v3']:>7,}  {xp_per:>7s}  {top}")
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Cost aggregator — populates cost-tracker JSONs")
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument("--report", choices=["weekly", "monthly"],
+                        help="Print a rollup table and exit without writing files")
     args = parser.parse_args()
 
-    logs = load_daily_logs()
-    if not logs:
+    dates, rows = load_token_rows()
+    if not dates:
         print("  No daily logs found.")
         sys.exit(0)
 
+    xp_map = load_xp_map()
+
+    if args.report:
+        print_rollup(rollup_costs(dates, rows, xp_map)[args.report])
+        return
+
     print(f"\n  +== Cost Aggregator =============================+")
-    print(f"  |  Daily logs found: {len(logs):>25d}    |")
+    print(f"  |  Daily logs found: {len(dates):>25d}    |")
 
-    xp_map = load_xp_map()
-    results = aggregate_costs(logs, xp_map, verbose=args.verbose)
+    results = aggregate_costs(dates, rows, xp_map, verbose=args.verbose)
+    rollups = rollup_costs(dates, rows, xp_map)
 
     total = results[-1]["cumulative_total"] if results else 0
     print(f"  |  Total spend:      ${total:>23.2f}    |")
     print(f"  |  Cost files:       {len(results):>25d}    |")
     print(f"  +================================================+")
 
-    write_cost_files(results, dry_run=args.dry_run)
+    written = write_cost_files(results, rollups, dry_run=args.dry_run)
     if not args.dry_run:
-        print(f"\n  -> Cost tracker files written to {COST_TRACKER_DIR.relative_to(REPO_ROOT)}/\n")
+        print(f"\n  -> {written} cost tracker file(s) updated in {COST_TRACKER_DIR.relative_to(REPO_ROOT)}/\n")
 
 
 if __name__ == "__main__":
@@ -120,7 +120,7 @@ fi
 
 # ── Step 1g: Build content/data index ─────────────────────────────────
 log "Running build_index.py"
-if $PYTHON scripts/build_index.py >> "$LOGFILE" 2>&1; then
+if $PYTHON scripts/build_index.py --incremental >> "$LOGFILE" 2>&1; then
   log "Content index built"
 else
   log "WARN: Content index build failed (non-fatal, continuing)"
@@ -139,7 +139,7 @@ fi
 # ── Step 1i: Reddit scout ──────────────────────────────────────────────
 log "Running reddit_scout.py"
 if $PYTHON scripts/reddit_scout.py >> "$LOGFILE" 2>&1; then
-  REDDIT_COUNT=$($PYTHON -c "import json; q=json.load(open('data/reddit/queue.json')); print(sum(1 for i in q if i['status']=='scouted'))" 2>/dev/null || echo "?")
+  REDDIT_COUNT=$($PYTHON scripts/queue_store.py reddit stats --status scouted 2>/dev/null || echo "?")
   log "Reddit scout completed ($REDDIT_COUNT scouted opportunities)"
   send_slack "REDDIT" "Reddit scout: $REDDIT_COUNT new opportunities found"
 else
@@ -150,7 +150,7 @@ fi
 # ── Step 1j: X/Twitter scout ──────────────────────────────────────────
 log "Running x_scout.py"
 if $PYTHON scripts/x_scout.py >> "$LOGFILE" 2>&1; then
-  X_COUNT=$($PYTHON -c "import json; q=json.load(open('data/x/queue.json')); print(sum(1 for i in q if i['status']=='scouted'))" 2>/dev/null || echo "?")
+  X_COUNT=$($PYTHON scripts/queue_store.py x stats --status scouted 2>/dev/null || echo "?")
   log "X scout completed ($X_COUNT scouted opportunities)"
   send_slack "X" "X scout: $X_COUNT new opportunities found"
 else
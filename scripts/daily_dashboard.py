@@ -18,6 +18,8 @@ from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
 
+from daily_log_store import letter_grades
+
 # ── Paths ────────────────────────────────────────────────────────────
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -96,29 +98,22 @@ TOKEN_PRICING = {
 
 # ── RPG / Avatar helpers ─────────────────────────────────────────────
 
-def compute_streak(log_dir, current_date_str):
+def compute_streak(current_date_str):
     """Count consecutive days (including today) with grade B+ or better.
-    Reads last 7 JSON files, walks backward from current date.
+    Reads the last 7 days' grades from the shared log cache, walks backward from current date.
     """
     try:
         current = datetime.strptime(current_date_str, "%Y-%m-%d")
     except ValueError:
         return 0
     good_grades = {"S+", "S", "A+", "A", "B"}
+    days = [(current - timedelta(days=day_offset)).strftime("%Y-%m-%d") for day_offset in range(7)]
+    grades = letter_grades(days)
     streak = 0
-    for day_offset in range(7):
-        dt = current - timedelta(days=day_offset)
-        path = log_dir / f"{dt.strftime('%Y-%m-%d')}.json"
-        if not path.exists():
-            break
-        try:
-            data = json.loads(path.read_text())
-            grade = data.get("stats", {}).get("letter_grade", "")
-            if grade not in good_grades:
-                break
-            streak += 1
-        except (json.JSONDecodeError, IOError):
+    for day in days:
+        if grades.get(day) not in good_grades:
             break
+        streak += 1
     return streak
 
 
@@ -399,7 +394,7 @@ def render_dashboard(data, output_path):
     d.text((WIDTH - PAD - date_w, y), date_display, font=fTitle, fill=BRIGHT)
 
     # Streak indicator (consecutive B+ days)
-    streak = compute_streak(LOG_DIR, date_str) if date_str != "unknown" else 0
+    streak = compute_streak(date_str) if date_str != "unknown" else 0
     if streak >= 2:
         streak_text = f"{streak}-day streak"
         sw = d.textlength(streak_text, font=fSmall)
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+daily_log_store.py — Shared, cached reader for data/daily-log/*.json.
+
+progression_engine_v3, cost_aggregator and daily_dashboard all need the same
+handful of fields from every daily log. Instead of each of them opening and
+json-parsing every file on every run, this module keeps a SQLite sidecar
+(data/daily-log-cache.db) with one row per log file plus its token_usage and
+accomplishment entries. Each file is keyed by (mtime_ns, size): only files
+that changed since the last run are re-parsed, deleted files are dropped, so
+startup stays flat as the log directory grows.
+
+Readers:
+  load_logs()      compact log dicts (the fields the engines read), date order
+  load_columns()   typed per-day arrays (output_score, agent_cost, ...)
+  load_token_rows() every token_usage entry flattened into one table
+  letter_grades()  {file date: letter_grade} for dashboard streaks
+
+The sidecar is disposable — delete it and the next read rebuilds it.
+Stdlib only.
+
+Usage:
+    from daily_log_store import load_logs, load_columns
+
+    python3 scripts/daily_log_store.py          # sync the cache, print stats
+    python3 scripts/daily_log_store.py --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DAILY_LOG_DIR = REPO_ROOT / "data" / "daily-log"
+CACHE_PATH = REPO_ROOT / "data" / "daily-log-cache.db"
+
+# Bump when the extracted fields change; older caches are rebuilt
+CACHE_VERSION = 1
+
+# stats.* fields kept per day (raw values — consumers apply their own guards)
+STAT_FIELDS = (
+    "output_score", "letter_grade", "agent_cost", "ship_rate",
+    "shipped_count", "finals_count", "words_today", "efficiency_rating",
+)
+
+TOKEN_FIELDS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens")
+
+# Columns are declared without a type so SQLite keeps each raw JSON scalar
+# exactly as written (int stays int, float stays float, str stays str)
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    error TEXT
+);
+
+CREATE TABLE IF NOT EXISTS days (
+    name TEXT PRIMARY KEY REFERENCES files(name) ON DELETE CASCADE,
+    has_date INTEGER NOT NULL,
+    date,
+    {", ".join(STAT_FIELDS)},
+    commits_today,
+    total_tokens INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS token_usage (
+    name TEXT NOT NULL REFERENCES files(name) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    model TEXT NOT NULL,
+    source TEXT NOT NULL,
+    cost REAL NOT NULL,
+    {", ".join(f"{f} INTEGER NOT NULL" for f in TOKEN_FIELDS)},
+    PRIMARY KEY (name, seq)
+);
+
+CREATE TABLE IF NOT EXISTS accomplishments (
+    name TEXT NOT NULL REFERENCES files(name) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    type,
+    value_score,
+    PRIMARY KEY (name, seq)
+);
+"""
+
+
+@dataclass
+class DailyColumns:
+    """Per-day typed arrays, one slot per dated log in date order."""
+    dates: List[str] = field(default_factory=list)
+    output_score: array = field(default_factory=lambda: array("d"))
+    agent_cost: array = field(default_factory=lambda: array("d"))
+    commits_today: array = field(default_factory=lambda: array("d"))
+    ship_rate: array = field(default_factory=lambda: array("d"))
+    total_tokens: array = field(default_factory=lambda: array("q"))
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  Extraction
+# ══════════════════════════════════════════════════════════════════════
+
+def _scalar(value: Any) -> Any:
+    """Keep JSON scalars; anything SQLite can't bind becomes NULL."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return None
+
+
+def _number(value: Any) -> float:
+    """Numeric value or 0, matching the consumers' isinstance guards."""
+    return value if isinstance(value, (int, float)) else 0
+
+
+def _extract(name: str, data: Dict[str, Any]) -> Tuple[tuple, List[tuple], List[tuple]]:
+    """Split one parsed log into its days row, token rows and accomplishment rows."""
+    stats = data.get("stats")
+    stats = stats if isinstance(stats, dict) else {}
+    git = data.get("git_summary")
+    git = git if isinstance(git, dict) else {}
+
+    token_rows = []
+    total_tokens = 0
+    usage = data.get("token_usage")
+    for seq, entry in enumerate(usage if isinstance(usage, list) else []):
+        if not isinstance(entry, dict):
+            continue
+        tokens = [int(_number(entry.get(f, 0))) for f in TOKEN_FIELDS]
+        total_tokens += sum(tokens)
+        token_rows.append((
+            name, seq,
+            str(entry.get("model") or ""),
+            str(entry.get("source") or ""),
+            float(_number(entry.get("cost", 0))),
+            *tokens,
+        ))
+
+    acc_rows = []
+    accomplishments = data.get("accomplishments")
+    for seq, acc in enumerate(accomplishments if isinstance(accomplishments, list) else []):
+        if isinstance(acc, dict):
+            acc_rows.append((name, seq, _scalar(acc.get("type")), _scalar(acc.get("value_score"))))
+
+    day_row = (
+        name,
+        1 if "date" in data else 0,
+        _scalar(data.get("date")),
+        *(_scalar(stats.get(f)) for f in STAT_FIELDS),
+        _scalar(git.get("commits_today")),
+        total_tokens,
+    )
+    return day_row, token_rows, acc_rows
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  Cache maintenance
+# ══════════════════════════════════════════════════════════════════════
+
+def _connect(rebuild: bool = False) -> sqlite3.Connection:
+    """Open the sidecar, recreating it when its version is stale."""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(str(CACHE_PATH))
+    db.execute("PRAGMA foreign_keys = ON")
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    if rebuild or version != CACHE_VERSION:
+        db.executescript("""
+            DROP TABLE IF EXISTS accomplishments;
+            DROP TABLE IF EXISTS token_usage;
+            DROP TABLE IF EXISTS days;
+            DROP TABLE IF EXISTS files;
+        """)
+        db.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+    db.executescript(SCHEMA)
+    return db
+
+
+def _scan_dir() -> Dict[str, Tuple[int, int]]:
+    """{file name: (mtime_ns, size)} for every top-level daily-log JSON."""
+    found: Dict[str, Tuple[int, int]] = {}
+    if not DAILY_LOG_DIR.is_dir():
+        return found
+    with os.scandir(DAILY_LOG_DIR) as it:
+        for entry in it:
+            # glob("*.json") semantics: skip dotfiles
+            if entry.name.startswith(".") or not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            found[entry.name] = (st.st_mtime_ns, st.st_size)
+    return found
+
+
+def sync(db: sqlite3.Connection) -> Tuple[int, int]:
+    """Bring the sidecar in line with the log directory.
+
+    Returns (files re-parsed, files dropped).
+    """
+    on_disk = _scan_dir()
+    cached = {
+        name: (mtime_ns, size)
+        for name, mtime_ns, size in db.execute("SELECT name, mtime_ns, size_bytes FROM files")
+    }
+
+    gone = [(name,) for name in cached if name not in on_disk]
+    changed = [name for name, sig in on_disk.items() if cached.get(name) != sig]
+    if not gone and not changed:
+        return 0, 0
+
+    with db:
+        db.executemany("DELETE FROM files WHERE name = ?", gone)
+        for name in changed:
+            mtime_ns, size = on_disk[name]
+            db.execute("DELETE FROM files WHERE name = ?", (name,))
+            try:
+                data = json.loads((DAILY_LOG_DIR / name).read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+                db.execute(
+                    "INSERT INTO files (name, mtime_ns, size_bytes, error) VALUES (?, ?, ?, ?)",
+                    (name, mtime_ns, size, str(e)),
+                )
+                continue
+            db.execute(
+                "INSERT INTO files (name, mtime_ns, size_bytes, error) VALUES (?, ?, ?, NULL)",
+                (name, mtime_ns, size),
+            )
+            if not isinstance(data, dict):
+                continue
+            day_row, token_rows, acc_rows = _extract(name, data)
+            db.execute(
+                f"INSERT INTO days VALUES ({', '.join('?' * len(day_row))})", day_row
+            )
+            if token_rows:
+                db.executemany(
+                    f"INSERT INTO token_usage VALUES ({', '.join('?' * len(token_rows[0]))})",
+                    token_rows,
+                )
+            db.executemany("INSERT INTO accomplishments VALUES (?, ?, ?, ?)", acc_rows)
+    return len(changed), len(gone)
+
+
+def open_store(rebuild: bool = False) -> sqlite3.Connection:
+    """Open and sync the sidecar; callers close the connection."""
+    db = _connect(rebuild)
+    sync(db)
+    return db
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  Readers
+# ══════════════════════════════════════════════════════════════════════
+
+def skipped_files(db: Optional[sqlite3.Connection] = None) -> List[Tuple[str, str]]:
+    """(file name, error) for log files that failed to parse."""
+    own = db is None
+    db = db or open_store()
+    try:
+        return db.execute(
+            "SELECT name, error FROM files WHERE error IS NOT NULL ORDER BY name"
+        ).fetchall()
+    finally:
+        if own:
+            db.close()
+
+
+def load_logs(db: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
+    """Compact daily logs with a "date" key, sorted by file name.
+
+    Each dict has the shape of a daily log restricted to the fields the
+    engines read: date, stats (STAT_FIELDS), git_summary.commits_today,
+    token_usage (model, source, cost, token counts) and accomplishments
+    (type, value_score). Fields that were absent or null are omitted so
+    `.get(key, default)` behaves as it does on the full file.
+    """
+    own = db is None
+    db = db or open_store()
+    try:
+        tokens: Dict[str, List[Dict[str, Any]]] = {}
+        for row in db.execute(f"""
+            SELECT name, model, source, cost, {", ".join(TOKEN_FIELDS)}
+            FROM token_usage ORDER BY name, seq
+        """):
+            entry = {"model": row[1], "source": row[2], "cost": row[3]}
+            entry.update(zip(TOKEN_FIELDS, row[4:]))
+            tokens.setdefault(row[0], []).append(entry)
+
+        accs: Dict[str, List[Dict[str, Any]]] = {}
+        for name, acc_type, value_score in db.execute(
+            "SELECT name, type, value_score FROM accomplishments ORDER BY name, seq"
+        ):
+            acc: Dict[str, Any] = {}
+            if acc_type is not None:
+                acc["type"] = acc_type
+            if value_score is not None:
+                acc["value_score"] = value_score
+            accs.setdefault(name, []).append(acc)
+
+        logs: List[Dict[str, Any]] = []
+        for row in db.execute(f"""
+            SELECT name, date, {", ".join(STAT_FIELDS)}, commits_today
+            FROM days WHERE has_date ORDER BY name
+        """):
+            name, date = row[0], row[1]
+            stats = {k: v for k, v in zip(STAT_FIELDS, row[2:-1]) if v is not None}
+            git = {"commits_today": row[-1]} if row[-1] is not None else {}
+            logs.append({
+                "date": date,
+                "stats": stats,
+                "git_summary": git,
+                "token_usage": tokens.get(name, []),
+                "accomplishments": accs.get(name, []),
+            })
+        return logs
+    finally:
+        if own:
+            db.close()
+
+
+def load_columns(db: Optional[sqlite3.Connection] = None) -> DailyColumns:
+    """Per-day typed arrays for every dated log, in file-name order.
+
+    Non-numeric values read as 0, matching the engines' guards.
+    """
+    own = db is None
+    db = db or open_store()
+    try:
+        cols = DailyColumns()
+        for date, score, cost, commits, ship_rate, total_tokens in db.execute("""
+            SELECT date, output_score, agent_cost, commits_today, ship_rate, total_tokens
+            FROM days WHERE has_date ORDER BY name
+        """):
+            cols.dates.append(date)
+            cols.output_score.append(_number(score))
+            cols.agent_cost.append(_number(cost))
+            cols.commits_today.append(_number(commits))
+            cols.ship_rate.append(_number(ship_rate))
+            cols.total_tokens.append(total_tokens)
+        return cols
+    finally:
+        if own:
+            db.close()
+
+
+def load_token_rows(
+    db: Optional[sqlite3.Connection] = None,
+) -> Tuple[List[Any], List[Tuple[int, str, str, float]]]:
+    """Flatten token_usage across all dated logs.
+
+    Returns (dates, rows): dates has one slot per dated log in file-name
+    order (days without usage included); rows are (day index, model,
+    source, cost) in log order, with cost already coerced to a number.
+    """
+    own = db is None
+    db = db or open_store()
+    try:
+        dates: List[Any] = []
+        rows: List[Tuple[int, str, str, float]] = []
+        last_name = None
+        for name, date, model, source, cost in db.execute("""
+            SELECT d.name, d.date, t.model, t.source, t.cost
+            FROM days d LEFT JOIN token_usage t ON t.name = d.name
+            WHERE d.has_date
+            ORDER BY d.name, t.seq
+        """):
+            if name != last_name:
+                dates.append(date)
+                last_name = name
+            if model is not None:
+                rows.append((len(dates) - 1, model, source, cost))
+        return dates, rows
+    finally:
+        if own:
+            db.close()
+
+
+def letter_grades(dates: Iterable[str], db: Optional[sqlite3.Connection] = None) -> Dict[str, str]:
+    """{date: letter_grade} for the logs named <date>.json that parsed as objects.
+
+    Dates without a readable log are absent; a log without a grade maps to "".
+    """
+    names = [f"{d}.json" for d in dates]
+    if not names:
+        return {}
+    own = db is None
+    db = db or open_store()
+    try:
+        rows = db.execute(
+            f"SELECT name, letter_grade FROM days WHERE name IN ({', '.join('?' * len(names))})",
+            names,
+        ).fetchall()
+    finally:
+        if own:
+            db.close()
+    return {name[:-len(".json")]: grade if isinstance(grade, str) else "" for name, grade in rows}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Sync the daily-log cache sidecar")
+    parser.add_argument("--rebuild", action="store_true", help="Drop the cache and re-parse every log")
+    args = parser.parse_args()
+
+    db = _connect(rebuild=args.rebuild)
+    parsed, dropped = sync(db)
+    days = db.execute("SELECT COUNT(*) FROM days WHERE has_date").fetchone()[0]
+    errors = db.execute("SELECT COUNT(*) FROM files WHERE error IS NOT NULL").fetchone()[0]
+    db.close()
+
+    print(f"daily-log cache: {days} days ({parsed} re-parsed, {dropped} dropped, "
+          f"{errors} unreadable) → {CACHE_PATH.relative_to(REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
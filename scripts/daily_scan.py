@@ -10,6 +10,7 @@ v3: Auto-detect Claude Code tokens from JSONL, scoring engine with letter grades
 Usage:
     python3 scripts/daily_scan.py              # scan today
     python3 scripts/daily_scan.py --date 2026-02-11   # scan specific date
+    python3 scripts/daily_scan.py --since 2026-02-01 --until 2026-02-11   # backfill a range
 """
 
 import argparse
@@ -17,7 +18,8 @@ import json
 import os
 import re
 import subprocess
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -51,6 +53,33 @@ MTIME_SCAN_DIRS = [
     WEBSITE_DIR,
 ]
 
+# Skip patterns — don't count generated outputs, data files, or node_modules.
+# Matched as substrings of the repo-relative path; directories whose path
+# (plus "/") matches are pruned before the walker descends into them.
+MTIME_SKIP_PATTERNS = [
+    "node_modules/",
+    "data/daily-log/",
+    ".git/",
+    "__pycache__/",
+    "/schemas/",        # xlsx schema files aren't hand-authored
+    "/office/",         # xlsx office files aren't hand-authored
+    ".next/",           # Next.js build output
+    ".turbo/",          # Turborepo cache
+    "next-env.d.ts",    # Auto-generated Next.js type file
+    ".vercel/",         # Vercel project metadata
+    "package-lock.json",  # Lock files aren't hand-authored
+]
+
+# Extensions we care about (includes web files for website/ tracking)
+MTIME_VALID_EXTENSIONS = {".md", ".py", ".txt", ".csv", ".tsx", ".ts", ".css", ".yaml", ".json"}
+
+# Per-directory listing snapshot for scan_mtime_for_date
+MTIME_INDEX_PATH = REPO_ROOT / "data" / "mtime-scan-index.json"
+MTIME_INDEX_VERSION = 1
+# Directories modified this close to the previous walk may have changed
+# again within the same mtime tick — never trust their snapshot
+_MTIME_RACY_NS = 2_000_000_000
+
 # ── Claude Code project dir (for token auto-detection) ───────────────
 # Claude Code stores JSONL transcripts per-session in ~/.claude/projects/<slug>/
 CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
@@ -60,6 +89,13 @@ CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
 _repo_str = str(REPO_ROOT).replace("/", "-")
 CLAUDE_PROJECT_SLUG = CLAUDE_PROJECTS_DIR / _repo_str
 
+# Sidecar index of per-transcript, per-day usage totals + byte offsets, so
+# re-scans only read bytes appended since the last run
+TOKEN_INDEX_PATH = REPO_ROOT / "data" / "token-scan-index.json"
+TOKEN_INDEX_VERSION = 1
+_TS_DATE_RE = re.compile(rb'"timestamp"\s*:\s*"(\d{4}-\d{2}-\d{2})')
+_HEAD_BYTES = 64
+
 # ── Cursor IDE local data (for token auto-detection) ─────────────────
 # Cursor stores code-block tracking in a SQLite DB and conversation logs as txt files.
 CURSOR_PROJECTS_DIR = Path.home() / ".cursor" / "projects"
@@ -162,6 +198,10 @@ V4_GRADE_THRESHOLDS = [
 DEV_LINES_PER_DAY = 150   # Industry average for meaningful, reviewed code
 DEV_COST_PER_DAY = 500    # $125K/yr fully loaded
 
+# git log --format separators for load_git_history (can't appear in a subject)
+GIT_RECORD_SEP = "\x1e"
+GIT_FIELD_SEP = "\x1f"
+
 # ── Helpers ──────────────────────────────────────────────────────────
 
 def run_git(*args):
@@ -488,95 +528,173 @@ def compute_token_cost(entry):
     return round(cost, 4)
 
 
-def scan_claude_code_tokens(target_date):
-    """Parse Claude Code JSONL transcripts for today's sessions.
+def _load_token_index():
+    """Load the transcript token index sidecar, or an empty one."""
+    try:
+        index = json.loads(TOKEN_INDEX_PATH.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {"version": TOKEN_INDEX_VERSION, "files": {}}
+    if not isinstance(index, dict) or index.get("version") != TOKEN_INDEX_VERSION:
+        return {"version": TOKEN_INDEX_VERSION, "files": {}}
+    return index
 
-    Walks ~/.claude/projects/<project-slug>/*.jsonl, filters messages
-    with usage data that occurred on target_date.
 
-    Returns list of token_usage entries (one per session).
+def _save_token_index(index):
+    """Write the token index sidecar atomically (tmp file + rename)."""
+    try:
+        TOKEN_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = TOKEN_INDEX_PATH.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(index, separators=(",", ":")))
+        os.replace(tmp, TOKEN_INDEX_PATH)
+    except OSError:
+        pass  # sidecar is an optimisation — next run just re-reads more
+
+
+def _fold_usage_line(days, line, offset):
+    """Add one transcript line's usage to its day bucket. Returns True if counted.
+
+    Cheap byte checks run first: lines without a usage block or a
+    timestamp are skipped without JSON decoding.
     """
-    date_str = target_date.strftime("%Y-%m-%d")
-    entries = []
+    if b'"usage"' not in line:
+        return False
+    ts_match = _TS_DATE_RE.search(line)
+    if not ts_match:
+        return False
+    try:
+        obj = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return False
+
+    ts = obj.get("timestamp", "")
+    msg = obj.get("message", {})
+    if not isinstance(msg, dict) or not isinstance(ts, str):
+        return False
+    usage = msg.get("usage")
+    if not usage:
+        return False
+
+    day = days.setdefault(ts[:10], {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cache_read_tokens": 0,
+        "cache_write_tokens": 0,
+        "messages": 0,
+        "models": [],
+        "first_ts": None,
+        "last_ts": None,
+        "first_offset": offset,
+        "last_offset": offset,
+    })
+    day["input_tokens"] += usage.get("input_tokens", 0)
+    day["output_tokens"] += usage.get("output_tokens", 0)
+    day["cache_read_tokens"] += usage.get("cache_read_input_tokens", 0)
+    day["cache_write_tokens"] += usage.get("cache_creation_input_tokens", 0)
+    day["messages"] += 1
+    model = _map_model_name(msg.get("model", "unknown"))
+    if model not in day["models"]:
+        day["models"].append(model)
+    if day["first_ts"] is None or ts < day["first_ts"]:
+        day["first_ts"] = ts
+    if day["last_ts"] is None or ts > day["last_ts"]:
+        day["last_ts"] = ts
+    day["last_offset"] = offset
+    return True
+
+
+def index_transcript(jsonl_file, state):
+    """Tail-follow one transcript: fold only the bytes appended since state["offset"].
 
+    state is the file's sidecar record (or None). Returns the updated record.
+    Only newline-terminated lines are consumed; a partially written last
+    line is left for the next run.
+    """
+    try:
+        size = jsonl_file.stat().st_size
+        with open(jsonl_file, "rb") as f:
+            # First bytes fingerprint the file — a transcript replaced in
+            # place (or truncated) is re-indexed from scratch
+            head = f.read(_HEAD_BYTES)
+            stored_head = bytes.fromhex(state["head"]) if state else b""
+            if not state or not head.startswith(stored_head) or size < state["offset"]:
+                state = {"offset": 0, "head": "", "days": {}}
+            state["head"] = head.hex()
+            if size == state["offset"]:
+                return state
+
+            offset = state["offset"]
+            f.seek(offset)
+            days = state["days"]
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partial line still being written
+                _fold_usage_line(days, line, offset)
+                offset += len(line)
+            state["offset"] = offset
+    except OSError:
+        return state
+    return state
+
+
+def update_token_index():
+    """Bring the sidecar up to date with every Claude Code transcript.
+
+    Returns the {filename: record} map. Transcripts that disappeared are
+    dropped from the index.
+    """
+    index = _load_token_index()
+    files = index["files"]
     if not CLAUDE_PROJECT_SLUG.exists():
-        return entries
+        return {}
 
+    seen = set()
     for jsonl_file in sorted(CLAUDE_PROJECT_SLUG.glob("*.jsonl")):
-        session_id = jsonl_file.stem
-        # Per-session accumulators
-        total_input = 0
-        total_output = 0
-        total_cache_read = 0
-        total_cache_write = 0
-        models = set()
-        first_ts = None
-        last_ts = None
-        msg_count = 0
-        has_today = False
+        seen.add(jsonl_file.name)
+        state = index_transcript(jsonl_file, files.get(jsonl_file.name))
+        if state is not None:
+            files[jsonl_file.name] = state
+    for name in list(files):
+        if name not in seen:
+            del files[name]
 
-        try:
-            with open(jsonl_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-
-                    ts = obj.get("timestamp", "")
-                    msg = obj.get("message", {})
-                    if not isinstance(msg, dict):
-                        continue
-
-                    # Only count messages with usage data
-                    usage = msg.get("usage")
-                    if not usage:
-                        continue
-
-                    # Check if this message is from today
-                    if not ts.startswith(date_str):
-                        continue
-
-                    has_today = True
-                    msg_count += 1
-
-                    total_input += usage.get("input_tokens", 0)
-                    total_output += usage.get("output_tokens", 0)
-                    total_cache_read += usage.get("cache_read_input_tokens", 0)
-                    total_cache_write += usage.get("cache_creation_input_tokens", 0)
-
-                    model_raw = msg.get("model", "unknown")
-                    models.add(_map_model_name(model_raw))
-
-                    if first_ts is None or ts < first_ts:
-                        first_ts = ts
-                    if last_ts is None or ts > last_ts:
-                        last_ts = ts
+    _save_token_index(index)
+    return files
 
-        except OSError:
-            continue
 
-        if not has_today or msg_count == 0:
+def scan_claude_code_tokens(target_date):
+    """Summarise Claude Code token usage for target_date, one entry per session.
+
+    Reads per-day usage totals from the transcript index sidecar
+    (data/token-scan-index.json), which tail-follows each
+    ~/.claude/projects/<project-slug>/*.jsonl by byte offset — only bytes
+    appended since the last run are read and decoded.
+
+    Returns list of token_usage entries (one per session).
+    """
+    date_str = target_date.strftime("%Y-%m-%d")
+    entries = []
+
+    for name, state in sorted(update_token_index().items()):
+        day = state.get("days", {}).get(date_str)
+        if not day or day["messages"] == 0:
             continue
 
-        # Build the entry
-        model = sorted(models)[0] if len(models) == 1 else ",".join(sorted(models))
+        models = sorted(day["models"])
+        model = models[0] if len(models) == 1 else ",".join(models)
         entry = {
-            "session_id": session_id,
-            "input_tokens": total_input,
-            "output_tokens": total_output,
-            "cache_read_tokens": total_cache_read,
-            "cache_write_tokens": total_cache_write,
+            "session_id": Path(name).stem,
+            "input_tokens": day["input_tokens"],
+            "output_tokens": day["output_tokens"],
+            "cache_read_tokens": day["cache_read_tokens"],
+            "cache_write_tokens": day["cache_write_tokens"],
             "model": model,
             "source": "claude-code",
-            "messages": msg_count,
+            "messages": day["messages"],
             "logged_at": datetime.now().strftime("%H:%M"),
             "cost": None,  # computed later
         }
         # Add context from time range
+        first_ts = day["first_ts"]
         if first_ts:
             try:
                 start_hm = datetime.fromisoformat(first_ts.replace("Z", "+00:00")).strftime("%H:%M")
@@ -809,58 +927,93 @@ def compute_cost_metrics(output_score, total_cost):
 
 # ── V4 Commit-Based Scoring Engine ──────────────────────────────────
 
-def get_commit_hashes(target_date):
-    """Get all commit hashes for the target date, oldest first."""
-    date_str = target_date.strftime("%Y-%m-%d")
-    lines = run_git(
-        "log",
-        f"--since={date_str} 00:00",
-        f"--until={date_str} 23:59:59",
-        "--format=%H",
-        "--reverse"
+def load_git_history(since_date, until_date=None):
+    """Read every commit from since_date through until_date in one git log pass.
+
+    A single `git log --raw --numstat` replaces the per-day and per-commit
+    calls (three for scan_git, three more per commit for classify_commit).
+    --raw supplies the name-status letters: git drops --numstat when it is
+    combined with --name-status.
+
+    Returns {"YYYY-MM-DD": [record, ...]} with each day's commits oldest first.
+    A record holds hash, timestamp (HH:MM), message, status [(code, path)]
+    and numstat [(added, removed, path)] with None for binary counts.
+    """
+    until_date = until_date or since_date
+    result = subprocess.run(
+        ["git", "-C", str(REPO_ROOT), "log",
+         f"--since={since_date.strftime('%Y-%m-%d')} 00:00",
+         f"--until={until_date.strftime('%Y-%m-%d')} 23:59:59",
+         "--reverse", "--raw", "--numstat", "--date=format:%H:%M",
+         f"--format={GIT_RECORD_SEP}%H{GIT_FIELD_SEP}%ct{GIT_FIELD_SEP}%cd{GIT_FIELD_SEP}%s"],
+        capture_output=True, text=True
     )
-    return [h.strip() for h in lines if h.strip()]
 
+    history = {}
+    record = None
+    for line in result.stdout.split("\n"):  # not splitlines(): it treats \x1e/\x1f as breaks
+        if line.startswith(GIT_RECORD_SEP):
+            fields = line[1:].split(GIT_FIELD_SEP, 3)
+            if len(fields) != 4:
+                record = None
+                continue
+            commit_hash, epoch, timestamp, message = fields
+            day = datetime.fromtimestamp(int(epoch)).strftime("%Y-%m-%d")
+            record = {
+                "hash": commit_hash,
+                "timestamp": timestamp.strip(),
+                "message": message,
+                "status": [],
+                "numstat": [],
+            }
+            history.setdefault(day, []).append(record)
+        elif record is None or not line.strip():
+            continue
+        elif line.startswith(":"):
+            # :<mode> <mode> <sha> <sha> <status>\t<path>[\t<path>]
+            meta, _, filepath = line.partition("\t")
+            record["status"].append((meta.split(" ")[-1], filepath))
+        else:
+            parts = line.split("\t")
+            if len(parts) != 3:
+                continue
+            try:
+                added = int(parts[0]) if parts[0] != "-" else None
+                removed = int(parts[1]) if parts[1] != "-" else None
+            except ValueError:
+                continue
+            record["numstat"].append((added, removed, parts[2]))
+    return history
+
+
+def get_commits(target_date, history=None):
+    """Commit records for the target date, oldest first."""
+    if history is None:
+        history = load_git_history(target_date)
+    return history.get(target_date.strftime("%Y-%m-%d"), [])
 
-def classify_commit(commit_hash):
-    """Classify a single commit by examining message, files, and line counts.
+
+def classify_commit(commit):
+    """Classify a single commit record by examining message, files, and line counts.
 
     Returns a dict with hash, message, type, score, files_changed,
     lines_added, lines_removed, lines_net, directories, timestamp.
     """
-    # Get commit message
-    msg_lines = run_git("log", "--format=%s", "-1", commit_hash)
-    message = msg_lines[0] if msg_lines else ""
-
-    # Get timestamp (local time)
-    ts_lines = run_git("log", "--format=%cd", "--date=format:%H:%M", "-1", commit_hash)
-    timestamp = ts_lines[0].strip() if ts_lines else ""
-
-    # Get numstat (lines added/removed per file)
-    numstat_lines = run_git("show", "--numstat", "--format=", commit_hash)
+    commit_hash = commit["hash"]
+    message = commit["message"]
+    timestamp = commit["timestamp"]
 
     files = []
     total_added = 0
     total_removed = 0
     directories = set()
 
-    for line in numstat_lines:
-        line = line.strip()
-        if not line:
-            continue
-        parts = line.split("\t")
-        if len(parts) == 3:
-            filepath = parts[2]
-            try:
-                added = int(parts[0]) if parts[0] != "-" else 0
-                removed = int(parts[1]) if parts[1] != "-" else 0
-            except ValueError:
-                continue
-            total_added += added
-            total_removed += removed
-            files.append(filepath)
-            top_dir = filepath.split("/")[0] + "/"
-            directories.add(top_dir)
+    for added, removed, filepath in commit["numstat"]:
+        total_added += added or 0
+        total_removed += removed or 0
+        files.append(filepath)
+        top_dir = filepath.split("/")[0] + "/"
+        directories.add(top_dir)
 
     msg_lower = message.lower()
     file_count = len(files)
@@ -1125,77 +1278,48 @@ def compute_token_efficiency(token_usage, output_score, commit_count, net_lines)
 
 # ── Git scanning ─────────────────────────────────────────────────────
 
-def scan_git(target_date):
+def scan_git(target_date, commits=None):
     """Get files added/modified in git commits on target_date.
 
+    Reads the day's commit records (see load_git_history); pass them in to
+    reuse an already-loaded history.
+
     Returns (added, modified, commit_count, lines_added_total, lines_removed_total,
              code_loc, content_loc, data_loc).
     """
-    date_str = target_date.strftime("%Y-%m-%d")
-    lines = run_git(
-        "log",
-        f"--since={date_str} 00:00",
-        f"--until={date_str} 23:59:59",
-        "--name-status",
-        "--pretty=format:"
-    )
+    if commits is None:
+        commits = get_commits(target_date)
 
     added = set()
     modified = set()
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        parts = line.split("\t", 1)
-        if len(parts) != 2:
-            continue
-        status, filepath = parts
-        if status.startswith("A"):
-            added.add(filepath)
-        elif status.startswith("M"):
-            modified.add(filepath)
-
-    # Also count commits
-    commit_lines = run_git(
-        "log",
-        f"--since={date_str} 00:00",
-        f"--until={date_str} 23:59:59",
-        "--oneline"
-    )
-    commit_count = len(commit_lines)
-
-    # LOC via numstat — also classify by file extension category
-    numstat_lines = run_git(
-        "log",
-        f"--since={date_str} 00:00",
-        f"--until={date_str} 23:59:59",
-        "--numstat",
-        "--pretty=format:"
-    )
     lines_added_total = 0
     lines_removed_total = 0
     code_loc = 0
     content_loc = 0
     data_loc = 0
-    for line in numstat_lines:
-        parts = line.split("\t")
-        if len(parts) == 3 and parts[0] != "-":
-            try:
-                added_count = int(parts[0])
-                lines_added_total += added_count
-                lines_removed_total += int(parts[1])
-                # Classify added lines by file extension
-                ext = Path(parts[2]).suffix.lower()
-                if ext in CODE_EXTENSIONS:
-                    code_loc += added_count
-                elif ext in CONTENT_EXTENSIONS:
-                    content_loc += added_count
-                else:
-                    data_loc += added_count
-            except ValueError:
+    for commit in commits:
+        for status, filepath in commit["status"]:
+            if status.startswith("A"):
+                added.add(filepath)
+            elif status.startswith("M"):
+                modified.add(filepath)
+
+        # LOC via numstat — also classify by file extension category
+        for added_count, removed_count, filepath in commit["numstat"]:
+            if added_count is None:
                 continue
+            lines_added_total += added_count
+            lines_removed_total += removed_count
+            # Classify added lines by file extension
+            ext = Path(filepath).suffix.lower()
+            if ext in CODE_EXTENSIONS:
+                code_loc += added_count
+            elif ext in CONTENT_EXTENSIONS:
+                content_loc += added_count
+            else:
+                data_loc += added_count
 
-    return added, modified, commit_count, lines_added_total, lines_removed_total, code_loc, content_loc, data_loc
+    return added, modified, len(commits), lines_added_total, lines_removed_total, code_loc, content_loc, data_loc
 
 
 def scan_untracked_for_date(target_date):
@@ -1211,65 +1335,124 @@ def scan_untracked_for_date(target_date):
     return matched
 
 
-def scan_mtime_for_date(target_date):
-    """Find files modified on target_date by checking filesystem mtime.
+def _mtime_filter_key():
+    """Signature of the walk filters; a snapshot taken under others is discarded."""
+    return [MTIME_INDEX_VERSION, MTIME_SKIP_PATTERNS, sorted(MTIME_VALID_EXTENSIONS)]
 
-    This catches files that don't have date prefixes in their names — like
-    clients/partner/acme-consulting/prompts/web-reveal-qualification.md, icp.md,
-    SKILL.md, etc. Walks MTIME_SCAN_DIRS and collects any .md or .py file
-    whose mtime falls on the target date.
 
-    Returns a set of repo-relative paths.
-    """
-    date_str = target_date.strftime("%Y-%m-%d")
-    matched = set()
+def _load_mtime_index():
+    """Load the directory listing snapshot, or an empty one."""
+    empty = {"filters": _mtime_filter_key(), "walked_ns": 0, "dirs": {}}
+    try:
+        index = json.loads(MTIME_INDEX_PATH.read_text())
+    except (OSError, json.JSONDecodeError):
+        return empty
+    if not isinstance(index, dict) or index.get("filters") != _mtime_filter_key():
+        return empty
+    return index
 
-    # Skip patterns — don't count generated outputs, data files, or node_modules
-    SKIP_PATTERNS = [
-        "node_modules/",
-        "data/daily-log/",
-        ".git/",
-        "__pycache__/",
-        "/schemas/",        # xlsx schema files aren't hand-authored
-        "/office/",         # xlsx office files aren't hand-authored
-        ".next/",           # Next.js build output
-        ".turbo/",          # Turborepo cache
-        "next-env.d.ts",    # Auto-generated Next.js type file
-        ".vercel/",         # Vercel project metadata
-        "package-lock.json",  # Lock files aren't hand-authored
-    ]
 
-    # Extensions we care about (includes web files for website/ tracking)
-    VALID_EXTENSIONS = {".md", ".py", ".txt", ".csv", ".tsx", ".ts", ".css", ".yaml", ".json"}
+def _save_mtime_index(index):
+    """Write the directory listing snapshot atomically (tmp file + rename)."""
+    try:
+        MTIME_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = MTIME_INDEX_PATH.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(index, separators=(",", ":")))
+        os.replace(tmp, MTIME_INDEX_PATH)
+    except OSError:
+        pass  # snapshot is an optimisation — next run just lists more dirs
 
-    for scan_dir in MTIME_SCAN_DIRS:
-        if not scan_dir.exists():
-            continue
-        for fpath in scan_dir.rglob("*"):
-            if not fpath.is_file():
-                continue
-            if fpath.suffix not in VALID_EXTENSIONS:
-                continue
 
-            rel = str(fpath.relative_to(REPO_ROOT))
+def _list_mtime_dir(dir_path, rel_dir, files):
+    """scandir one directory: record candidate file mtimes, return (file names, subdir names).
 
-            # Skip noisy paths
-            if any(pat in rel for pat in SKIP_PATTERNS):
+    Skipped subdirectories are dropped here so the walk never enters them.
+    """
+    names = []
+    subdirs = []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            rel = f"{rel_dir}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if not any(pat in rel + "/" for pat in MTIME_SKIP_PATTERNS):
+                    subdirs.append(entry.name)
                 continue
-
             # Skip files that start with _ (internal/generator scripts)
-            if fpath.name.startswith("_"):
+            if entry.name.startswith("_") or os.path.splitext(entry.name)[1] not in MTIME_VALID_EXTENSIONS:
+                continue
+            if any(pat in rel for pat in MTIME_SKIP_PATTERNS):
                 continue
+            try:
+                if not entry.is_file():
+                    continue
+                files[rel] = entry.stat().st_mtime
+            except OSError:
+                continue
+            names.append(entry.name)
+    return names, subdirs
+
+
+def walk_mtimes():
+    """Return {repo-relative path: mtime} for every candidate file under MTIME_SCAN_DIRS.
+
+    Walks with os.scandir, pruning MTIME_SKIP_PATTERNS directories before
+    descending. A directory whose mtime matches the persisted snapshot has
+    the same entries as last time, so its filtered listing is reused and
+    only its candidate files are stat'ed. Directory mtimes don't move when a
+    file is edited in place, so every candidate file is still stat'ed.
+    """
+    index = _load_mtime_index()
+    snapshot = index["dirs"]
+    trusted_before = index.get("walked_ns", 0) - _MTIME_RACY_NS
+    walked_ns = time.time_ns()
+
+    files = {}
+    fresh = {}
+    stack = [d for d in MTIME_SCAN_DIRS if d.is_dir()]
+    while stack:
+        dir_path = stack.pop()
+        rel_dir = dir_path.relative_to(REPO_ROOT).as_posix()
+        try:
+            dir_mtime = os.stat(dir_path).st_mtime_ns
+        except OSError:
+            continue
 
+        cached = snapshot.get(rel_dir)
+        if cached and cached["mtime_ns"] == dir_mtime and dir_mtime < trusted_before:
+            names, subdirs = cached["files"], cached["dirs"]
+            for name in names:
+                try:
+                    files[f"{rel_dir}/{name}"] = os.stat(dir_path / name).st_mtime
+                except OSError:
+                    continue
+        else:
             try:
-                mtime = os.path.getmtime(fpath)
-                mtime_date = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
-                if mtime_date == date_str:
-                    matched.add(rel)
+                names, subdirs = _list_mtime_dir(dir_path, rel_dir, files)
             except OSError:
                 continue
 
-    return matched
+        fresh[rel_dir] = {"mtime_ns": dir_mtime, "files": names, "dirs": subdirs}
+        stack.extend(dir_path / name for name in subdirs)
+
+    _save_mtime_index({"filters": _mtime_filter_key(), "walked_ns": walked_ns, "dirs": fresh})
+    return files
+
+
+def scan_mtime_for_date(target_date):
+    """Find files modified on target_date by checking filesystem mtime.
+
+    This catches files that don't have date prefixes in their names — like
+    clients/partner/acme-consulting/prompts/web-reveal-qualification.md, icp.md,
+    SKILL.md, etc. Walks MTIME_SCAN_DIRS (see walk_mtimes) and collects any
+    candidate file whose mtime falls on the target date.
+
+    Returns a set of repo-relative paths.
+    """
+    date_str = target_date.strftime("%Y-%m-%d")
+    return {
+        rel for rel, mtime in walk_mtimes().items()
+        if datetime.fromtimestamp(mtime).strftime("%Y-%m-%d") == date_str
+    }
 
 
 # ── Pipeline scanning ────────────────────────────────────────────────
@@ -1523,22 +1706,19 @@ def merge_log(existing, new_data):
     return new_data
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Daily activity scanner")
-    parser.add_argument("--date", type=str, help="Date to scan (YYYY-MM-DD). Defaults to today.")
-    args = parser.parse_args()
-
-    if args.date:
-        target_date = datetime.strptime(args.date, "%Y-%m-%d").date()
-    else:
-        target_date = datetime.now().date()
+def scan_day(target_date, history=None):
+    """Scan one date and write/merge its daily log.
 
+    history is a load_git_history() result covering target_date; when
+    omitted the day's commits are loaded on their own.
+    """
     date_str = target_date.strftime("%Y-%m-%d")
     LOG_DIR.mkdir(parents=True, exist_ok=True)
     log_path = LOG_DIR / f"{date_str}.json"
 
     # Scan git
-    added, modified, commit_count, lines_added_total, lines_removed_total, code_loc, content_loc, data_loc = scan_git(target_date)
+    day_commits = get_commits(target_date, history)
+    added, modified, commit_count, lines_added_total, lines_removed_total, code_loc, content_loc, data_loc = scan_git(target_date, day_commits)
     untracked = scan_untracked_for_date(target_date)
 
     # Scan by file modification time (catches non-date-prefixed files like client deliverables)
@@ -1548,8 +1728,7 @@ def main():
     accomplishments = build_accomplishments(added, modified, untracked, mtime_files, target_date)
 
     # V4: Classify commits
-    commit_hashes = get_commit_hashes(target_date)
-    commits = [classify_commit(h) for h in commit_hashes]
+    commits = [classify_commit(c) for c in day_commits]
 
     # Scan pipeline
     drafts_active = scan_pipeline()
@@ -1697,5 +1876,32 @@ def main():
     print(f"  Output: {log_path.relative_to(REPO_ROOT)}")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Daily activity scanner")
+    parser.add_argument("--date", type=str, help="Date to scan (YYYY-MM-DD). Defaults to today.")
+    parser.add_argument("--since", type=str, help="Backfill from this date (YYYY-MM-DD), inclusive")
+    parser.add_argument("--until", type=str, help="Backfill through this date (YYYY-MM-DD). Defaults to today.")
+    args = parser.parse_args()
+
+    if args.since:
+        if args.date:
+            parser.error("--date cannot be combined with --since/--until")
+        start = datetime.strptime(args.since, "%Y-%m-%d").date()
+        end = datetime.strptime(args.until, "%Y-%m-%d").date() if args.until else datetime.now().date()
+        if end < start:
+            parser.error("--until is before --since")
+    elif args.until:
+        parser.error("--until requires --since")
+    else:
+        start = end = datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else datetime.now().date()
+
+    # One git log pass covers every day in the range
+    history = load_git_history(start, end)
+    day = start
+    while day <= end:
+        scan_day(day, history)
+        day += timedelta(days=1)
+
+
 if __name__ == "__main__":
     main()
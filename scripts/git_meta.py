@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+git_meta.py — Shared last-commit-date cache for repo files.
+
+Walks `git log --name-only` once and builds a path -> last-commit-date map,
+instead of spawning one `git log -1 -- <path>` subprocess per file. The map
+is persisted to data/git-meta-cache.json keyed by HEAD; when HEAD moves
+forward only the new commits are walked and merged in.
+
+Used by build_index.py and skill_inventory.py. Stdlib only.
+
+Usage:
+    from git_meta import get_git_date
+    get_git_date("content/x/final/2026-02-10_content-os-meta.txt")  # "2026-02-10"
+
+    python3 scripts/git_meta.py            # warm the cache, print stats
+    python3 scripts/git_meta.py <path>...  # print last commit dates
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_PATH = REPO_ROOT / "data" / "git-meta-cache.json"
+
+# Record marker that can't appear in a file path line
+_COMMIT_MARK = "\x1e"
+
+_dates = None  # in-process cache: repo-relative path -> "%ai" string
+
+
+def _git(*args):
+    """Run a git command in the repo; return stdout or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(REPO_ROOT), "-c", "core.quotePath=false"] + list(args),
+            capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _walk_log(rev_range=None):
+    """Walk git log once and return {path: author date} for the newest commit per path."""
+    args = ["log", f"--format={_COMMIT_MARK}%ai", "--name-only"]
+    if rev_range:
+        args.append(rev_range)
+    out = _git(*args)
+    if out is None:
+        return {}
+
+    dates = {}
+    current = None
+    for line in out.split("\n"):  # not splitlines(): it treats \x1e as a break
+        if line.startswith(_COMMIT_MARK):
+            current = line[1:].strip()
+        elif line and current and line not in dates:
+            # git log is newest-first, so the first sighting wins
+            dates[line] = current
+    return dates
+
+
+def _load_persisted():
+    """Read the on-disk cache; returns (head, dates) or (None, {})."""
+    try:
+        data = json.loads(CACHE_PATH.read_text())
+        return data.get("head"), data.get("dates", {})
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return None, {}
+
+
+def _save_persisted(head, dates):
+    """Write the cache atomically (tmp file + rename)."""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_PATH.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"head": head, "dates": dates}))
+        os.replace(tmp, CACHE_PATH)
+    except OSError:
+        pass  # cache is an optimisation — never fail the caller
+
+
+def load_git_dates():
+    """Return the path -> last-commit-date map, building or refreshing it as needed."""
+    global _dates
+    if _dates is not None:
+        return _dates
+
+    head = (_git("rev-parse", "HEAD") or "").strip() or None
+    if head is None:
+        _dates = {}
+        return _dates
+
+    cached_head, cached = _load_persisted()
+    if cached_head == head:
+        _dates = cached
+        return _dates
+
+    is_ancestor = (
+        cached_head
+        and _git("merge-base", "--is-ancestor", cached_head, head) is not None
+    )
+    if is_ancestor:
+        # Fast-forward: only walk the new commits and overlay them
+        dates = dict(cached)
+        dates.update(_walk_log(f"{cached_head}..{head}"))
+    else:
+        dates = _walk_log()
+
+    _save_persisted(head, dates)
+    _dates = dates
+    return _dates
+
+
+def get_git_datetime(filepath):
+    """Last commit date for a file as git's %ai string, or None if untracked."""
+    path = os.fspath(filepath)
+    if os.path.isabs(path):
+        path = os.path.relpath(path, REPO_ROOT)
+    return load_git_dates().get(Path(path).as_posix())
+
+
+def get_git_date(filepath):
+    """Last commit date (YYYY-MM-DD) for a file, or None if untracked."""
+    stamp = get_git_datetime(filepath)
+    return stamp.split(" ")[0] if stamp else None
+
+
+def main():
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            print(f"{get_git_date(path) or '-'}  {path}")
+        return 0
+    dates = load_git_dates()
+    print(f"git meta cache: {len(dates)} paths → {CACHE_PATH.relative_to(REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,7 @@ if Grok is unavailable.
 Usage:
     python3 scripts/linkedin_scout.py          # full scout run
     python3 scripts/linkedin_scout.py --test   # single query, print results
+    python3 scripts/linkedin_scout.py --workers 1  # one mission at a time
 """
 
 import argparse
@@ -16,19 +17,27 @@ import json
 import os
 import subprocess
 import sys
-import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from llm_client import (  # pooled, cached, rate-limited
+    TOOL_NUDGE_JSON as TOOL_NUDGE,
+    TOOL_NUDGE_JSON_FINAL as TOOL_NUDGE_FINAL,
+    grok_tool_loop,
+    print_metrics,
+)
+from scout_common import SCOUT_WORKERS, acquire_lock, release_lock, run_missions
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SCOUT_DIR = REPO_ROOT / "data" / "linkedin" / "scout"
 LOCK_PATH = REPO_ROOT / "data" / "linkedin" / "_scout.lock"
 CLAUDE_CLI = "/opt/homebrew/bin/claude"
 
 # Grok API settings
-XAI_BASE_URL = "https://api.x.ai/v1"
 XAI_MODEL = "grok-4-1-fast-non-reasoning"
 
 # Search missions
@@ -51,80 +60,6 @@ SEARCH_MISSIONS = [
 ]
 
 
-# -- Lock file ---------------------------------------------------------------
-
-def acquire_lock():
-    if LOCK_PATH.exists():
-        pid = LOCK_PATH.read_text().strip()
-        print(f"ERROR: Lock file exists (PID {pid}). Remove {LOCK_PATH} if stale.")
-        sys.exit(1)
-    LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
-    LOCK_PATH.write_text(str(os.getpid()))
-
-
-def release_lock():
-    if LOCK_PATH.exists():
-        LOCK_PATH.unlink()
-
-
-# -- Grok API ----------------------------------------------------------------
-
-def grok_chat(api_key, messages, tools=None):
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
-    payload = {
-        "model": XAI_MODEL,
-        "messages": messages,
-        "stream": False,
-        "temperature": 0.3,
-    }
-    if tools:
-        payload["tools"] = tools
-
-    resp = requests.post(
-        f"{XAI_BASE_URL}/chat/completions",
-        headers=headers,
-        json=payload,
-        timeout=60,
-    )
-    resp.raise_for_status()
-    return resp.json()
-
-
-def grok_tool_loop(api_key, messages, tools, max_rounds=5):
-    """Call Grok with tools, follow tool-call loop until content is returned."""
-    for round_num in range(max_rounds):
-        result = grok_chat(api_key, messages, tools)
-        msg = result["choices"][0]["message"]
-
-        content = msg.get("content") or ""
-        if content.strip():
-            return content
-
-        tool_calls = msg.get("tool_calls")
-        if not tool_calls:
-            return content
-
-        messages.append(msg)
-
-        nudge = (
-            "You have enough data. Stop searching and return the JSON now."
-            if round_num >= 2
-            else "Search executed successfully. Summarize the findings as JSON."
-        )
-
-        for tc in tool_calls:
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tc["id"],
-                "content": nudge,
-            })
-
-    return ""
-
-
 def build_search_url(query_terms):
     """Build a Google search URL scoped to linkedin.com."""
     encoded = requests.utils.quote(f"site:linkedin.com {query_terms}")
@@ -174,7 +109,8 @@ If you can't find exact URLs, leave the url field as empty string.""",
         }
     ]
 
-    raw = grok_tool_loop(api_key, messages, tools)
+    raw = grok_tool_loop(messages, tools, model=XAI_MODEL, api_key=api_key,
+                         nudge=TOOL_NUDGE, final_nudge=TOOL_NUDGE_FINAL)
 
     # Parse JSON from response
     raw = raw.strip()
@@ -286,6 +222,8 @@ Base these on real LinkedIn content patterns and current industry trends. No mar
 def main():
     parser = argparse.ArgumentParser(description="Scout LinkedIn for trending content")
     parser.add_argument("--test", action="store_true", help="Single query, print results")
+    parser.add_argument("--workers", type=int, default=SCOUT_WORKERS,
+                        help=f"Missions run concurrently (default: {SCOUT_WORKERS})")
     args = parser.parse_args()
 
     # Load .env
@@ -301,36 +239,33 @@ def main():
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
     SCOUT_DIR.mkdir(parents=True, exist_ok=True)
-    acquire_lock()
+    acquire_lock(LOCK_PATH)
 
     try:
         missions = SEARCH_MISSIONS
         if args.test:
             missions = missions[:1]
 
-        all_sources = []
         engine = "grok" if xai_api_key else "claude-fallback"
+        fallbacks = []
 
         print(f"[linkedin_scout] {engine} mode | {'TEST - ' if args.test else ''}{len(missions)} mission(s)")
 
-        for mission in missions:
-            print(f"  {mission['name']}...", end=" ", flush=True)
-
+        def scout_mission(mission):
             if xai_api_key:
                 try:
-                    sources = grok_scout_mission(xai_api_key, mission)
+                    return grok_scout_mission(xai_api_key, mission)
                 except (requests.RequestException, KeyError) as e:
-                    print(f"Grok failed ({e}), falling back to Claude...", end=" ")
-                    sources = claude_fallback_mission(mission)
-                    engine = "claude-fallback"
-            else:
-                sources = claude_fallback_mission(mission)
-
-            all_sources.extend(sources)
-            print(f"{len(sources)} found")
+                    print(f"  {mission['name']}: Grok failed ({e}), falling back to Claude...", flush=True)
+                    fallbacks.append(mission["name"])
+            return claude_fallback_mission(mission)
 
-            if mission != missions[-1]:
-                time.sleep(2)  # rate limit
+        # Missions are independent; run them side by side and write once
+        results = run_missions(missions, scout_mission, workers=args.workers,
+                               label=lambda mission: mission["name"])
+        all_sources = [source for sources in results for source in sources]
+        if fallbacks:
+            engine = "claude-fallback"
 
         # Build output
         output = {
@@ -341,10 +276,13 @@ def main():
             "sources": all_sources,
         }
 
-        # Write output
+        # Write output (temp file + rename, so readers never see a partial file)
         output_path = SCOUT_DIR / f"{today}.json"
-        output_path.write_text(json.dumps(output, indent=2))
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(output, indent=2))
+        os.replace(tmp_path, output_path)
         print(f"\nDone. {len(all_sources)} sources saved to {output_path}")
+        print_metrics()
 
         if args.test and all_sources:
             print("\n-- Scouted Sources --")
@@ -356,7 +294,7 @@ def main():
                 print()
 
     finally:
-        release_lock()
+        release_lock(LOCK_PATH)
 
 
 if __name__ == "__main__":
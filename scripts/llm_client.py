@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+llm_client.py — Shared Grok / Claude chat client for the scouts and ABM.
+
+One place for what x_scout, reddit_scout, linkedin_scout, agents/scout and
+abm/generate each used to hand-roll:
+
+  - a pooled requests.Session (keep-alive, retries on 429/5xx honouring
+    Retry-After) instead of a fresh connection per requests.post
+  - a content-addressed response cache under data/llm-cache/: the key is a
+    hash of the provider and the full request payload (model, messages,
+    tools, sampling params), entries expire after LLM_CACHE_TTL seconds
+    (default 6h; 0 disables). Re-runs and --test runs during development
+    replay from disk instantly and for free.
+  - a per-provider token bucket, applied to network calls only (cache hits
+    skip it), replacing the time.sleep()s between calls
+  - grok_tool_loop(), which answers repeated identical tool calls with a
+    "you already ran this" result and jumps straight to the final nudge
+  - per-call latency and token metrics (one stderr line per call, totals
+    via print_metrics())
+
+Stdlib + requests.
+
+Usage:
+    from llm_client import grok_chat, grok_tool_loop, claude_chat, print_metrics
+
+    text = grok_tool_loop(messages, tools, model="grok-4-1-fast-non-reasoning")
+    data = grok_chat(messages, temperature=0.7)        # raw response JSON
+    text = claude_chat(messages, model="claude-opus-4-6")
+    print_metrics()
+
+    LLM_CACHE_TTL=0 python3 scripts/x_scout.py      # bypass the cache
+    python3 scripts/llm_client.py --stats           # cache size
+    python3 scripts/llm_client.py --prune           # drop expired entries
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = REPO_ROOT / "data" / "llm-cache"
+
+XAI_BASE_URL = "https://api.x.ai/v1"
+GROK_MODEL = "grok-4-1-fast-non-reasoning"
+ANTHROPIC_BASE_URL = "https://api.anthropic.com/v1"
+CLAUDE_MODEL = "claude-opus-4-6"
+
+DEFAULT_CACHE_TTL = 6 * 3600
+POOL_MAXSIZE = 8
+
+# Provider -> (requests per second, burst) for uncached calls
+RATE_LIMITS = {
+    "xai": (1, 4),
+    "anthropic": (1, 2),
+}
+
+# Tool-loop nudges: normal, and once the model keeps searching
+TOOL_NUDGE = "Search executed successfully. Summarize the findings."
+TOOL_NUDGE_FINAL = "You have enough data. Stop searching and summarize all findings now."
+# ...and for scouts that expect a JSON payload back
+TOOL_NUDGE_JSON = "Search executed successfully. Summarize the findings as JSON."
+TOOL_NUDGE_JSON_FINAL = "You have enough data. Stop searching and return the JSON now."
+TOOL_DUPLICATE = "This exact search already ran earlier in this conversation; use those results."
+
+_session = None
+_session_lock = threading.Lock()
+_buckets = {}
+_metrics_lock = threading.Lock()
+_calls = []
+
+
+# ── Transport ────────────────────────────────────────────────────────────
+
+def get_session():
+    """Shared keep-alive session; retries 429/5xx with Retry-After-aware backoff."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"POST"}),  # chat completions are safe to repeat
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=len(RATE_LIMITS), pool_maxsize=POOL_MAXSIZE,
+                                  max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+class _Bucket:
+    """Thread-safe token bucket."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def throttle(provider):
+    """Wait for a request slot on the provider's bucket."""
+    with _session_lock:
+        bucket = _buckets.get(provider)
+        if bucket is None:
+            bucket = _buckets[provider] = _Bucket(*RATE_LIMITS.get(provider, (1, 1)))
+    bucket.acquire()
+
+
+# ── Cache ────────────────────────────────────────────────────────────────
+
+def cache_ttl():
+    """Cache lifetime in seconds from LLM_CACHE_TTL (0 disables the cache)."""
+    try:
+        return max(0, int(os.environ.get("LLM_CACHE_TTL", DEFAULT_CACHE_TTL)))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def cache_key(provider, payload):
+    """Content address for a request: sha256 of provider + canonical payload JSON."""
+    canonical = json.dumps([provider, payload], sort_keys=True, separators=(",", ":"),
+                           ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _cache_path(key):
+    return CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def cache_get(key, ttl):
+    """Cached response JSON for key, or None if missing/expired/unreadable."""
+    if ttl <= 0:
+        return None
+    path = _cache_path(key)
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if time.time() - entry.get("created_at", 0) > ttl:
+        return None
+    return entry.get("response")
+
+
+def cache_put(key, provider, model, response):
+    """Write a response atomically (tmp file + rename)."""
+    path = _cache_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump({"created_at": time.time(), "provider": provider, "model": model,
+                   "response": response}, f)
+    os.replace(tmp, path)
+
+
+# ── Metrics ──────────────────────────────────────────────────────────────
+
+def _usage(provider, response):
+    """(input tokens, output tokens) from an OpenAI- or Anthropic-style response."""
+    usage = response.get("usage") or {}
+    if provider == "anthropic":
+        return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+    return usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+
+
+def _record(provider, model, response, latency, cached):
+    tokens_in, tokens_out = _usage(provider, response)
+    with _metrics_lock:
+        _calls.append({
+            "provider": provider, "model": model, "latency": latency, "cached": cached,
+            "input_tokens": tokens_in, "output_tokens": tokens_out,
+        })
+    source = "cache" if cached else f"{latency:.2f}s"
+    print(f"    [llm] {model} {source} {tokens_in}+{tokens_out} tok", file=sys.stderr)
+
+
+def metrics():
+    """Totals per model: calls, cache hits, network latency, tokens (cache hits excluded)."""
+    summary = {}
+    with _metrics_lock:
+        calls = list(_calls)
+    for call in calls:
+        row = summary.setdefault(call["model"], {
+            "calls": 0, "cached": 0, "latency": 0.0, "input_tokens": 0, "output_tokens": 0,
+        })
+        row["calls"] += 1
+        if call["cached"]:
+            row["cached"] += 1
+            continue
+        row["latency"] += call["latency"]
+        row["input_tokens"] += call["input_tokens"]
+        row["output_tokens"] += call["output_tokens"]
+    return summary
+
+
+def print_metrics():
+    """Print one line of call/token totals per model (nothing if no calls)."""
+    for model, row in sorted(metrics().items()):
+        live = row["calls"] - row["cached"]
+        avg = row["latency"] / live if live else 0
+        print(f"[llm] {model}: {row['calls']} calls ({row['cached']} cached), "
+              f"avg {avg:.2f}s, {row['input_tokens']:,} in / {row['output_tokens']:,} out tokens")
+
+
+# ── Calls ────────────────────────────────────────────────────────────────
+
+def _post(provider, url, headers, payload, timeout, transport, ttl, refresh=False):
+    """POST with cache lookup, throttling and metrics. Returns response JSON.
+
+    refresh=True skips the cache lookup but still stores the new response,
+    replacing whatever was cached for this payload.
+    """
+    ttl = cache_ttl() if ttl is None else ttl
+    key = cache_key(provider, payload)
+    cached = None if refresh else cache_get(key, ttl)
+    if cached is not None:
+        _record(provider, payload["model"], cached, 0.0, cached=True)
+        return cached
+
+    started = time.perf_counter()
+    if transport is None:
+        throttle(provider)
+        resp = get_session().post(url, headers=headers, json=payload, timeout=timeout)
+    else:
+        # Caller-supplied transport (e.g. abm config.api_request) brings its own limits
+        resp = transport("POST", url, headers=headers, json=payload, timeout=timeout)
+    resp.raise_for_status()
+    data = resp.json()
+    _record(provider, payload["model"], data, time.perf_counter() - started, cached=False)
+    if ttl > 0:
+        cache_put(key, provider, payload["model"], data)
+    return data
+
+
+def grok_chat(messages, tools=None, model=GROK_MODEL, temperature=0.3, api_key=None,
+              timeout=60, cache_ttl=None, transport=None, refresh=False):
+    """One Grok chat completion. Returns the raw response JSON.
+
+    Raises requests.HTTPError on a non-2xx response, like the old
+    per-script helpers. Pass refresh=True when retrying because the cached
+    answer failed validation; the fresh response replaces it.
+    """
+    api_key = api_key or os.environ.get("XAI_API_KEY", "")
+    payload = {
+        "model": model,
+        "messages": messages,
+        "stream": False,
+        "temperature": temperature,
+    }
+    if tools:
+        payload["tools"] = tools
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}",
+    }
+    return _post("xai", f"{XAI_BASE_URL}/chat/completions", headers, payload, timeout,
+                 transport, cache_ttl, refresh)
+
+
+def _tool_signature(tool_call):
+    fn = tool_call.get("function") or {}
+    args = fn.get("arguments") or ""
+    try:
+        args = json.dumps(json.loads(args), sort_keys=True)
+    except (TypeError, ValueError):
+        pass
+    return fn.get("name"), args
+
+
+def grok_tool_loop(messages, tools, max_rounds=5, nudge=TOOL_NUDGE,
+                   final_nudge=TOOL_NUDGE_FINAL, **kwargs):
+    """Call Grok with tools, follow the tool-call loop until content is returned.
+
+    Grok's x_search/web_search run server-side, but the first responses
+    often carry tool_calls with no content; each gets a synthetic result
+    nudging Grok to summarize. The nudge escalates after round 2, or as
+    soon as a round only repeats searches that already ran. Repeated
+    calls are answered with TOOL_DUPLICATE instead of a fresh nudge.
+
+    `messages` is extended in place. Extra kwargs go to grok_chat().
+    """
+    seen = set()
+    for round_num in range(max_rounds):
+        result = grok_chat(messages, tools, **kwargs)
+        msg = result["choices"][0]["message"]
+
+        content = msg.get("content") or ""
+        if content.strip():
+            return content
+
+        tool_calls = msg.get("tool_calls")
+        if not tool_calls:
+            return content
+
+        messages.append(msg)
+
+        signatures = [_tool_signature(tc) for tc in tool_calls]
+        repeats_only = all(sig in seen for sig in signatures)
+        reply = final_nudge if round_num >= 2 or repeats_only else nudge
+
+        for tc, sig in zip(tool_calls, signatures):
+            messages.append({
+                "role": "tool",
+                "tool_call_id": tc["id"],
+                "content": TOOL_DUPLICATE if sig in seen and not repeats_only else reply,
+            })
+            seen.add(sig)
+
+    return ""
+
+
+def claude_chat(messages, model=CLAUDE_MODEL, max_tokens=4096, temperature=0.3, api_key=None,
+                timeout=90, cache_ttl=None, transport=None, refresh=False):
+    """One Claude message from OpenAI-style messages (no tools). Returns the text.
+
+    refresh=True bypasses a cached answer, as in grok_chat.
+    """
+    api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
+    system = ""
+    anthropic_messages = []
+    for msg in messages:
+        if msg["role"] == "system":
+            system = msg.get("content", "")
+        elif msg["role"] in ("user", "assistant"):
+            anthropic_messages.append({"role": msg["role"], "content": msg["content"]})
+
+    payload = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "messages": anthropic_messages,
+    }
+    if system:
+        payload["system"] = system
+    headers = {
+        "Content-Type": "application/json",
+        "x-api-key": api_key,
+        "anthropic-version": "2023-06-01",
+    }
+    data = _post("anthropic", f"{ANTHROPIC_BASE_URL}/messages", headers, payload, timeout,
+                 transport, cache_ttl, refresh)
+    return data["content"][0]["text"]
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────
+
+def prune_cache(ttl=None):
+    """Delete expired cache entries. Returns (kept, removed)."""
+    ttl = cache_ttl() if ttl is None else ttl
+    kept = removed = 0
+    now = time.time()
+    for path in CACHE_DIR.glob("*/*.json"):
+        try:
+            with open(path) as f:
+                created_at = json.load(f).get("created_at", 0)
+        except (OSError, json.JSONDecodeError):
+            created_at = 0
+        if now - created_at > ttl:
+            path.unlink(missing_ok=True)
+            removed += 1
+        else:
+            kept += 1
+    return kept, removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM response cache maintenance")
+    parser.add_argument("--stats", action="store_true", help="Print cache entry count and size")
+    parser.add_argument("--prune", action="store_true", help="Delete entries older than LLM_CACHE_TTL")
+    args = parser.parse_args()
+
+    if args.prune:
+        kept, removed = prune_cache()
+        print(f"[llm] pruned {removed} expired entries, {kept} kept")
+    elif args.stats:
+        files = list(CACHE_DIR.glob("*/*.json"))
+        size = sum(f.stat().st_size for f in files)
+        print(f"[llm] {len(files)} cached responses, {size / 1024:.0f} KB in {CACHE_DIR}")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
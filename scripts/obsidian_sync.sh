@@ -22,7 +22,7 @@ log() {
 
 rebuild() {
   log "Change detected — rebuilding index.db"
-  if $PYTHON "$REPO_ROOT/scripts/build_index.py" >> "$LOGFILE" 2>&1; then
+  if $PYTHON "$REPO_ROOT/scripts/build_index.py" --incremental >> "$LOGFILE" 2>&1; then
     log "Index rebuilt successfully"
   else
     log "WARN: Index rebuild failed"
@@ -16,19 +16,25 @@ Usage:
     python3 scripts/progression_engine_v3.py              # normal run
     python3 scripts/progression_engine_v3.py --dry-run    # preview without writing
     python3 scripts/progression_engine_v3.py -v           # verbose debug output
+    python3 scripts/progression_engine_v3.py --full       # rescore every day from scratch
+    python3 scripts/progression_engine_v3.py --audit      # verify against a NumPy recompute
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import math
 import sys
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from daily_log_store import load_logs, open_store, skipped_files
+
 # ══════════════════════════════════════════════════════════════════════
 #  Paths — all relative to the repo root
 # ══════════════════════════════════════════════════════════════════════
@@ -40,6 +46,9 @@ PROGRESSION_DIR = DATA_DIR / "progression"
 PROFILE_V2_PATH = PROGRESSION_DIR / "profile-v2.json"
 PROFILE_V3_PATH = PROGRESSION_DIR / "profile-v3.json"
 
+# Bump when any V3 formula changes so persisted scoring logs are recomputed
+ENGINE_STATE_VERSION = 1
+
 # ══════════════════════════════════════════════════════════════════════
 #  Title Table — shared across all engine versions
 # ══════════════════════════════════════════════════════════════════════
@@ -227,65 +236,134 @@ def compute_ship_bonus(ship_rate: float) -> float:
 # ══════════════════════════════════════════════════════════════════════
 
 def load_daily_logs() -> List[Dict[str, Any]]:
-    """Load all daily-log JSON files, sorted by date ascending."""
-    logs: List[Dict[str, Any]] = []
-    if not DAILY_LOG_DIR.exists():
-        return logs
-    for json_path in sorted(DAILY_LOG_DIR.glob("*.json")):
-        try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "date" in data:
-                logs.append(data)
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"  warning: Skipping {json_path.name}: {e}")
-    return logs
-
-
-def compute_streak(logs: List[Dict[str, Any]], current_idx: int) -> int:
-    """Compute consecutive days logged up to and including current_idx."""
-    if current_idx < 0:
-        return 0
-
-    streak = 1
-    for i in range(current_idx, 0, -1):
-        curr_date = logs[i].get("date", "")
-        prev_date = logs[i - 1].get("date", "")
-        if not curr_date or not prev_date:
-            break
-        try:
-            curr_dt = datetime.strptime(curr_date, "%Y-%m-%d")
-            prev_dt = datetime.strptime(prev_date, "%Y-%m-%d")
-            delta = (curr_dt - prev_dt).days
-            if delta == 1:
-                streak += 1
-            else:
-                break
-        except ValueError:
-            break
-    return streak
+    """Load all daily logs, sorted by date ascending (via the shared log cache)."""
+    db = open_store()
+    try:
+        for name, error in skipped_files(db):
+            print(f"  warning: Skipping {name}: {error}")
+        return load_logs(db)
+    finally:
+        db.close()
+
+
+@lru_cache(maxsize=None)
+def _parse_log_date(date_str: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD log date once; None if empty or malformed."""
+    if not date_str:
+        return None
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def advance_streak(prev_date: Optional[str], date: str, prev_streak: int) -> int:
+    """Consecutive days logged through `date`, given the streak through `prev_date`.
+
+    A run continues only when the previous log is exactly one calendar day
+    earlier; a missing or malformed date on either side starts a new run.
+    """
+    if prev_date is None:
+        return 1
+    curr_dt = _parse_log_date(date)
+    prev_dt = _parse_log_date(prev_date)
+    if curr_dt is None or prev_dt is None:
+        return 1
+    return prev_streak + 1 if (curr_dt - prev_dt).days == 1 else 1
+
 
+def _day_inputs(log: Dict[str, Any]) -> Tuple[int, float, int, float]:
+    """Extract (raw_score, agent_cost, commits, ship_rate) with the engine's guards."""
+    stats = log.get("stats", {})
+    raw_score = int(stats.get("output_score", 0))
 
-def compute_v3_scoring(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Compute the V3 scoring log for all days.
+    agent_cost = stats.get("agent_cost", 0)
+    if not isinstance(agent_cost, (int, float)):
+        agent_cost = 0
 
-    Returns a list of per-day scoring records.
+    git = log.get("git_summary", {})
+    commits = git.get("commits_today", 0)
+    if not isinstance(commits, (int, float)):
+        commits = 0
+
+    ship_rate = stats.get("ship_rate", 0)
+    if not isinstance(ship_rate, (int, float)):
+        ship_rate = 0
+
+    return raw_score, agent_cost, int(commits), float(ship_rate)
+
+
+def _scoring_entry(
+    date: str,
+    raw_score: int,
+    base_score: float,
+    ascending_chain: int,
+    ascending_bonus: float,
+    streak_days: int,
+    streak_bonus: float,
+    momentum_mult: float,
+    quality_bonus: float,
+    type_diversity: float,
+    high_value_ratio: float,
+    efficiency_bonus: float,
+    velocity_bonus: float,
+    ship_bonus: float,
+    bonus_sum: float,
+    v3_xp: int,
+) -> Dict[str, Any]:
+    """Assemble one scoring_log record (shared by the scalar and NumPy paths)."""
+    return {
+        "date": date,
+        "raw_score": raw_score,
+        "base_score": round(base_score, 1),
+        # V3 grade is based on v3_xp; v2 grade (raw_score) kept for comparison
+        "v2_grade": grade_for_score_v2(raw_score),
+        "v3_grade": grade_for_xp_v3(v3_xp),
+        "ascending_chain": ascending_chain,
+        "ascending_bonus": round(ascending_bonus, 3),
+        "streak_days": streak_days,
+        "streak_bonus": round(streak_bonus, 3),
+        "momentum_mult": round(momentum_mult, 3),
+        "quality_bonus": round(quality_bonus, 4),
+        "type_diversity": round(type_diversity, 2),
+        "high_value_ratio": round(high_value_ratio, 3),
+        "efficiency_bonus": round(efficiency_bonus, 4),
+        "velocity_bonus": round(velocity_bonus, 4),
+        "ship_bonus": round(ship_bonus, 4),
+        "total_bonus": round(bonus_sum, 4),
+        "total_mult": round(momentum_mult * (1 + bonus_sum), 4),
+        "v3_xp": v3_xp,
+    }
+
+
+def compute_v3_scoring(
+    logs: List[Dict[str, Any]],
+    start: int = 0,
+    seed: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Compute the V3 scoring log for logs[start:].
+
+    `seed` is the scoring_log record for logs[start - 1]; its raw_score,
+    ascending_chain, streak_days and date carry the running state forward,
+    so appending days never revisits earlier ones. Returns the records for
+    logs[start:] only.
     """
     scoring_log: List[Dict[str, Any]] = []
-    prev_score: Optional[int] = None
-    ascending_chain = 0
+    prev_score: Optional[int] = seed["raw_score"] if seed else None
+    ascending_chain = seed["ascending_chain"] if seed else 0
+    streak_days = seed["streak_days"] if seed else 0
+    prev_date: Optional[str] = seed["date"] if seed else None
 
-    for idx, log in enumerate(logs):
-        stats = log.get("stats", {})
-        raw_score = int(stats.get("output_score", 0))
+    for log in logs[start:]:
         date = log.get("date", "")
         accomplishments = log.get("accomplishments", [])
+        raw_score, agent_cost, commits, ship_rate = _day_inputs(log)
 
         # --- A. base_score ---
         base_score = compute_base_score(raw_score)
 
-        # --- Streak ---
-        streak_days = compute_streak(logs, idx)
+        # --- Streak (O(1) per day from the previous day's streak) ---
+        streak_days = advance_streak(prev_date, date, streak_days)
 
         # --- B. momentum_mult ---
         momentum_mult, ascending_chain, ascending_bonus, streak_bonus = compute_momentum(
@@ -297,62 +375,195 @@ def compute_v3_scoring(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             accomplishments, raw_score
         )
 
-        # --- D. efficiency_bonus ---
-        agent_cost = stats.get("agent_cost", 0)
-        if not isinstance(agent_cost, (int, float)):
-            agent_cost = 0
+        # --- D/E/F. efficiency, velocity, ship bonuses ---
         efficiency_bonus = compute_efficiency_bonus(raw_score, agent_cost)
-
-        # --- E. velocity_bonus ---
-        git = log.get("git_summary", {})
-        commits = git.get("commits_today", 0)
-        if not isinstance(commits, (int, float)):
-            commits = 0
-        velocity_bonus = compute_velocity_bonus(int(commits))
-
-        # --- F. ship_bonus ---
-        ship_rate = stats.get("ship_rate", 0)
-        if not isinstance(ship_rate, (int, float)):
-            ship_rate = 0
-        ship_bonus = compute_ship_bonus(float(ship_rate))
+        velocity_bonus = compute_velocity_bonus(commits)
+        ship_bonus = compute_ship_bonus(ship_rate)
 
         # --- V3 XP calculation ---
         bonus_sum = quality_bonus + efficiency_bonus + velocity_bonus + ship_bonus
         v3_xp = int(base_score * momentum_mult * (1 + bonus_sum))
 
-        # V3 grade is based on v3_xp
-        v3_grade = grade_for_xp_v3(v3_xp)
-
-        # Also compute v2 grade for comparison (based on raw_score)
-        v2_grade = grade_for_score_v2(raw_score)
-
-        scoring_log.append({
-            "date": date,
-            "raw_score": raw_score,
-            "base_score": round(base_score, 1),
-            "v2_grade": v2_grade,
-            "v3_grade": v3_grade,
-            "ascending_chain": ascending_chain,
-            "ascending_bonus": round(ascending_bonus, 3),
-            "streak_days": streak_days,
-            "streak_bonus": round(streak_bonus, 3),
-            "momentum_mult": round(momentum_mult, 3),
-            "quality_bonus": round(quality_bonus, 4),
-            "type_diversity": round(type_diversity, 2),
-            "high_value_ratio": round(high_value_ratio, 3),
-            "efficiency_bonus": round(efficiency_bonus, 4),
-            "velocity_bonus": round(velocity_bonus, 4),
-            "ship_bonus": round(ship_bonus, 4),
-            "total_bonus": round(bonus_sum, 4),
-            "total_mult": round(momentum_mult * (1 + bonus_sum), 4),
-            "v3_xp": v3_xp,
-        })
+        scoring_log.append(_scoring_entry(
+            date, raw_score, base_score,
+            ascending_chain, ascending_bonus, streak_days, streak_bonus, momentum_mult,
+            quality_bonus, type_diversity, high_value_ratio,
+            efficiency_bonus, velocity_bonus, ship_bonus, bonus_sum, v3_xp,
+        ))
 
         prev_score = raw_score
+        prev_date = date
 
     return scoring_log
 
 
+# ══════════════════════════════════════════════════════════════════════
+#  Incremental Engine State
+# ══════════════════════════════════════════════════════════════════════
+
+def input_digest(log: Dict[str, Any]) -> str:
+    """Short digest of every log field compute_v3_scoring reads for one day."""
+    stats = log.get("stats", {})
+    git = log.get("git_summary", {})
+    inputs = [
+        ENGINE_STATE_VERSION,
+        log.get("date", ""),
+        stats.get("output_score", 0),
+        stats.get("agent_cost", 0),
+        stats.get("ship_rate", 0),
+        git.get("commits_today", 0),
+        [(a.get("type", ""), a.get("value_score", 0)) for a in log.get("accomplishments", [])],
+    ]
+    return hashlib.sha1(json.dumps(inputs, default=str).encode()).hexdigest()[:16]
+
+
+def load_previous_profile() -> Optional[Dict[str, Any]]:
+    """Read the last written profile-v3.json, or None."""
+    try:
+        with open(PROFILE_V3_PATH, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return profile if isinstance(profile, dict) else None
+
+
+def compute_v3_scoring_incremental(
+    logs: List[Dict[str, Any]],
+    previous: Optional[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[str], int]:
+    """Reuse the previous profile's scoring log up to the first changed day.
+
+    The profile persists one input digest per scored day (v3_meta.engine_state);
+    days whose digest still matches keep their records, and scoring resumes
+    from the last kept record. A new day is a pure append; an edited older
+    log recomputes from that day on.
+
+    Returns (scoring_log, input_digests, first recomputed index).
+    """
+    digests = [input_digest(log) for log in logs]
+
+    meta = (previous or {}).get("v3_meta", {})
+    state = meta.get("engine_state", {})
+    prev_log = meta.get("scoring_log", [])
+    prev_digests = state.get("input_digests", []) if state.get("version") == ENGINE_STATE_VERSION else []
+
+    start = 0
+    limit = min(len(prev_log), len(prev_digests), len(digests))
+    while start < limit and prev_digests[start] == digests[start]:
+        start += 1
+
+    seed = prev_log[start - 1] if start else None
+    scoring_log = prev_log[:start] + compute_v3_scoring(logs, start=start, seed=seed)
+    return scoring_log, digests, start
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  Vectorized Recompute (audits / backfills)
+# ══════════════════════════════════════════════════════════════════════
+
+def compute_v3_scoring_np(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Full recompute of the V3 scoring log with NumPy.
+
+    Per-day arithmetic runs as float64 array ops in the same operation order
+    as the scalar formulas, so results are bit-for-bit identical to
+    compute_v3_scoring(). The ascending chain is a state machine and stays a
+    scalar pass over precomputed up/hold/reset codes. Requires numpy.
+    """
+    import numpy as np
+
+    n = len(logs)
+    if n == 0:
+        return []
+
+    inputs = [_day_inputs(log) for log in logs]
+    dates = [log.get("date", "") for log in logs]
+    raw = np.array([i[0] for i in inputs], dtype=np.int64)
+    cost = np.array([i[1] for i in inputs], dtype=np.float64)
+    commits = np.array([i[2] for i in inputs], dtype=np.int64)
+    ship_rate = np.array([i[3] for i in inputs], dtype=np.float64)
+    raw_f = raw.astype(np.float64)
+
+    # A. base_score
+    base = np.where(
+        raw <= 400,
+        raw_f,
+        raw_f * (1 - 0.15 * np.maximum(0, (raw - 400) / 400)),
+    )
+
+    # Streak: run lengths of consecutive calendar days
+    parsed = [_parse_log_date(d) for d in dates]
+    consecutive = np.array([
+        i > 0 and parsed[i] is not None and parsed[i - 1] is not None
+        and (parsed[i] - parsed[i - 1]).days == 1
+        for i in range(n)
+    ])
+    idx = np.arange(n)
+    run_start = np.maximum.accumulate(np.where(consecutive, 0, idx))
+    streak = idx - run_start + 1
+
+    # B. ascending chain (sequential: decay depends on the previous chain)
+    up = np.zeros(n, dtype=bool)
+    hold = np.zeros(n, dtype=bool)
+    up[1:] = raw[1:] > raw[:-1]
+    hold[1:] = raw_f[1:] > raw_f[:-1] * 0.7
+    chain = np.empty(n, dtype=np.int64)
+    c = 1
+    chain[0] = 1
+    for i in range(1, n):
+        if up[i]:
+            c += 1
+        elif hold[i]:
+            c = max(c - 1, 1)
+        else:
+            c = 1
+        chain[i] = c
+
+    ascending_bonus = np.minimum(chain * 0.08, 0.40)
+    streak_bonus = np.minimum(streak * 0.03, 0.21)
+    momentum = 1.0 + ascending_bonus + streak_bonus
+
+    # C. quality_bonus (ragged per-day reductions, then array math)
+    unique_types = np.array(
+        [len(set(a.get("type", "") for a in log.get("accomplishments", []))) for log in logs],
+        dtype=np.float64,
+    )
+    high_value = np.array([
+        sum(
+            a.get("value_score", 0)
+            for a in log.get("accomplishments", [])
+            if isinstance(a.get("value_score"), (int, float)) and a.get("value_score", 0) >= 15
+        )
+        for log in logs
+    ], dtype=np.float64)
+    type_diversity = np.minimum(unique_types / 8, 1.0)
+    high_value_ratio = np.minimum(high_value / np.maximum(raw, 1), 0.5)
+    quality = (type_diversity * 0.08) + (high_value_ratio * 0.07)
+
+    # D/E/F. efficiency, velocity, ship
+    pts_per_dollar = raw_f / np.maximum(cost, 0.01)
+    efficiency = np.where(
+        cost <= 0.01,
+        0.0,
+        np.minimum(0.15, 0.15 * (1 - np.exp(-pts_per_dollar / 80))),
+    )
+    velocity = np.minimum(0.10, commits * 0.004)
+    ship = np.minimum(0.10, ship_rate * 0.10)
+
+    bonus_sum = quality + efficiency + velocity + ship
+    v3_xp = np.trunc(base * momentum * (1 + bonus_sum)).astype(np.int64)
+
+    return [
+        _scoring_entry(
+            dates[i], int(raw[i]), float(base[i]),
+            int(chain[i]), float(ascending_bonus[i]), int(streak[i]), float(streak_bonus[i]),
+            float(momentum[i]), float(quality[i]), float(type_diversity[i]),
+            float(high_value_ratio[i]), float(efficiency[i]), float(velocity[i]),
+            float(ship[i]), float(bonus_sum[i]), int(v3_xp[i]),
+        )
+        for i in range(n)
+    ]
+
+
 def compute_total_xp_v3(scoring_log: List[Dict[str, Any]]) -> int:
     """Sum v3_xp from the scoring log."""
     return sum(entry["v3_xp"] for entry in scoring_log)
@@ -651,9 +862,14 @@ def detect_milestones_v3(
 def build_profile_v3(
     logs: List[Dict[str, Any]],
     verbose: bool = False,
+    previous: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Build the full RPGProfileV3 dict from daily log data."""
-    scoring_log = compute_v3_scoring(logs)
+    """Build the full RPGProfileV3 dict from daily log data.
+
+    With `previous` (the last written profile) the scoring log is extended
+    incrementally; without it every day is scored from scratch.
+    """
+    scoring_log, digests, recomputed_from = compute_v3_scoring_incremental(logs, previous)
     total_xp_v3 = compute_total_xp_v3(scoring_log)
     total_xp_v1 = compute_total_xp_v1(logs)
 
@@ -692,6 +908,10 @@ def build_profile_v3(
             "class_breakdown": class_breakdown,
             "grade_thresholds": {g: t for t, g in GRADE_THRESHOLDS_V3},
             "scoring_log": scoring_log,
+            "engine_state": {
+                "version": ENGINE_STATE_VERSION,
+                "input_digests": digests,
+            },
         },
     }
 
@@ -708,6 +928,7 @@ def build_profile_v3(
         print(f"  Next Title:     {xp_next:,} XP")
         print(f"  Milestones:     {len(milestones)}")
         print(f"  Days Logged:    {len(logs)}")
+        print(f"  Days Rescored:  {len(logs) - recomputed_from}")
         print(f"  Current Chain:  {current_chain}")
         print(f"  Current Streak: {current_streak}")
         print(f"  Longest Chain:  {longest_chain}")
@@ -766,6 +987,14 @@ def main() -> None:
         "-q", "--quiet", action="store_true",
         help="Suppress all output except errors.",
     )
+    parser.add_argument(
+        "--full", action="store_true",
+        help="Rescore every day instead of extending the previous profile.",
+    )
+    parser.add_argument(
+        "--audit", action="store_true",
+        help="Check the scoring log against a full NumPy recompute (requires numpy).",
+    )
     args = parser.parse_args()
 
     verbose = args.verbose and not args.quiet
@@ -783,7 +1012,25 @@ def main() -> None:
         print(f"\n  +== Progression Engine v3 ========================+")
         print(f"  |  Daily logs found: {len(logs):>25d}    |")
 
-    profile = build_profile_v3(logs, verbose=verbose)
+    previous = None if args.full else load_previous_profile()
+    profile = build_profile_v3(logs, verbose=verbose, previous=previous)
+
+    if args.audit:
+        try:
+            reference = compute_v3_scoring_np(logs)
+        except ImportError:
+            print("ERROR: numpy not installed. Run: pip3 install numpy")
+            sys.exit(1)
+        scoring_log = profile["v3_meta"]["scoring_log"]
+        mismatched = [
+            ref["date"] for ref, got in zip(reference, scoring_log) if ref != got
+        ]
+        if mismatched or len(reference) != len(scoring_log):
+            print(f"  AUDIT FAILED: {len(mismatched)} day(s) differ from the NumPy recompute"
+                  f" (first: {mismatched[0] if mismatched else 'length mismatch'})")
+            sys.exit(1)
+        if not quiet:
+            print(f"  |  NumPy audit:     {f'{len(reference)} days match':>25s}    |")
 
     if not quiet:
         v3m = profile["v3_meta"]
@@ -16,10 +16,16 @@ Usage:
     python3 scripts/query_index.py sessions --latest 5
     python3 scripts/query_index.py content --json
     python3 scripts/query_index.py stats --count
+    python3 scripts/query_index.py search "cursor agent" --platform linkedin
+    python3 scripts/query_index.py search '"plan mode"' --since 2026-02-01
+    python3 scripts/query_index.py --json search "prog*" --limit 5
+    python3 scripts/query_index.py explain
+    python3 scripts/query_index.py explain content --platform x --since 2026-02-01
 """
 
 import argparse
 import json
+import re
 import sqlite3
 import sys
 from pathlib import Path
@@ -105,9 +111,8 @@ def output_json(rows):
 
 # ── Subcommands ───────────────────────────────────────────────────────
 
-def cmd_content(args):
-    """List/filter content."""
-    db = connect()
+def content_query(args):
+    """Build the content query from CLI args."""
     query = "SELECT date, platform, stage, title, slug, pillar, series, word_count FROM content WHERE 1=1"
     params = []
 
@@ -138,7 +143,13 @@ def cmd_content(args):
         params.append(f"%{args.slug}%")
 
     query += " ORDER BY date DESC, platform ASC"
+    return query, params
+
 
+def cmd_content(args):
+    """List/filter content."""
+    query, params = content_query(args)
+    db = connect()
     rows = db.execute(query, params).fetchall()
     db.close()
 
@@ -170,9 +181,133 @@ def cmd_content(args):
     print_table(columns, display)
 
 
-def cmd_skills(args):
-    """List/search skills."""
+# Title matches weigh more than body matches in the BM25 score
+SEARCH_WEIGHTS = (10.0, 1.0)  # (title, body)
+SNIPPET_TOKENS = 16
+
+
+def build_match_query(text, phrase=False, any_term=False):
+    """Turn user search text into a safe FTS5 MATCH expression.
+
+    - "quoted text" becomes a phrase query
+    - a trailing * on a word makes it a prefix query (prog* -> progression)
+    - bare words are ANDed together (ORed with any_term)
+    - phrase=True treats the whole input as one phrase
+
+    Every term is double-quoted so FTS5 operators and punctuation in the
+    input can't produce syntax errors.
+    """
+    if phrase:
+        return '"' + text.replace('"', "").strip() + '"'
+
+    terms = []
+    for quoted, word in re.findall(r'"([^"]*)"|(\S+)', text):
+        if quoted.strip():
+            terms.append('"' + quoted.strip() + '"')
+        elif word:
+            prefix = word.endswith("*")
+            word = word.rstrip("*").replace('"', "")
+            if word:
+                terms.append('"' + word + '"' + ("*" if prefix else ""))
+    return (" OR " if any_term else " ").join(terms)
+
+
+def search_query(args):
+    """Build the ranked FTS5 search query from CLI args.
+
+    With --count, builds a count(*) over the same matches and filters
+    instead, with no ORDER BY / LIMIT, so the total isn't capped at --limit.
+    """
+    match = build_match_query(" ".join(args.query), phrase=args.phrase, any_term=args.any)
+    if not match:
+        print("Error: empty search query", file=sys.stderr)
+        sys.exit(1)
+
+    if args.count:
+        query = """
+            SELECT count(*) AS n
+            FROM content_fts
+            JOIN content c ON c.id = content_fts.rowid
+            WHERE content_fts MATCH ?
+        """
+        params = [match]
+    else:
+        query = """
+            SELECT c.date, c.platform, c.stage, c.slug, c.file_path,
+                   highlight(content_fts, 0, '[', ']') AS title,
+                   snippet(content_fts, 1, '[', ']', '...', ?) AS snippet,
+                   bm25(content_fts, ?, ?) AS rank
+            FROM content_fts
+            JOIN content c ON c.id = content_fts.rowid
+            WHERE content_fts MATCH ?
+        """
+        params = [SNIPPET_TOKENS, *SEARCH_WEIGHTS, match]
+
+    if args.platform:
+        query += " AND c.platform = ?"
+        params.append(args.platform)
+    if args.stage:
+        query += " AND c.stage = ?"
+        params.append(args.stage)
+    if args.date:
+        query += " AND c.date = ?"
+        params.append(args.date)
+    if args.since:
+        query += " AND c.date >= ?"
+        params.append(args.since)
+    if args.until:
+        query += " AND c.date <= ?"
+        params.append(args.until)
+
+    if not args.count:
+        query += " ORDER BY rank LIMIT ?"
+        params.append(args.limit)
+    return query, params
+
+
+def cmd_search(args):
+    """Ranked full-text search over content titles and bodies."""
+    query, params = search_query(args)
     db = connect()
+    try:
+        rows = db.execute(query, params).fetchall()
+    except sqlite3.OperationalError as e:
+        match = build_match_query(" ".join(args.query), phrase=args.phrase, any_term=args.any)
+        print(f"Error: search failed ({e}) for query {match}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        db.close()
+
+    if args.count:
+        print(rows[0]["n"])
+        return
+
+    if args.json:
+        output_json(rows)
+        return
+
+    display = []
+    for row in rows:
+        display.append({
+            "score": f"{-row['rank']:.2f}",
+            "date": row["date"] or "-",
+            "platform": row["platform"],
+            "title": truncate(row["title"], 40),
+            "snippet": truncate(row["snippet"], 70),
+        })
+
+    columns = [
+        ("SCORE", "score", 5),
+        ("DATE", "date", 10),
+        ("PLATFORM", "platform", 8),
+        ("TITLE", "title", 30),
+        ("SNIPPET", "snippet", 40),
+    ]
+    print_table(columns, display)
+
+
+def skills_query(args):
+    """Build the skills query from CLI args."""
     query = "SELECT name, slug, category, description, last_modified FROM skills WHERE 1=1"
     params = []
 
@@ -184,7 +319,13 @@ def cmd_skills(args):
         params.append(f"%{args.search}%")
 
     query += " ORDER BY category ASC, name ASC"
+    return query, params
+
 
+def cmd_skills(args):
+    """List/search skills."""
+    query, params = skills_query(args)
+    db = connect()
     rows = db.execute(query, params).fetchall()
     db.close()
 
@@ -214,9 +355,8 @@ def cmd_skills(args):
     print_table(columns, display)
 
 
-def cmd_stats(args):
-    """Daily log summary."""
-    db = connect()
+def stats_query(args):
+    """Build the stats query from CLI args."""
     query = "SELECT date, letter_grade, output_score, words_today, shipped_count, agent_cost FROM daily_logs WHERE 1=1"
     params = []
 
@@ -232,7 +372,13 @@ def cmd_stats(args):
     if not args.since and not args.until:
         query += " LIMIT ?"
         params.append(args.latest)
+    return query, params
 
+
+def cmd_stats(args):
+    """Daily log summary."""
+    query, params = stats_query(args)
+    db = connect()
     rows = db.execute(query, params).fetchall()
     db.close()
 
@@ -266,10 +412,8 @@ def cmd_stats(args):
     print_table(columns, display)
 
 
-def cmd_links(args):
-    """Cross-platform links."""
-    db = connect()
-
+def links_query(args):
+    """Build the links query from CLI args."""
     if args.slug:
         # Find all content matching the slug, then find their siblings
         query = """
@@ -290,7 +434,8 @@ def cmd_links(args):
             FROM content_links cl
             JOIN content c1 ON cl.source_id = c1.id
             JOIN content c2 ON cl.target_id = c2.id
-            WHERE c1.date = ? OR c2.date = ?
+            WHERE cl.source_id IN (SELECT id FROM content WHERE date = ?)
+               OR cl.target_id IN (SELECT id FROM content WHERE date = ?)
             ORDER BY c1.slug ASC, c1.platform ASC
         """
         params = [args.date, args.date]
@@ -306,6 +451,13 @@ def cmd_links(args):
         """
         params = []
 
+    return query, params
+
+
+def cmd_links(args):
+    """Cross-platform links."""
+    query, params = links_query(args)
+    db = connect()
     rows = db.execute(query, params).fetchall()
     db.close()
 
@@ -337,9 +489,8 @@ def cmd_links(args):
     print_table(columns, display)
 
 
-def cmd_assets(args):
-    """List/filter visual assets."""
-    db = connect()
+def assets_query(args):
+    """Build the assets query from CLI args."""
     query = "SELECT file_path, site, asset_type, name, tier, class_name, variant, size_px, file_size_bytes FROM assets WHERE 1=1"
     params = []
 
@@ -360,7 +511,13 @@ def cmd_assets(args):
         params.append(f"%{args.name}%")
 
     query += " ORDER BY site ASC, asset_type ASC, file_path ASC"
+    return query, params
+
 
+def cmd_assets(args):
+    """List/filter visual assets."""
+    query, params = assets_query(args)
+    db = connect()
     rows = db.execute(query, params).fetchall()
     db.close()
 
@@ -396,9 +553,8 @@ def cmd_assets(args):
     print_table(columns, display)
 
 
-def cmd_videos(args):
-    """List/filter video files."""
-    db = connect()
+def videos_query(args):
+    """Build the videos query from CLI args."""
     query = "SELECT file_path, site, brand, aspect_ratio, format, file_size_bytes, deployed_to FROM videos WHERE 1=1"
     params = []
 
@@ -417,7 +573,13 @@ def cmd_videos(args):
         query += " AND deployed_to IS NOT NULL"
 
     query += " ORDER BY brand ASC, file_path ASC"
+    return query, params
+
 
+def cmd_videos(args):
+    """List/filter video files."""
+    query, params = videos_query(args)
+    db = connect()
     rows = db.execute(query, params).fetchall()
     db.close()
 
@@ -451,9 +613,8 @@ def cmd_videos(args):
     print_table(columns, display)
 
 
-def cmd_thumbnails(args):
-    """List/filter thumbnail files."""
-    db = connect()
+def thumbnails_query(args):
+    """Build the thumbnails query from CLI args."""
     query = "SELECT file_path, brand, variant, file_size_bytes FROM thumbnails WHERE 1=1"
     params = []
 
@@ -465,7 +626,13 @@ def cmd_thumbnails(args):
         params.append(f"%{args.variant}%")
 
     query += " ORDER BY brand ASC, variant ASC"
+    return query, params
 
+
+def cmd_thumbnails(args):
+    """List/filter thumbnail files."""
+    query, params = thumbnails_query(args)
+    db = connect()
     rows = db.execute(query, params).fetchall()
     db.close()
 
@@ -495,9 +662,8 @@ def cmd_thumbnails(args):
     print_table(columns, display)
 
 
-def cmd_sessions(args):
-    """Session history."""
-    db = connect()
+def sessions_query(args):
+    """Build the sessions query from CLI args."""
     query = "SELECT session_date, machine, summary FROM sessions WHERE 1=1"
     params = []
 
@@ -507,7 +673,13 @@ def cmd_sessions(args):
 
     query += " ORDER BY session_date DESC LIMIT ?"
     params.append(args.latest)
+    return query, params
+
 
+def cmd_sessions(args):
+    """Session history."""
+    query, params = sessions_query(args)
+    db = connect()
     rows = db.execute(query, params).fetchall()
     db.close()
 
@@ -535,6 +707,72 @@ def cmd_sessions(args):
     print_table(columns, display)
 
 
+# Representative invocations checked by `explain` when no command is given
+EXPLAIN_CASES = [
+    ["content"],
+    ["content", "--platform", "linkedin", "--since", "2026-02-01"],
+    ["content", "--date", "2026-02-17"],
+    ["search", "cursor agent", "--platform", "x"],
+    ["skills", "--category", "claude"],
+    ["stats"],
+    ["stats", "--since", "2026-02-01"],
+    ["links"],
+    ["links", "--date", "2026-02-17"],
+    ["sessions"],
+    ["assets", "--site", "shawnos", "--type", "tier"],
+    ["videos", "--brand", "shawnos"],
+    ["thumbnails", "--brand", "shawnos"],
+]
+
+
+def plan_lines(db, query, params):
+    """Run EXPLAIN QUERY PLAN and return (indented detail lines, full-scan count).
+
+    A full scan is a bare "SCAN <table>" step — one that neither walks an
+    index nor is the FTS5 virtual table's own MATCH lookup.
+    """
+    rows = db.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+    depth = {0: -1}
+    lines = []
+    scans = 0
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        full_scan = (
+            detail.startswith("SCAN ")
+            and "USING" not in detail
+            and "VIRTUAL TABLE" not in detail
+        )
+        scans += full_scan
+        marker = "!! " if full_scan else "   "
+        lines.append(marker + "  " * depth[node_id] + detail)
+    return lines, scans
+
+
+def cmd_explain(args):
+    """Print EXPLAIN QUERY PLAN for built-in commands, flagging full scans."""
+    parser = build_parser()
+    cases = [args.target] if args.target else EXPLAIN_CASES
+
+    db = connect()
+    total_scans = 0
+    for argv in cases:
+        sub_args = parser.parse_args(argv)
+        if sub_args.command not in QUERY_BUILDERS:
+            print(f"Error: no query to explain for '{sub_args.command}'", file=sys.stderr)
+            sys.exit(1)
+        query, params = QUERY_BUILDERS[sub_args.command](sub_args)
+        lines, scans = plan_lines(db, query, params)
+        total_scans += scans
+
+        print(f"== {' '.join(argv)}")
+        for line in lines:
+            print(line)
+        print()
+    db.close()
+
+    print(f"{len(cases)} queries checked, {total_scans} full table scan(s) (!!)")
+
+
 # ── CLI setup ─────────────────────────────────────────────────────────
 
 def build_parser():
@@ -561,6 +799,18 @@ def build_parser():
     p_content.add_argument("--series", help="Filter by series/arc name (substring)")
     p_content.add_argument("--slug", help="Filter by slug (substring)")
 
+    # search
+    p_search = subparsers.add_parser("search", help="Ranked full-text search (BM25) over content")
+    p_search.add_argument("query", nargs="+", help='Search terms; "quoted phrase", prefix*')
+    p_search.add_argument("--phrase", action="store_true", help="Treat the whole query as one phrase")
+    p_search.add_argument("--any", action="store_true", help="Match any term instead of all terms")
+    p_search.add_argument("--platform", choices=["linkedin", "x", "substack", "reddit", "tiktok", "website", "nio-log"])
+    p_search.add_argument("--stage", choices=["draft", "final"])
+    p_search.add_argument("--date", help="Exact date (YYYY-MM-DD)")
+    p_search.add_argument("--since", help="Start date (YYYY-MM-DD)")
+    p_search.add_argument("--until", help="End date (YYYY-MM-DD)")
+    p_search.add_argument("--limit", type=int, default=20, help="Max results (default: 20)")
+
     # skills
     p_skills = subparsers.add_parser("skills", help="List/search skills")
     p_skills.add_argument("--category", choices=["cursor", "claude"])
@@ -603,9 +853,29 @@ def build_parser():
     p_thumbnails.add_argument("--brand", choices=["shawnos", "gtmos", "contentos"])
     p_thumbnails.add_argument("--variant", help="Filter by variant (substring)")
 
+    # explain
+    p_explain = subparsers.add_parser("explain", help="Show query plans for built-in commands")
+    p_explain.add_argument(
+        "target", nargs=argparse.REMAINDER,
+        help="A command line to explain (e.g. content --platform x); default: all built-ins",
+    )
+
     return parser
 
 
+QUERY_BUILDERS = {
+    "content": content_query,
+    "search": search_query,
+    "skills": skills_query,
+    "stats": stats_query,
+    "links": links_query,
+    "sessions": sessions_query,
+    "assets": assets_query,
+    "videos": videos_query,
+    "thumbnails": thumbnails_query,
+}
+
+
 def main():
     parser = build_parser()
     args = parser.parse_args()
@@ -616,6 +886,7 @@ def main():
 
     commands = {
         "content": cmd_content,
+        "search": cmd_search,
         "skills": cmd_skills,
         "stats": cmd_stats,
         "links": cmd_links,
@@ -623,6 +894,7 @@ def main():
         "assets": cmd_assets,
         "videos": cmd_videos,
         "thumbnails": cmd_thumbnails,
+        "explain": cmd_explain,
     }
 
     commands[args.command](args)
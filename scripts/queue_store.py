@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+queue_store.py — SQLite store for the x/reddit engagement queues.
+
+Replaces data/<platform>/queue.json. The scouts, posters and Slack digests
+used to load the whole JSON list, rebuild an id set from it and rewrite the
+file with indent=2 on every save. Here each opportunity is one row keyed by
+id, so:
+
+  - dedup is a primary-key lookup (`item_id in store`)
+  - a status change (scouted -> drafted -> approved -> posted / rejected /
+    skipped) updates one row and appends to an events table that is never
+    rewritten
+  - prune() drops stale rows by TTL and remembers their ids, so the scouts
+    don't rediscover them
+
+The full item dict is stored as JSON alongside the indexed columns, so
+readers get the same dicts queue.json held. On first open, an existing
+queue.json is imported and renamed to queue.json.imported.
+
+The store runs in WAL mode, so a scout can add items while a poster marks
+others posted. A store object can be shared between threads.
+
+Usage:
+    from queue_store import open_queue
+
+    store = open_queue("x")
+    added = store.add(items)                  # skips known and pruned ids
+    approved = store.items(status="approved")
+    store.update(item_id, status="posted", posted_tweet_id="123")
+
+    python3 scripts/queue_store.py x stats                    # counts by status
+    python3 scripts/queue_store.py x stats --status scouted   # one number
+    python3 scripts/queue_store.py x list --status scouted --limit 10
+    python3 scripts/queue_store.py x show <id>
+    python3 scripts/queue_store.py x set <id> --status approved --field approved_text="..."
+    python3 scripts/queue_store.py x prune --days 30
+    python3 scripts/queue_store.py x export > queue.json
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PLATFORMS = ("x", "reddit")
+
+STATUSES = ("scouted", "drafted", "approved", "posted", "rejected", "skipped")
+
+# prune() leaves in-progress work (drafted/approved) alone
+PRUNABLE = ("scouted", "posted", "rejected", "skipped")
+PRUNE_DAYS = 30
+
+# Item timestamps, most recent stage first; a legacy import dates each row
+# by the first one set so old work still ages out on prune()
+ITEM_STAMPS = ("posted_at", "approved_at", "drafted_at", "scouted_at")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    relevance_score NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_status ON items(status, relevance_score DESC);
+CREATE INDEX IF NOT EXISTS items_updated ON items(updated_at);
+
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    at REAL NOT NULL,
+    changes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_id ON events(id);
+
+CREATE TABLE IF NOT EXISTS pruned (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    pruned_at REAL NOT NULL
+);
+"""
+
+
+def queue_path(platform):
+    return REPO_ROOT / "data" / platform / "queue.db"
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _item_time(item):
+    """Epoch seconds of the item's latest stage stamp, or None if it has none."""
+    for key in ITEM_STAMPS:
+        try:
+            at = datetime.fromisoformat(item.get(key) or "")
+        except (TypeError, ValueError):
+            continue
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        return at.timestamp()
+    return None
+
+
+class QueueStore:
+    """One platform's queue: items by id, a status event log, pruned ids."""
+
+    def __init__(self, path, legacy_json=None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        if legacy_json is not None and Path(legacy_json).exists():
+            self._import_json(Path(legacy_json))
+
+    def _import_json(self, path):
+        """One-time import of a legacy queue.json list, then set it aside."""
+        with open(path) as f:
+            data = json.load(f)
+        added = self.add(data if isinstance(data, list) else [], keep_times=True)
+        try:
+            os.replace(path, path.with_name(path.name + ".imported"))
+        except FileNotFoundError:
+            pass  # another process imported it first
+        print(f"  [queue_store] imported {len(added)} items from {path}", file=sys.stderr)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── Reads ─────────────────────────────────────────────────────────
+
+    def __contains__(self, item_id):
+        """True if the id is queued or was pruned (either way, don't re-add)."""
+        with self._lock:
+            return self.db.execute(
+                "SELECT 1 FROM items WHERE id = ? UNION ALL SELECT 1 FROM pruned WHERE id = ? LIMIT 1",
+                (item_id, item_id),
+            ).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self.db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def get(self, item_id):
+        with self._lock:
+            row = self.db.execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def items(self, status=None, limit=None):
+        """Item dicts, highest relevance first (insertion order on ties).
+
+        With no status, scouted items come first, then everything else,
+        the order queue.json used to be saved in.
+        """
+        if status:
+            sql = "SELECT data FROM items WHERE status = ? ORDER BY relevance_score DESC, rowid"
+            params = [status]
+        else:
+            sql = ("SELECT data FROM items ORDER BY status != 'scouted', "
+                   "relevance_score DESC, rowid")
+            params = []
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self.db.execute(sql, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def counts(self):
+        """{status: number of items}"""
+        with self._lock:
+            return dict(self.db.execute("SELECT status, COUNT(*) FROM items GROUP BY status"))
+
+    def history(self, item_id):
+        """Status events for one item, oldest first."""
+        with self._lock:
+            rows = self.db.execute(
+                "SELECT status, at, changes FROM events WHERE id = ? ORDER BY seq", (item_id,),
+            ).fetchall()
+        return [{"status": s, "at": at, "changes": json.loads(c)} for s, at, c in rows]
+
+    # ── Writes ────────────────────────────────────────────────────────
+
+    def add(self, items, keep_times=False):
+        """Insert new items in one transaction. Known and pruned ids are skipped.
+
+        keep_times dates each row by the item's own posted_at / approved_at /
+        drafted_at / scouted_at (first one set) instead of now, so imported
+        history isn't treated as fresh by prune().
+
+        Returns:
+            list of the items actually added
+        """
+        added = []
+        now = time.time()
+        with self._lock, self.db:
+            for item in items:
+                item_id = str(item["id"])
+                if self.db.execute("SELECT 1 FROM pruned WHERE id = ?", (item_id,)).fetchone():
+                    continue
+                status = item.get("status") or "scouted"
+                at = (_item_time(item) if keep_times else None) or now
+                cur = self.db.execute(
+                    "INSERT OR IGNORE INTO items (id, status, relevance_score, updated_at, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (item_id, status, item.get("relevance_score") or 0, at, json.dumps(item)),
+                )
+                if cur.rowcount:
+                    self.db.execute(
+                        "INSERT INTO events (id, status, at, changes) VALUES (?, ?, ?, '{}')",
+                        (item_id, status, at),
+                    )
+                    added.append(item)
+        return added
+
+    def update(self, item_id, status=None, **fields):
+        """Apply a status transition and/or field changes to one item.
+
+        Moving to a status also stamps `<status>_at` (drafted_at,
+        approved_at, posted_at) when the item has that field and the caller
+        didn't pass it.
+
+        Returns:
+            the updated item dict
+
+        Raises:
+            KeyError for an unknown id, ValueError for an unknown status
+        """
+        if status is not None and status not in STATUSES:
+            raise ValueError(f"unknown status {status!r} (expected one of {', '.join(STATUSES)})")
+        now = time.time()
+        with self._lock, self.db:
+            row = self.db.execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+            if row is None:
+                raise KeyError(item_id)
+            item = json.loads(row[0])
+            changes = dict(fields)
+            if status is not None:
+                changes["status"] = status
+                stamp = f"{status}_at"
+                if stamp in item and stamp not in changes:
+                    changes[stamp] = _now_iso()
+            item.update(changes)
+            self.db.execute(
+                "UPDATE items SET status = ?, relevance_score = ?, updated_at = ?, data = ? WHERE id = ?",
+                (item["status"], item.get("relevance_score") or 0, now, json.dumps(item), item_id),
+            )
+            self.db.execute(
+                "INSERT INTO events (id, status, at, changes) VALUES (?, ?, ?, ?)",
+                (item_id, item["status"], now, json.dumps(changes)),
+            )
+        return item
+
+    def prune(self, days=PRUNE_DAYS, statuses=PRUNABLE):
+        """Drop items in `statuses` not touched for `days`.
+
+        Their ids move to the pruned table so dedup still sees them; the
+        events log is kept.
+
+        Returns:
+            number of items pruned
+        """
+        cutoff = time.time() - days * 86400
+        marks = ",".join("?" * len(statuses))
+        where = f"status IN ({marks}) AND updated_at < ?"
+        with self._lock, self.db:
+            self.db.execute(
+                f"INSERT OR REPLACE INTO pruned (id, status, pruned_at) "
+                f"SELECT id, status, ? FROM items WHERE {where}",
+                (time.time(), *statuses, cutoff),
+            )
+            return self.db.execute(f"DELETE FROM items WHERE {where}", (*statuses, cutoff)).rowcount
+
+
+def open_queue(platform):
+    """Open data/<platform>/queue.db, importing a legacy queue.json on first use."""
+    if platform not in PLATFORMS:
+        raise ValueError(f"unknown platform {platform!r}")
+    path = queue_path(platform)
+    return QueueStore(path, legacy_json=path.with_name("queue.json"))
+
+
+# ── CLI ──────────────────────────────────────────────────────────────────
+
+def _parse_fields(pairs):
+    fields = {}
+    for pair in pairs or []:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise SystemExit(f"ERROR: --field expects KEY=VALUE, got {pair!r}")
+        fields[key] = value
+    return fields
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and update the x/reddit engagement queues")
+    parser.add_argument("platform", choices=PLATFORMS)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("stats", help="Item counts by status")
+    p.add_argument("--status", choices=STATUSES, help="Print just this status' count")
+
+    p = sub.add_parser("list", help="Items as JSON, highest relevance first")
+    p.add_argument("--status", choices=STATUSES)
+    p.add_argument("--limit", type=int, default=0)
+
+    p = sub.add_parser("show", help="One item plus its status history")
+    p.add_argument("id")
+
+    p = sub.add_parser("set", help="Change an item's status and/or fields")
+    p.add_argument("id")
+    p.add_argument("--status", choices=STATUSES)
+    p.add_argument("--field", action="append", metavar="KEY=VALUE", help="Set a string field (repeatable)")
+
+    p = sub.add_parser("prune", help="Drop stale scouted/posted/rejected/skipped items")
+    p.add_argument("--days", type=int, default=PRUNE_DAYS)
+
+    sub.add_parser("export", help="Dump the whole queue as a JSON list")
+
+    args = parser.parse_args()
+
+    with open_queue(args.platform) as store:
+        if args.command == "stats":
+            counts = store.counts()
+            if args.status:
+                print(counts.get(args.status, 0))
+            else:
+                print(" | ".join(f"{s.title()}: {counts.get(s, 0)}" for s in STATUSES))
+        elif args.command == "list":
+            print(json.dumps(store.items(status=args.status, limit=args.limit), indent=2))
+        elif args.command == "show":
+            item = store.get(args.id)
+            if item is None:
+                print(f"ERROR: no item {args.id}")
+                sys.exit(1)
+            print(json.dumps({"item": item, "history": store.history(args.id)}, indent=2))
+        elif args.command == "set":
+            fields = _parse_fields(args.field)
+            if not args.status and not fields:
+                parser.error("set needs --status and/or --field")
+            try:
+                item = store.update(args.id, status=args.status, **fields)
+            except KeyError:
+                print(f"ERROR: no item {args.id}")
+                sys.exit(1)
+            print(f"{item['id']}: {item['status']}")
+        elif args.command == "prune":
+            print(f"Pruned {store.prune(days=args.days)} items")
+        elif args.command == "export":
+            print(json.dumps(store.items(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 """
 Reddit poster — posts approved items from the queue via PRAW.
 
-Reads queue.json, filters for status: "approved", posts comments or
+Reads the queue store, filters for status: "approved", posts comments or
 original posts, updates queue status to "posted", and appends to history.json.
 
 Usage:
@@ -19,9 +19,12 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from queue_store import open_queue
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = REPO_ROOT / "data" / "reddit" / "config.json"
-QUEUE_PATH = REPO_ROOT / "data" / "reddit" / "queue.json"
 HISTORY_PATH = REPO_ROOT / "data" / "reddit" / "history.json"
 LOCK_PATH = REPO_ROOT / "data" / "reddit" / "_post.lock"
 
@@ -153,11 +156,11 @@ def main():
     acquire_lock()
     try:
         config = load_config()
-        queue = load_json(QUEUE_PATH)
+        store = open_queue("reddit")
         history = load_json(HISTORY_PATH)
 
         # Filter approved items
-        approved = [item for item in queue if item.get("status") == "approved"]
+        approved = store.items(status="approved")
         if not approved:
             print("No approved items in queue. Run /reddit-engage to draft and approve comments first.")
             return
@@ -195,10 +198,13 @@ def main():
             result_id = post_item(reddit, item, test_mode=args.test)
             if result_id:
                 now = datetime.now(timezone.utc).isoformat()
-                # Update queue item
+                # Update queue item (written right away: a crash mid-run
+                # can't lose posts that already went out)
                 item["status"] = "posted"
                 item["posted_comment_id"] = result_id
                 item["posted_at"] = now
+                if not args.test:
+                    store.update(item["id"], status="posted", posted_comment_id=result_id, posted_at=now)
 
                 # Add to history
                 history.append(dict(item))
@@ -211,9 +217,8 @@ def main():
 
                 posted_count += 1
 
-        # Save updated queue and history
+        # Save updated history
         if not args.test:
-            save_json(QUEUE_PATH, queue)
             save_json(HISTORY_PATH, history)
 
         print(f"\nDone. {posted_count} items {'would be ' if args.test else ''}posted.")
@@ -14,6 +14,7 @@ Usage:
     python3 scripts/reddit_scout.py --test       # scan 1 sub, print results
     python3 scripts/reddit_scout.py --tier 2     # include Tier 2 subs
     python3 scripts/reddit_scout.py --praw-only  # force PRAW keyword mode
+    python3 scripts/reddit_scout.py --workers 2  # limit concurrent subreddits
 """
 
 import argparse
@@ -27,102 +28,30 @@ from pathlib import Path
 
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from llm_client import (  # pooled, cached, rate-limited
+    TOOL_NUDGE_JSON as TOOL_NUDGE,
+    TOOL_NUDGE_JSON_FINAL as TOOL_NUDGE_FINAL,
+    grok_tool_loop,
+    print_metrics,
+)
+from queue_store import open_queue
+from scout_common import SCOUT_WORKERS, acquire_lock, release_lock, run_missions
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = REPO_ROOT / "data" / "reddit" / "config.json"
-QUEUE_PATH = REPO_ROOT / "data" / "reddit" / "queue.json"
 LOCK_PATH = REPO_ROOT / "data" / "reddit" / "_scout.lock"
 
 # Grok API settings (same pattern as scripts/agents/scout.py)
-XAI_BASE_URL = "https://api.x.ai/v1"
 XAI_MODEL = "grok-4-1-fast-non-reasoning"
 
-# ── Lock file ────────────────────────────────────────────────────────────
-
-def acquire_lock():
-    if LOCK_PATH.exists():
-        pid = LOCK_PATH.read_text().strip()
-        print(f"ERROR: Lock file exists (PID {pid}). Remove {LOCK_PATH} if stale.")
-        sys.exit(1)
-    LOCK_PATH.write_text(str(os.getpid()))
-
-def release_lock():
-    if LOCK_PATH.exists():
-        LOCK_PATH.unlink()
-
-# ── Config / Queue I/O ──────────────────────────────────────────────────
+# ── Config ───────────────────────────────────────────────────────────────
 
 def load_config():
     with open(CONFIG_PATH) as f:
         return json.load(f)
 
-def load_queue():
-    if QUEUE_PATH.exists():
-        with open(QUEUE_PATH) as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
-    return []
-
-def save_queue(queue):
-    with open(QUEUE_PATH, "w") as f:
-        json.dump(queue, f, indent=2)
-
-# ── Grok API (reuses pattern from scripts/agents/scout.py) ──────────────
-
-def grok_chat(api_key, messages, tools=None):
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
-    payload = {
-        "model": XAI_MODEL,
-        "messages": messages,
-        "stream": False,
-        "temperature": 0.3,
-    }
-    if tools:
-        payload["tools"] = tools
-
-    resp = requests.post(
-        f"{XAI_BASE_URL}/chat/completions",
-        headers=headers,
-        json=payload,
-        timeout=60,
-    )
-    resp.raise_for_status()
-    return resp.json()
-
-
-def grok_tool_loop(api_key, messages, tools, max_rounds=5):
-    """Call Grok with tools, follow tool-call loop until content is returned."""
-    for round_num in range(max_rounds):
-        result = grok_chat(api_key, messages, tools)
-        msg = result["choices"][0]["message"]
-
-        content = msg.get("content") or ""
-        if content.strip():
-            return content
-
-        tool_calls = msg.get("tool_calls")
-        if not tool_calls:
-            return content
-
-        messages.append(msg)
-
-        nudge = (
-            "You have enough data. Stop searching and return the JSON now."
-            if round_num >= 2
-            else "Search executed successfully. Summarize the findings as JSON."
-        )
-
-        for tc in tool_calls:
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tc["id"],
-                "content": nudge,
-            })
-
-    return ""
-
 # ── URL validation & search URL fallback ─────────────────────────────────
 
 def validate_reddit_url(url):
@@ -241,7 +170,8 @@ Only include posts from the last 48 hours with real engagement (5+ upvotes or 3+
         }
     ]
 
-    raw = grok_tool_loop(api_key, messages, tools)
+    raw = grok_tool_loop(messages, tools, model=XAI_MODEL, api_key=api_key,
+                         nudge=TOOL_NUDGE, final_nudge=TOOL_NUDGE_FINAL)
 
     # Parse JSON from response
     raw = raw.strip()
@@ -428,6 +358,8 @@ def main():
     parser.add_argument("--test", action="store_true", help="Scan only 1 subreddit, print results")
     parser.add_argument("--tier", type=int, default=1, choices=[1, 2], help="Include up to this tier (default: 1)")
     parser.add_argument("--praw-only", action="store_true", help="Force PRAW keyword mode (skip Grok)")
+    parser.add_argument("--workers", type=int, default=SCOUT_WORKERS,
+                        help=f"Subreddits scanned concurrently in Grok mode (default: {SCOUT_WORKERS})")
     args = parser.parse_args()
 
     # Load .env if present
@@ -442,11 +374,11 @@ def main():
     xai_api_key = os.environ.get("XAI_API_KEY", "")
     use_grok = bool(xai_api_key) and not args.praw_only
 
-    acquire_lock()
+    acquire_lock(LOCK_PATH)
     try:
         config = load_config()
-        queue = load_queue()
-        existing_ids = {item["id"] for item in queue}
+        # Supports `id in store` (indexed lookup), so it doubles as existing_ids
+        store = open_queue("reddit")
 
         # Build subreddit list
         subs = list(config["subreddits"]["tier_1"])
@@ -465,52 +397,48 @@ def main():
 
         mode = "grok" if use_grok else "praw"
         print(f"[{mode} mode] {'TEST — ' if args.test else ''}Scanning {len(subs)} subreddit(s)")
-        total_new = 0
-
-        for sub_name in subs:
-            print(f"  r/{sub_name}...", end=" ", flush=True)
-
-            if use_grok:
-                new_items = grok_scout_subreddit(xai_api_key, sub_name, config, existing_ids)
-                # Enrich with PRAW metadata if available
-                if reddit and new_items:
-                    new_items = enrich_with_praw(reddit, new_items)
-                time.sleep(2)  # rate limit Grok calls
-            else:
-                new_items = praw_scout_subreddit(reddit, sub_name, config, existing_ids)
-
-            if new_items:
-                queue.extend(new_items)
-                for item in new_items:
-                    existing_ids.add(item["id"])
-                total_new += len(new_items)
-                print(f"{len(new_items)} found")
-            else:
-                print("0 found")
-
-        # Sort queue: scouted items by relevance score (highest first)
-        queue.sort(key=lambda x: (
-            0 if x["status"] == "scouted" else 1,
-            -x.get("relevance_score", 0),
-        ))
-
-        save_queue(queue)
-        print(f"\nDone. {total_new} new opportunities added ({len(queue)} total in queue)")
+
+        # Subreddits are independent; run them side by side and merge once.
+        # A PRAW client isn't thread-safe, so PRAW work stays on one thread.
+        if use_grok:
+            results = run_missions(
+                subs,
+                lambda sub_name: grok_scout_subreddit(xai_api_key, sub_name, config, store),
+                workers=args.workers,
+                label=lambda sub_name: f"r/{sub_name}",
+            )
+            new_items = [item for items in results for item in items]
+            # Enrich with PRAW metadata if available
+            if reddit and new_items:
+                new_items = enrich_with_praw(reddit, new_items)
+        else:
+            results = run_missions(
+                subs,
+                lambda sub_name: praw_scout_subreddit(reddit, sub_name, config, store),
+                workers=1,
+                label=lambda sub_name: f"r/{sub_name}",
+            )
+            new_items = [item for items in results for item in items]
+
+        total_new = len(store.add(new_items))
+        pruned = store.prune()
+        print(f"\nDone. {total_new} new opportunities added ({len(store)} total in queue"
+              f"{f', {pruned} stale pruned' if pruned else ''})")
+        print_metrics()
 
         if args.test and total_new > 0:
             print("\n── Scouted Items ──")
-            for item in queue:
-                if item["status"] == "scouted":
-                    score_str = f"[{item['relevance_score']}]"
-                    by_str = f"({item.get('scouted_by', '?')})"
-                    print(f"  {score_str} r/{item['subreddit']}: {item['post_title']} {by_str}")
-                    print(f"       {item['post_url']}")
-                    if item.get("relevance_reason"):
-                        print(f"       {item['relevance_reason']}")
-                    print()
+            for item in store.items(status="scouted"):
+                score_str = f"[{item['relevance_score']}]"
+                by_str = f"({item.get('scouted_by', '?')})"
+                print(f"  {score_str} r/{item['subreddit']}: {item['post_title']} {by_str}")
+                print(f"       {item['post_url']}")
+                if item.get("relevance_reason"):
+                    print(f"       {item['relevance_reason']}")
+                print()
 
     finally:
-        release_lock()
+        release_lock(LOCK_PATH)
 
 if __name__ == "__main__":
     main()
@@ -12,7 +12,6 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import sys
 from datetime import datetime, timezone
@@ -20,8 +19,11 @@ from pathlib import Path
 
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from queue_store import open_queue
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
-QUEUE_PATH = REPO_ROOT / "data" / "reddit" / "queue.json"
 
 # ── Load .env ────────────────────────────────────────────────────────────
 
@@ -34,15 +36,6 @@ def load_env():
                 key, _, value = line.partition("=")
                 os.environ.setdefault(key.strip(), value.strip())
 
-# ── Queue I/O ────────────────────────────────────────────────────────────
-
-def load_queue():
-    if QUEUE_PATH.exists():
-        with open(QUEUE_PATH) as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
-    return []
-
 # ── Slack posting ────────────────────────────────────────────────────────
 
 def post_to_slack(channel_id, text, bot_token):
@@ -69,7 +62,7 @@ def post_to_slack(channel_id, text, bot_token):
 
 # ── Format digest ────────────────────────────────────────────────────────
 
-def format_digest(items):
+def format_digest(items, status_counts):
     """Format top scouted items into a Slack message."""
     today = datetime.now(timezone.utc).strftime("%A, %b %d")
     lines = [f":satellite: *Reddit Scout Digest* -- {today}\n"]
@@ -102,12 +95,6 @@ def format_digest(items):
         lines.append("")
 
     # Queue summary
-    queue = load_queue()
-    status_counts = {}
-    for q in queue:
-        s = q.get("status", "unknown")
-        status_counts[s] = status_counts.get(s, 0) + 1
-
     summary_parts = [f"{v} {k}" for k, v in sorted(status_counts.items())]
     lines.append(f"*Queue:* {' | '.join(summary_parts)}")
     lines.append("\n:point_right: Run `/reddit-engage` in Claude Code to draft comments")
@@ -136,12 +123,11 @@ def main():
         print("Create a #reddit-pipeline channel in Lead Alchemy, then add the channel ID to .env")
         sys.exit(1)
 
-    queue = load_queue()
-
     # Get top N scouted items by relevance score
-    scouted = [item for item in queue if item.get("status") == "scouted"]
-    scouted.sort(key=lambda x: -x.get("relevance_score", 0))
-    top_items = scouted[:args.limit]
+    with open_queue("reddit") as store:
+        top_items = store.items(status="scouted", limit=args.limit)
+        status_counts = store.counts()
+    total_scouted = status_counts.get("scouted", 0)
 
     if not top_items:
         msg = "No scouted Reddit opportunities in the queue. Scout may not have run or found matches."
@@ -151,12 +137,12 @@ def main():
             post_to_slack(channel_id, f":satellite: Reddit Scout -- {msg}", bot_token)
         return
 
-    digest = format_digest(top_items)
+    digest = format_digest(top_items, status_counts)
 
     if args.test:
         print("── Would post to Slack ──\n")
         print(digest)
-        print(f"\n── {len(top_items)} items, {len(scouted)} total scouted ──")
+        print(f"\n── {len(top_items)} items, {total_scouted} total scouted ──")
         return
 
     if post_to_slack(channel_id, digest, bot_token):
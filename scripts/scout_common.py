@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Shared plumbing for the x/reddit/linkedin scouts.
+
+- acquire_lock / release_lock: flock()-based lock files. The kernel drops
+  the lock when the holder dies, so a crashed run never blocks later ones.
+- run_missions: fan independent scout missions (topics, subreddits, search
+  missions) out over a bounded thread pool. The Grok calls inside them all
+  wait on llm_client's per-provider token bucket, which is the one global
+  rate limit for the sweep.
+
+Results go into the per-platform queue_store (x, reddit) in one add().
+
+Usage:
+    from scout_common import acquire_lock, release_lock, run_missions
+
+    acquire_lock(LOCK_PATH)
+    try:
+        results = run_missions(topics, scout_one, workers=4, label=lambda t: t["name"])
+        added = store.add(i for r in results for i in r)
+    finally:
+        release_lock(LOCK_PATH)
+"""
+
+import atexit
+import fcntl
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Concurrent missions per sweep. The xai bucket in llm_client paces the
+# actual requests, so this only bounds how many tool loops are in flight.
+SCOUT_WORKERS = 4
+
+# Open, flock()ed lock file descriptors, by path
+_lock_fds = {}
+_lock_fds_guard = threading.Lock()
+
+
+# ── Lock file ────────────────────────────────────────────────────────────
+
+def _lock_holder(path):
+    """PID recorded in a lock file, or None if it is empty or unreadable."""
+    try:
+        return int(path.read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _exit_on_sigterm(signum, frame):
+    # Turn SIGTERM (cron timeout, launchd stop) into SystemExit so the
+    # caller's finally: release_lock() runs
+    raise SystemExit(128 + signum)
+
+
+def acquire_lock(path):
+    """Take an exclusive flock() on the lock file, or exit if another process holds it.
+
+    The kernel drops the lock when the holder exits, however it dies, so
+    a crashed or killed run never leaves a stale lock behind. The holder's
+    PID is written into the file for the error message. The lock is also
+    released at interpreter exit.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        print(f"ERROR: {path} is locked by a running scout (PID {_lock_holder(path)}).")
+        sys.exit(1)
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    with _lock_fds_guard:
+        _lock_fds[str(path)] = fd
+    atexit.register(release_lock, path)
+    if (threading.current_thread() is threading.main_thread()
+            and signal.getsignal(signal.SIGTERM) == signal.SIG_DFL):
+        signal.signal(signal.SIGTERM, _exit_on_sigterm)
+
+
+def release_lock(path):
+    """Release the lock if this process holds it.
+
+    The file itself stays: unlinking it while another process has it open
+    would let two runs lock different inodes under the same path.
+    """
+    with _lock_fds_guard:
+        fd = _lock_fds.pop(str(path), None)
+    if fd is None:
+        return
+    try:
+        os.ftruncate(fd, 0)
+    finally:
+        os.close(fd)  # drops the flock
+
+# ── Mission fan-out ──────────────────────────────────────────────────────
+
+def run_missions(missions, scout, workers=SCOUT_WORKERS, label=str):
+    """Run scout(mission) for every mission on a bounded thread pool.
+
+    Prints one progress line per mission as it finishes. A mission that
+    raises is reported and counts as no results, so one bad topic doesn't
+    throw away the rest of the sweep.
+
+    Returns:
+        list of scout() results (lists), aligned with `missions`
+    """
+    missions = list(missions)
+    results = [[] for _ in missions]
+    if not missions:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(missions)))) as pool:
+        started = time.monotonic()
+        futures = {pool.submit(scout, mission): i for i, mission in enumerate(missions)}
+        for future in as_completed(futures):
+            i = futures[future]
+            elapsed = time.monotonic() - started
+            try:
+                results[i] = future.result() or []
+            except Exception as e:
+                print(f"  {label(missions[i])}... failed ({type(e).__name__}: {e})", flush=True)
+                continue
+            print(f"  {label(missions[i])}... {len(results[i])} found ({elapsed:.1f}s)", flush=True)
+    return results
@@ -4,16 +4,20 @@ skill_inventory.py — Auto-generate a skill manifest from SKILL.md files.
 
 Scans .cursor/skills/ and .claude/skills/ for SKILL.md files,
 extracts YAML frontmatter (name, description), gets last-modified
-date from git, and outputs a markdown table to docs/_generated/skill-manifest.md.
+date from the shared git metadata cache (git_meta.py), and outputs
+a markdown table to docs/_generated/skill-manifest.md.
 
 Stdlib-only — no PyYAML dependency.
 """
 
 import os
 import re
-import subprocess
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import git_meta  # one git log pass, cached by HEAD
+
 REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 OUTPUT_PATH = os.path.join(REPO_ROOT, "docs", "_generated", "skill-manifest.md")
 SKILL_DIRS = [
@@ -52,18 +56,8 @@ def extract_frontmatter(filepath):
 
 
 def get_git_date(filepath):
-    """Get last modified date from git log."""
-    try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%ai", "--", filepath],
-            capture_output=True, text=True, cwd=REPO_ROOT, timeout=10
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            # Format: "2026-02-18 14:30:00 -0500" → "2026-02-18"
-            return result.stdout.strip().split(" ")[0]
-    except (subprocess.TimeoutExpired, OSError):
-        pass
-    return "unknown"
+    """Get last modified date from the shared git metadata cache."""
+    return git_meta.get_git_date(filepath) or "unknown"
 
 
 def get_relative_location(filepath):
@@ -2,7 +2,7 @@
 """
 X reply poster — posts approved replies from the queue via tweepy.
 
-Reads queue.json, filters for status: "approved", posts replies,
+Reads the queue store, filters for status: "approved", posts replies,
 updates queue status to "posted", and appends to history.json.
 
 Usage:
@@ -19,8 +19,11 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from queue_store import open_queue
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
-QUEUE_PATH = REPO_ROOT / "data" / "x" / "queue.json"
 HISTORY_PATH = REPO_ROOT / "data" / "x" / "history.json"
 LOCK_PATH = REPO_ROOT / "data" / "x" / "_post.lock"
 
@@ -144,11 +147,11 @@ def main():
 
     acquire_lock()
     try:
-        queue = load_json(QUEUE_PATH)
+        store = open_queue("x")
         history = load_json(HISTORY_PATH)
 
         # Filter approved items
-        approved = [item for item in queue if item.get("status") == "approved"]
+        approved = store.items(status="approved")
         if not approved:
             print("No approved items in queue. Run /x-engage to draft and approve replies first.")
             return
@@ -185,14 +188,17 @@ def main():
                 item["status"] = "posted"
                 item["posted_tweet_id"] = result_id
                 item["posted_at"] = now
+                if not args.test:
+                    # One row per post, written right away: a crash mid-run
+                    # can't lose posts that already went out
+                    store.update(item["id"], status="posted", posted_tweet_id=result_id, posted_at=now)
 
                 history.append(dict(item))
                 limits["replies_remaining"] -= 1
                 posted_count += 1
 
-        # Save updated queue and history
+        # Save updated history
         if not args.test:
-            save_json(QUEUE_PATH, queue)
             save_json(HISTORY_PATH, history)
 
         print(f"\nDone. {posted_count} items {'would be ' if args.test else ''}posted.")
@@ -9,6 +9,7 @@ just content ideas.
 Usage:
     python3 scripts/x_scout.py              # scan all topic areas
     python3 scripts/x_scout.py --test       # scan 1 topic, print results
+    python3 scripts/x_scout.py --workers 2  # limit concurrent topics
     python3 scripts/x_scout.py --praw-only  # (not applicable, Grok-only)
 """
 
@@ -17,110 +18,35 @@ import json
 import os
 import re
 import sys
-import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from llm_client import (  # pooled, cached, rate-limited
+    TOOL_NUDGE_JSON as TOOL_NUDGE,
+    TOOL_NUDGE_JSON_FINAL as TOOL_NUDGE_FINAL,
+    grok_tool_loop,
+    print_metrics,
+)
+from queue_store import open_queue
+from scout_common import SCOUT_WORKERS, acquire_lock, release_lock, run_missions
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = REPO_ROOT / "data" / "x" / "config.json"
-QUEUE_PATH = REPO_ROOT / "data" / "x" / "queue.json"
 LOCK_PATH = REPO_ROOT / "data" / "x" / "_scout.lock"
 
 # Grok API settings
-XAI_BASE_URL = "https://api.x.ai/v1"
 XAI_MODEL = "grok-4-1-fast-non-reasoning"
 
-# ── Lock file ────────────────────────────────────────────────────────────
-
-def acquire_lock():
-    if LOCK_PATH.exists():
-        pid = LOCK_PATH.read_text().strip()
-        print(f"ERROR: Lock file exists (PID {pid}). Remove {LOCK_PATH} if stale.")
-        sys.exit(1)
-    LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
-    LOCK_PATH.write_text(str(os.getpid()))
-
-def release_lock():
-    if LOCK_PATH.exists():
-        LOCK_PATH.unlink()
-
-# ── Config / Queue I/O ──────────────────────────────────────────────────
+# ── Config ───────────────────────────────────────────────────────────────
 
 def load_config():
     with open(CONFIG_PATH) as f:
         return json.load(f)
 
-def load_queue():
-    if QUEUE_PATH.exists():
-        with open(QUEUE_PATH) as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
-    return []
-
-def save_queue(queue):
-    QUEUE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(QUEUE_PATH, "w") as f:
-        json.dump(queue, f, indent=2)
-
-# ── Grok API ─────────────────────────────────────────────────────────────
-
-def grok_chat(api_key, messages, tools=None):
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
-    payload = {
-        "model": XAI_MODEL,
-        "messages": messages,
-        "stream": False,
-        "temperature": 0.3,
-    }
-    if tools:
-        payload["tools"] = tools
-
-    resp = requests.post(
-        f"{XAI_BASE_URL}/chat/completions",
-        headers=headers,
-        json=payload,
-        timeout=60,
-    )
-    resp.raise_for_status()
-    return resp.json()
-
-
-def grok_tool_loop(api_key, messages, tools, max_rounds=5):
-    """Call Grok with tools, follow tool-call loop until content is returned."""
-    for round_num in range(max_rounds):
-        result = grok_chat(api_key, messages, tools)
-        msg = result["choices"][0]["message"]
-
-        content = msg.get("content") or ""
-        if content.strip():
-            return content
-
-        tool_calls = msg.get("tool_calls")
-        if not tool_calls:
-            return content
-
-        messages.append(msg)
-
-        nudge = (
-            "You have enough data. Stop searching and return the JSON now."
-            if round_num >= 2
-            else "Search executed successfully. Summarize the findings as JSON."
-        )
-
-        for tc in tool_calls:
-            messages.append({
-                "role": "tool",
-                "tool_call_id": tc["id"],
-                "content": nudge,
-            })
-
-    return ""
-
 # ── URL validation via Grok ──────────────────────────────────────────────
 
 def build_search_url(item):
@@ -211,7 +137,8 @@ Only include tweets from the last 48 hours with real engagement (5+ likes or 3+
         }
     ]
 
-    raw = grok_tool_loop(api_key, messages, tools)
+    raw = grok_tool_loop(messages, tools, model=XAI_MODEL, api_key=api_key,
+                         nudge=TOOL_NUDGE, final_nudge=TOOL_NUDGE_FINAL)
 
     # Parse JSON from response
     raw = raw.strip()
@@ -276,6 +203,8 @@ Only include tweets from the last 48 hours with real engagement (5+ likes or 3+
 def main():
     parser = argparse.ArgumentParser(description="Scout X for engagement opportunities")
     parser.add_argument("--test", action="store_true", help="Scan only 1 topic, print results")
+    parser.add_argument("--workers", type=int, default=SCOUT_WORKERS,
+                        help=f"Topics scanned concurrently (default: {SCOUT_WORKERS})")
     args = parser.parse_args()
 
     # Load .env if present
@@ -292,11 +221,11 @@ def main():
         print("ERROR: XAI_API_KEY not set. Required for X scouting (Grok x_search).")
         sys.exit(1)
 
-    acquire_lock()
+    acquire_lock(LOCK_PATH)
     try:
         config = load_config()
-        queue = load_queue()
-        existing_ids = {item["id"] for item in queue}
+        # Supports `id in store` (indexed lookup), so it doubles as existing_ids
+        store = open_queue("x")
 
         # Build topic list
         topics = config["topics"]
@@ -304,45 +233,32 @@ def main():
             topics = topics[:1]
 
         print(f"[x_scout] {'TEST - ' if args.test else ''}Scanning {len(topics)} topic(s)")
-        total_new = 0
-
-        for topic in topics:
-            print(f"  {topic['name']}...", end=" ", flush=True)
-
-            new_items = grok_scout_topic(xai_api_key, topic, config, existing_ids)
-            time.sleep(2)  # rate limit Grok calls
 
-            if new_items:
-                queue.extend(new_items)
-                for item in new_items:
-                    existing_ids.add(item["id"])
-                total_new += len(new_items)
-                print(f"{len(new_items)} found")
-            else:
-                print("0 found")
-
-        # Sort queue: scouted items by relevance score (highest first)
-        queue.sort(key=lambda x: (
-            0 if x["status"] == "scouted" else 1,
-            -x.get("relevance_score", 0),
-        ))
-
-        save_queue(queue)
-        print(f"\nDone. {total_new} new opportunities added ({len(queue)} total in queue)")
+        # Topics are independent; run them side by side and merge once
+        results = run_missions(
+            topics,
+            lambda topic: grok_scout_topic(xai_api_key, topic, config, store),
+            workers=args.workers,
+            label=lambda topic: topic["name"],
+        )
+        total_new = len(store.add(item for items in results for item in items))
+        pruned = store.prune()
+        print(f"\nDone. {total_new} new opportunities added ({len(store)} total in queue"
+              f"{f', {pruned} stale pruned' if pruned else ''})")
+        print_metrics()
 
         if args.test and total_new > 0:
             print("\n-- Scouted Items --")
-            for item in queue:
-                if item["status"] == "scouted":
-                    score_str = f"[{item['relevance_score']}]"
-                    print(f"  {score_str} {item['author_handle']}: {item['tweet_text'][:100]}")
-                    print(f"       {item['tweet_url']}")
-                    if item.get("relevance_reason"):
-                        print(f"       {item['relevance_reason']}")
-                    print()
+            for item in store.items(status="scouted"):
+                score_str = f"[{item['relevance_score']}]"
+                print(f"  {score_str} {item['author_handle']}: {item['tweet_text'][:100]}")
+                print(f"       {item['tweet_url']}")
+                if item.get("relevance_reason"):
+                    print(f"       {item['relevance_reason']}")
+                print()
 
     finally:
-        release_lock()
+        release_lock(LOCK_PATH)
 
 if __name__ == "__main__":
     main()